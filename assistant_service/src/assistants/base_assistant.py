@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 
 # Import BaseMessage for type hinting
 from langchain_core.messages import BaseMessage
 
+# Receives the response text generated so far while it is being streamed
+PartialResponseCallback = Callable[[str], Awaitable[None]]
+
 
 class BaseAssistant(ABC):
     """Defines the minimal common interface for all assistant implementations."""
@@ -40,6 +44,7 @@ class BaseAssistant(ABC):
         message: BaseMessage,
         user_id: str,
         log_extra: dict[str, any] | None = None,
+        on_partial: PartialResponseCallback | None = None,
     ) -> str | None:
         """Handle a message/event and return the assistant response string.
 
@@ -49,6 +54,8 @@ class BaseAssistant(ABC):
                      The assistant implementation is responsible for managing
                      conversation context/memory based on the user_id.
             log_extra: Optional dictionary with additional context for logging.
+            on_partial: Optional callback for streaming; implementations that
+                        can stream call it with the text generated so far.
 
         Returns:
             A string containing the assistant's response or None if no direct response.
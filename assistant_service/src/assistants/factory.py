@@ -1,10 +1,19 @@
 import asyncio  # Add asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import UTC, datetime, timedelta  # Add timezone and timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 # Project imports
-from shared_models import RedisCache, get_logger
+from shared_models import (
+    ConfigChangeEvent,
+    ConfigEventType,
+    RedisCache,
+    SingleFlight,
+    get_logger,
+    subscribe_config_events,
+)
 
 # Импортируем модели Pydantic для глобальных настроек
 from shared_models.api_schemas.global_settings import (
@@ -16,6 +25,7 @@ from shared_models.enums import AssistantType
 from assistants.base_assistant import BaseAssistant
 from assistants.langgraph.langgraph_assistant import LangGraphAssistant
 from config.settings import Settings
+from metrics import config_cache_stale_serves_total
 
 # Import the recommended serializer
 from services.rest_service import RestServiceClient
@@ -30,8 +40,14 @@ logger = get_logger(__name__)
 
 # Cache TTL constants (in seconds)
 GLOBAL_SETTINGS_CACHE_TTL = 300  # 5 minutes
-SECRETARY_CACHE_TTL = 300  # 5 minutes
-ASSISTANT_CONFIG_CACHE_TTL = 300  # 5 minutes
+# Past their TTL, cached global settings are still served (and refreshed in
+# the background) up to this age; older ones are reloaded before use
+GLOBAL_SETTINGS_MAX_STALENESS = 3600  # 1 hour
+
+# Full refresh interval (seconds) when config change events are not available
+ASSIGNMENT_POLL_INTERVAL = 600  # 10 minutes
+# Delay (seconds) before resubscribing to config events after a failure
+CONFIG_EVENTS_RECONNECT_DELAY = 5
 
 
 class AssistantFactory:
@@ -46,7 +62,8 @@ class AssistantFactory:
         self.settings = settings
         self.rest_client = RestServiceClient()
 
-        # Redis cache (optional, for distributed caching)
+        # Redis client (optional, for distributed caching and config events)
+        self._redis_client = redis_client
         self._redis_cache: RedisCache | None = None
         if redis_client is not None:
             self._redis_cache = RedisCache(redis_client, prefix="assistant_factory")
@@ -62,11 +79,23 @@ class AssistantFactory:
         ] = {}
         # Lock for cache access
         self._cache_lock = asyncio.Lock()
+        # Concurrent first requests for a key share one instance creation
+        self._assistant_creations = SingleFlight()
+        # Bumped by every eviction; a creation that overlapped one may have
+        # read the old config and is not cached
+        self._cache_generation = 0
 
         # --- In-memory fallback for global settings ---
         self._global_settings_cache: GlobalSettingsRead | None = None
         self._global_settings_last_fetched: datetime | None = None
-        self._global_settings_cache_ttl = timedelta(minutes=5)
+        self._global_settings_cache_ttl = timedelta(seconds=GLOBAL_SETTINGS_CACHE_TTL)
+        self._global_settings_max_staleness = timedelta(
+            seconds=GLOBAL_SETTINGS_MAX_STALENESS
+        )
+        # Blocking and background global settings fetches share one request
+        self._global_settings_loads = SingleFlight()
+        # Background refreshes of stale cache entries, by cache key
+        self._refresh_tasks: dict[Hashable, asyncio.Task] = {}
 
         # --- Инициализация логгера ---
         self.logger = get_logger(__name__)
@@ -116,48 +145,59 @@ class AssistantFactory:
         return await self._get_cached_global_settings()
 
     async def _get_cached_global_settings(self) -> GlobalSettingsBase:
-        """Fetches global settings from Redis cache, in-memory cache, or REST.
+        """Fetches global settings from in-memory cache, Redis cache, or REST.
 
         Cache hierarchy:
-        1. Redis cache (distributed, shared across instances)
-        2. In-memory cache (local fallback)
+        1. In-memory cache; past its TTL (but within max staleness) the value
+           is still served while a background refresh fetches a new one
+        2. Redis cache (distributed, shared across instances)
         3. REST API (source of truth)
         """
-        cache_key = "global_settings"
+        cached = self._global_settings_cache
+        fetched_at = self._global_settings_last_fetched
+        if cached is not None and fetched_at is not None:
+            age = datetime.now(UTC) - fetched_at
+            if age < self._global_settings_cache_ttl:
+                self.logger.debug("Returning global settings from in-memory cache")
+                return cached
+            if age < self._global_settings_max_staleness:
+                config_cache_stale_serves_total.labels(cache="global_settings").inc()
+                self._refresh_in_background(
+                    "global_settings", self._load_global_settings
+                )
+                return cached
 
-        # Try Redis cache first
         if self._redis_cache is not None:
-            cached = await self._redis_cache.get(cache_key, GlobalSettingsRead)
+            cached = await self._redis_cache.get("global_settings", GlobalSettingsRead)
             if cached:
                 self.logger.debug("Returning global settings from Redis cache")
+                # Populate the in-memory cache without blocking this caller
+                self._refresh_in_background(
+                    "global_settings", self._load_global_settings
+                )
                 return cached
 
-        # Fall back to in-memory cache
-        now = datetime.now(UTC)
-        cache_valid = (
-            self._global_settings_cache is not None
-            and self._global_settings_last_fetched is not None
-            and (now - self._global_settings_last_fetched)
-            < self._global_settings_cache_ttl
-        )
+        return await self._load_global_settings()
 
-        if cache_valid and self._global_settings_cache is not None:
-            self.logger.debug("Returning global settings from in-memory cache")
-            return self._global_settings_cache
+    async def _load_global_settings(self) -> GlobalSettingsRead:
+        """Fetch global settings from REST and update both caches."""
+        return await self._global_settings_loads.do(
+            "global_settings", self._fetch_global_settings
+        )
 
-        # Fetch from REST
+    async def _fetch_global_settings(self) -> GlobalSettingsRead:
         self.logger.info("Fetching global settings from REST service...")
         try:
             settings = await self.rest_client.get_global_settings()
             if settings:
                 # Update both caches
                 self._global_settings_cache = settings
-                self._global_settings_last_fetched = now
+                self._global_settings_last_fetched = datetime.now(UTC)
 
                 # Store in Redis cache
                 if self._redis_cache is not None:
                     await self._redis_cache.set(
-                        cache_key, settings, ttl=GLOBAL_SETTINGS_CACHE_TTL
+                        "global_settings", settings, ttl=GLOBAL_SETTINGS_CACHE_TTL
                     )
 
                 self.logger.info(
@@ -177,6 +217,29 @@ class AssistantFactory:
             )
             raise
 
+    def _refresh_in_background(
+        self, key: Hashable, refresh: Callable[[], Awaitable[object]]
+    ) -> asyncio.Task:
+        """Run ``refresh`` in a task unless one for ``key`` is already running."""
+        task = self._refresh_tasks.get(key)
+        if task is not None and not task.done():
+            return task
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda done: self._on_refresh_done(key, done))
+        return task
+
+    def _on_refresh_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._refresh_tasks.get(key) is task:
+            del self._refresh_tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Keep serving the cached value; the next stale read retries
+            logger.warning(
+                "Background cache refresh failed",
+                key=str(key),
+                error=str(task.exception()),
+            )
+
     async def get_user_secretary(self, user_id: int) -> BaseAssistant:
         """Get secretary assistant for user using the cached assignments.
 
@@ -284,16 +347,24 @@ class AssistantFactory:
         # Check cache first (under lock)
         async with self._cache_lock:
             cached_data = self._assistant_cache.get(cache_key)
-            if cached_data:
-                instance, loaded_at = cached_data
-                # TODO: Add logic here to check if instance config is outdated
-                #       based on `loaded_at` and `assistant_data.updated_at`
-                #       If outdated, proceed to fetch/create new instance below.
-                self.logger.debug(
-                    f"Returning cached assistant {assistant_uuid} for user {user_id}"
-                )
-                return instance
+        if cached_data:
+            # Never revalidated on the request path: config change events and
+            # the bulk versions sweep reload or evict outdated instances
+            self.logger.debug(
+                f"Returning cached assistant {assistant_uuid} for user {user_id}"
+            )
+            return cached_data[0]
+
+        return await self._assistant_creations.do(
+            cache_key, lambda: self._create_assistant(assistant_uuid, user_id)
+        )
 
+    async def _create_assistant(
+        self, assistant_uuid: UUID, user_id: str
+    ) -> BaseAssistant:
+        """Create, initialize and cache an assistant instance."""
+        cache_key = (assistant_uuid, user_id)
+        generation = self._cache_generation
         self.logger.info(
             "Assistant not in cache; creating instance",
             assistant_id=assistant_uuid,
@@ -380,15 +451,25 @@ class AssistantFactory:
             # --- Update Cache ---
             if assistant_instance:
                 async with self._cache_lock:
-                    self._assistant_cache[cache_key] = (
-                        assistant_instance,
-                        datetime.now(UTC),  # Use timezone.utc
+                    cached = generation == self._cache_generation
+                    if cached:
+                        self._assistant_cache[cache_key] = (
+                            assistant_instance,
+                            datetime.now(UTC),  # Use timezone.utc
+                        )
+                if cached:
+                    self.logger.info(
+                        "Assistant added to cache.",
+                        assistant_id=assistant_uuid,
+                        user_id=user_id,
+                    )
+                else:
+                    # Serves this request; the next one builds a fresh instance
+                    self.logger.info(
+                        "Config changed during creation; instance not cached",
+                        assistant_id=assistant_uuid,
+                        user_id=user_id,
                     )
-                self.logger.info(
-                    "Assistant added to cache.",
-                    assistant_id=assistant_uuid,
-                    user_id=user_id,
-                )
                 return assistant_instance
             else:
                 raise ValueError("Failed to create assistant instance.")
@@ -450,12 +531,9 @@ class AssistantFactory:
         logger.info("AssistantFactory caches cleared.")
 
     async def _preload_secretaries(self):
-        """Preload secretary assignments and potentially instances."""
+        """Preload secretary assignments; instances are built by warm_up()."""
         logger.info("Preloading secretary assignments...")
         assignments_loaded = 0
-        assistants_preloaded = 0
-        assistants_failed = 0
-        assignments_to_preload: list[tuple[int, UUID]] = []
 
         try:
             # Use the correct method to list assignments
@@ -483,7 +561,6 @@ class AssistantFactory:
                                 secretary_id,
                                 updated_at,
                             )
-                            assignments_to_preload.append((user_id, secretary_id))
                             assignments_loaded += 1
                         except (ValueError, TypeError) as e:
                             logger.warning(
@@ -502,98 +579,120 @@ class AssistantFactory:
             )
             return  # Exit if fetching fails
 
-        if not assignments_to_preload:
-            logger.info("No valid assignments identified for preloading instances.")
-            return  # Exit if no valid assignments were processed
+        logger.info("Preloading complete", assignments=assignments_loaded)
+
+    async def warm_up(
+        self, max_users: int, concurrency: int, lookback: float | None = None
+    ) -> int:
+        """Build secretary instances for the most recently active users.
 
-        # Preload assistant instances outside the lock
-        # Use asyncio.gather for concurrent preloading
+        Only users with a message in the last ``lookback`` seconds are
+        considered. At most ``concurrency`` instances are built at a time so
+        warm-up does not starve messages that arrive meanwhile. Failures are
+        logged and skipped; the user's first message then builds the
+        instance as usual.
+
+        Returns:
+            Number of instances warmed
+        """
+        if max_users <= 0:
+            return 0
+        start = time.perf_counter()
+        try:
+            since = (
+                datetime.now(UTC) - timedelta(seconds=lookback) if lookback else None
+            )
+            active_users = await self.rest_client.get_active_users(
+                limit=max_users, since=since
+            )
+        except Exception as e:
+            logger.warning("Failed to fetch active users for warm-up", error=str(e))
+            return 0
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def warm(user_id: int) -> bool:
+            async with semaphore:
+                try:
+                    await self.get_user_secretary(user_id)
+                    return True
+                except Exception as e:
+                    logger.warning(
+                        "Failed to warm secretary", user_id=user_id, error=str(e)
+                    )
+                    return False
+
+        results = await asyncio.gather(*(warm(user.user_id) for user in active_users))
+        warmed = sum(results)
         logger.info(
-            "Attempting to preload assistant instances",
-            preload_count=len(assignments_to_preload),
+            "Assistant warm-up complete",
+            users=len(active_users),
+            warmed=warmed,
+            failed=len(active_users) - warmed,
+            duration_seconds=round(time.perf_counter() - start, 3),
         )
-        preload_tasks = []
-        for user_id, secretary_id in assignments_to_preload:
-            # Pass user_id as string to get_assistant_by_id
-            preload_tasks.append(
-                self.get_assistant_by_id(secretary_id, user_id=str(user_id))
-            )
-
-        # Wait for all preload tasks to complete
-        results = await asyncio.gather(*preload_tasks, return_exceptions=True)
-
-        # Process results
-        for i, result in enumerate(results):
-            user_id, secretary_id = assignments_to_preload[i]
-            if isinstance(result, BaseAssistant):
-                logger.debug(
-                    "Preloaded assistant for user",
-                    assistant_id=secretary_id,
-                    user_id=user_id,
-                )
-                assistants_preloaded += 1
-            else:
-                # Log the error from the result if it's an exception
-                error_details = (
-                    str(result) if isinstance(result, Exception) else "Unknown error"
-                )
-                logger.error(
-                    f"Failed to preload assistant {secretary_id} for user {user_id}",
-                    error=error_details,
-                    # Optionally include traceback if the result is an exception
-                    exc_info=result if isinstance(result, Exception) else None,
-                )
-                assistants_failed += 1
+        return warmed
+
+    async def _reload_if_stale(
+        self,
+        cache_key: tuple[UUID, str],
+        loaded_at: datetime,
+        latest_updated_at: datetime | None,
+    ) -> bool:
+        """Reload a cached instance if its config changed after it was loaded.
+
+        Returns:
+            True if the instance was reloaded
+        """
+        assistant_uuid, user_id = cache_key
+        if not latest_updated_at or not loaded_at:
+            logger.debug(
+                f"Could not compare update times for {cache_key} (missing data)."
+            )
+            return False
+        if not latest_updated_at.tzinfo or not loaded_at.tzinfo:
+            logger.error(
+                "Expected tz-aware datetimes for assistant",
+                assistant_id=assistant_uuid,
+                user_id=user_id,
+            )
+            return False
+
+        if latest_updated_at.astimezone(UTC) <= loaded_at.astimezone(UTC):
+            # Still current; loaded_at keeps meaning "config loaded at", so a
+            # change saved after this check is caught by the next sweep
+            return False
 
         logger.info(
-            "Preloading complete",
-            loaded=assistants_preloaded,
-            failed=assistants_failed,
-            assignments=assignments_loaded,
+            "Assistant config changed, reloading",
+            assistant_id=str(assistant_uuid),
+            user_id=user_id,
+        )
+        # The old instance keeps serving until the new one replaces it
+        await self._assistant_creations.do(
+            cache_key, lambda: self._create_assistant(assistant_uuid, user_id)
         )
+        return True
 
-    # Method adjusted for clarity
     async def _check_and_update_assistant_cache(
         self, cache_key: tuple[UUID, str], instance: BaseAssistant, loaded_at: datetime
     ):
-        """Checks if a cached assistant needs updating and reloads if necessary."""
+        """Checks if a cached assistant needs updating and reloads if necessary.
+
+        Fetches the full assistant config; used as a fallback when the bulk
+        version endpoint is unavailable.
+        """
         assistant_uuid, user_id = cache_key
         try:
             latest_assistant_data = await self.rest_client.get_assistant(
                 str(assistant_uuid)
             )
             if latest_assistant_data:
-                latest_updated_at = getattr(latest_assistant_data, "updated_at", None)
-                if latest_updated_at and loaded_at:
-                    if not latest_updated_at.tzinfo or not loaded_at.tzinfo:
-                        logger.error(
-                            "Expected tz-aware datetimes for assistant",
-                            assistant_id=assistant_uuid,
-                            user_id=user_id,
-                        )
-                        return
-
-                    latest_updated_at_aware = latest_updated_at.astimezone(UTC)
-                    loaded_at_aware = loaded_at.astimezone(UTC)
-
-                    if latest_updated_at_aware > loaded_at_aware:
-                        logger.info(
-                            "Assistant config changed, reloading",
-                            assistant_id=str(assistant_uuid),
-                            user_id=user_id,
-                        )
-                        # Remove old instance from cache before reloading
-                        async with self._cache_lock:
-                            self._assistant_cache.pop(cache_key, None)
-                        # Recursively call get_assistant_by_id to reload and cache
-                        # Beware of recursion if triggered rapidly; consider alternate
-                        # reload path
-                        await self.get_assistant_by_id(assistant_uuid, user_id)
-                else:
-                    logger.debug(
-                        f"Could not compare update times for {cache_key} "
-                        "(missing data)."
-                    )
+                await self._reload_if_stale(
+                    cache_key,
+                    loaded_at,
+                    getattr(latest_assistant_data, "updated_at", None),
+                )
             else:
                 logger.warning(
                     f"Could not fetch latest data for assistant {assistant_uuid} "
@@ -606,6 +705,64 @@ class AssistantFactory:
                 exc_info=True,
             )
 
+    async def _revalidate_assistant_cache(
+        self,
+        cache_items: list[tuple[tuple[UUID, str], tuple[BaseAssistant, datetime]]],
+    ) -> None:
+        """Revalidate cached instances with a single bulk version request.
+
+        Instances whose assistant no longer exists are evicted; instances whose
+        config changed after loading are reloaded. Falls back to per-assistant
+        checks if the bulk request fails.
+        """
+        unique_assistant_uuids = {uuid for (uuid, _), _ in cache_items}
+        try:
+            versions = await self.rest_client.get_assistant_versions(
+                list(unique_assistant_uuids)
+            )
+        except Exception as e:
+            logger.warning(
+                "Bulk assistant version check failed, checking one by one",
+                error=str(e),
+            )
+            for cache_key, (instance, loaded_at) in cache_items:
+                await self._check_and_update_assistant_cache(
+                    cache_key, instance, loaded_at
+                )
+            return
+
+        missing = unique_assistant_uuids - versions.keys()
+        if missing:
+            evicted = await self._evict_assistant_instances(
+                lambda key, _instance: key[0] in missing
+            )
+            logger.info(
+                "Evicted instances of deleted assistants",
+                assistant_ids=[str(uuid) for uuid in missing],
+                evicted=evicted,
+            )
+
+        reloaded = 0
+        for cache_key, (_instance, loaded_at) in cache_items:
+            if cache_key[0] in missing:
+                continue
+            try:
+                if await self._reload_if_stale(
+                    cache_key, loaded_at, versions[cache_key[0]]
+                ):
+                    reloaded += 1
+            except Exception as e:
+                logger.exception(
+                    f"Error reloading assistant {cache_key[0]} "
+                    f"(user {cache_key[1]}): {e}",
+                    exc_info=True,
+                )
+        logger.debug(
+            "Assistant configs revalidated",
+            checked=len(unique_assistant_uuids),
+            reloaded=reloaded,
+        )
+
     async def _periodic_refresh(self):
         """Periodically refresh assignments and check for assistant config updates."""
         logger.info("Starting periodic cache refresh cycle...")
@@ -697,72 +854,177 @@ class AssistantFactory:
             logger.debug("No changes detected in secretary assignments.")
 
         # --- Step 4 & 5: Check for Assistant Config Updates ---
-        cached_assistant_keys: list[tuple[UUID, str]] = []
         async with self._cache_lock:
-            # Get a snapshot of current keys under lock
-            cached_assistant_keys = list(self._assistant_cache.keys())
-
-        unique_assistant_uuids = list({uuid for uuid, _ in cached_assistant_keys})
+            # Snapshot cache items to avoid holding the lock during awaits
+            cache_items_to_check = list(self._assistant_cache.items())
 
-        if not unique_assistant_uuids:
-            logger.debug("No assistant instances in cache to check for config updates.")
+        if not cache_items_to_check:
             logger.info("Periodic refresh cycle complete (no instances to check).")
-            return  # Nothing more to do
+            return
 
-        logger.debug(
-            "Checking config updates for "
-            f"{len(unique_assistant_uuids)} unique cached assistant UUIDs."
-        )
+        await self._revalidate_assistant_cache(cache_items_to_check)
 
-        # Check for assistant config updates
-        unique_assistant_uuids = set()
-        cache_items_to_check = []
-        async with self._cache_lock:
-            # Create a snapshot of cache items to check to avoid holding lock
-            # during awaits
-            cache_items_to_check = list(self._assistant_cache.items())
-            unique_assistant_uuids = {uuid for (uuid, _), _ in cache_items_to_check}
+        logger.info("Periodic refresh cycle complete.")
 
-        if not unique_assistant_uuids:
-            logger.info("Periodic refresh cycle complete (no instances to check).")
-            return
+    # --- Config change events (push) ---
 
-        logger.debug(
-            "Checking config updates for "
-            f"{len(unique_assistant_uuids)} unique cached assistant UUIDs."
+    @property
+    def _config_events_enabled(self) -> bool:
+        return self._redis_client is not None and self.settings.CONFIG_EVENTS_ENABLED
+
+    async def _evict_assistant_instances(self, predicate) -> int:
+        """Drop cached instances matching predicate(cache_key, instance).
+
+        Instances are not closed: they share the factory's REST client and may
+        still be serving an in-flight request. They are rebuilt lazily on the
+        next get_assistant_by_id call. Creations in flight are not cached.
+        """
+        async with self._cache_lock:
+            self._cache_generation += 1
+            keys = [
+                key
+                for key, (instance, _) in self._assistant_cache.items()
+                if predicate(key, instance)
+            ]
+            for key in keys:
+                del self._assistant_cache[key]
+        return len(keys)
+
+    @staticmethod
+    def _instance_uses_tool(instance: BaseAssistant, tool_id: UUID) -> bool:
+        return any(
+            getattr(tool, "id", None) == tool_id
+            for tool in getattr(instance, "tool_definitions", None) or []
         )
-        # Fetch latest config for all unique assistants (can be optimized)
-        # This part was potentially causing the error - moved detailed check to helper
-        # Instead of fetching all here, we check inside the loop using the helper
 
-        # Iterate through the snapshot of cache items
-        for cache_key, (instance, loaded_at) in cache_items_to_check:
-            await self._check_and_update_assistant_cache(cache_key, instance, loaded_at)
+    async def _apply_config_event(self, event: ConfigChangeEvent) -> None:
+        """Apply a pushed config change to the local caches."""
+        event_type = event.event_type
+
+        if event_type == ConfigEventType.ASSIGNMENT_CHANGED:
+            if event.user_id is None or event.assistant_id is None:
+                return
+            async with self._cache_lock:
+                self._secretary_assignments[event.user_id] = (
+                    event.assistant_id,
+                    event.timestamp,
+                )
+            logger.info(
+                "Secretary assignment updated from event",
+                user_id=event.user_id,
+                secretary_id=str(event.assistant_id),
+            )
 
-        logger.info("Periodic refresh cycle complete.")
+        elif event_type == ConfigEventType.ASSIGNMENT_REMOVED:
+            if event.user_id is None:
+                return
+            async with self._cache_lock:
+                current = self._secretary_assignments.get(event.user_id)
+                if current and (
+                    event.assistant_id is None or current[0] == event.assistant_id
+                ):
+                    del self._secretary_assignments[event.user_id]
+            logger.info(
+                "Secretary assignment removed from event", user_id=event.user_id
+            )
+
+        elif event_type in (
+            ConfigEventType.ASSISTANT_CHANGED,
+            ConfigEventType.ASSISTANT_DELETED,
+        ):
+            if event.assistant_id is None:
+                return
+            evicted = await self._evict_assistant_instances(
+                lambda key, _instance: key[0] == event.assistant_id
+            )
+            logger.info(
+                "Assistant config changed; evicted cached instances",
+                assistant_id=str(event.assistant_id),
+                event_type=event_type.value,
+                evicted=evicted,
+            )
+
+        elif event_type == ConfigEventType.TOOL_CHANGED:
+            if event.tool_id is None:
+                return
+            evicted = await self._evict_assistant_instances(
+                lambda _key, instance: self._instance_uses_tool(instance, event.tool_id)
+            )
+            logger.info(
+                "Tool changed; evicted cached instances",
+                tool_id=str(event.tool_id),
+                evicted=evicted,
+            )
+
+    async def _run_config_event_listener(self):
+        """Subscribe to config change events, resubscribing on failure.
+
+        Events published before subscribing (since the startup preload, or
+        while disconnected) are lost, so every subscription is followed by a
+        full refresh to restore consistency.
+        """
+        resubscribing = False
+
+        async def on_subscribed():
+            logger.info(
+                "Subscribed to config events; running full refresh",
+                resubscribed=resubscribing,
+            )
+            await self._periodic_refresh()
+
+        while True:
+            try:
+                await subscribe_config_events(
+                    self._redis_client,
+                    self._apply_config_event,
+                    on_subscribed=on_subscribed,
+                )
+            except asyncio.CancelledError:
+                logger.info("Config event listener cancelled.")
+                break
+            except Exception:
+                logger.exception("Config event listener failed", exc_info=True)
+            resubscribing = True
+            await asyncio.sleep(CONFIG_EVENTS_RECONNECT_DELAY)
 
     # Keep the startup and shutdown logic separate if needed
     async def start_background_tasks(self):
         # Method to start background tasks like periodic refresh
         # This allows calling specific tasks from main.py
         self._refresh_task = asyncio.create_task(self._run_periodic_refresh())
+        self._config_events_task = None
+        if self._config_events_enabled:
+            self._config_events_task = asyncio.create_task(
+                self._run_config_event_listener()
+            )
 
     async def stop_background_tasks(self):
         # Method to stop background tasks
-        if hasattr(self, "_refresh_task") and self._refresh_task:
-            self._refresh_task.cancel()
+        for attr in ("_config_events_task", "_refresh_task"):
+            task = getattr(self, attr, None)
+            if not task:
+                continue
+            task.cancel()
             try:
-                await self._refresh_task
+                await task
             except asyncio.CancelledError:
-                logger.info("Periodic refresh task cancelled successfully.")
-            self._refresh_task = None
+                logger.info("Background task cancelled successfully.", task=attr)
+            setattr(self, attr, None)
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
 
     async def _run_periodic_refresh(self):
-        # Helper coroutine to run the refresh loop
+        # Helper coroutine to run the refresh loop. With config change events
+        # enabled this is only a rare consistency sweep.
+        interval = (
+            self.settings.CONFIG_SWEEP_INTERVAL
+            if self._config_events_enabled
+            else ASSIGNMENT_POLL_INTERVAL
+        )
         while True:
             try:
+                await asyncio.sleep(interval)
                 await self._periodic_refresh()  # Call the actual refresh logic
-                await asyncio.sleep(600)  # Wait 600 seconds (10 minutes)
             except asyncio.CancelledError:
                 logger.info("Periodic refresh loop cancelled.")
                 break  # Exit loop cleanly
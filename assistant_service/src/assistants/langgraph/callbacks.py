@@ -0,0 +1,168 @@
+"""LangChain callback handler that records Prometheus metrics and spans.
+
+Attached to the assistant's ChatOpenAI and propagated to tools through the
+agent run config, so every model and tool call is measured without touching
+individual tools.
+"""
+
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from shared_models import mark_once, record_span
+
+from metrics import (
+    llm_request_duration_seconds,
+    llm_requests_total,
+    llm_tokens_total,
+    record_stage,
+    tool_call_duration_seconds,
+    tool_calls_total,
+)
+
+
+class PrometheusCallbackHandler(AsyncCallbackHandler):
+    """Record LLM latency/tokens and tool latency, labeled by assistant."""
+
+    # Metrics updates are cheap; run inline instead of scheduling a task
+    run_inline = True
+
+    def __init__(self, assistant_name: str, model_name: str):
+        self.assistant_name = assistant_name
+        self.model_name = model_name
+        # run_id -> (start time, model name / tool name)
+        self._llm_runs: dict[UUID, tuple[float, str]] = {}
+        self._tool_runs: dict[UUID, tuple[float, str]] = {}
+
+    # --- LLM ---
+
+    async def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start_llm_run(run_id, metadata)
+
+    async def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start_llm_run(run_id, metadata)
+
+    async def on_llm_end(
+        self, response: LLMResult, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        model = self._finish_llm_run(run_id, "success")
+        if model is None:
+            return
+        prompt_tokens, completion_tokens, cached_tokens = self._token_usage(response)
+        if prompt_tokens:
+            llm_tokens_total.labels(
+                assistant=self.assistant_name, model=model, type="prompt"
+            ).inc(prompt_tokens)
+        if completion_tokens:
+            llm_tokens_total.labels(
+                assistant=self.assistant_name, model=model, type="completion"
+            ).inc(completion_tokens)
+        if cached_tokens:
+            # Prompt tokens served from the provider's prefix cache; a subset
+            # of "prompt", so cached/prompt is the cache hit ratio
+            llm_tokens_total.labels(
+                assistant=self.assistant_name, model=model, type="cached_prompt"
+            ).inc(cached_tokens)
+
+    async def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._finish_llm_run(run_id, "error")
+
+    # --- Tools ---
+
+    async def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        tool_name = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        self._tool_runs[run_id] = (time.perf_counter(), tool_name)
+
+    async def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish_tool_run(run_id, "success")
+
+    async def on_tool_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._finish_tool_run(run_id, "error")
+
+    # --- Helpers ---
+
+    def _start_llm_run(self, run_id: UUID, metadata: dict[str, Any] | None) -> None:
+        model = (metadata or {}).get("ls_model_name") or self.model_name
+        mark_once("agent.time_to_first_llm_call", model=model)
+        self._llm_runs[run_id] = (time.perf_counter(), model)
+
+    def _finish_llm_run(self, run_id: UUID, status: str) -> str | None:
+        started = self._llm_runs.pop(run_id, None)
+        if started is None:
+            return None
+        start_time, model = started
+        duration = time.perf_counter() - start_time
+        llm_requests_total.labels(
+            assistant=self.assistant_name, model=model, status=status
+        ).inc()
+        llm_request_duration_seconds.labels(
+            assistant=self.assistant_name, model=model
+        ).observe(duration)
+        record_stage("llm", duration)
+        record_span("llm.call", duration, status=status, model=model)
+        return model
+
+    def _finish_tool_run(self, run_id: UUID, status: str) -> None:
+        started = self._tool_runs.pop(run_id, None)
+        if started is None:
+            return
+        start_time, tool_name = started
+        duration = time.perf_counter() - start_time
+        tool_calls_total.labels(
+            assistant=self.assistant_name, tool_name=tool_name, status=status
+        ).inc()
+        tool_call_duration_seconds.labels(
+            assistant=self.assistant_name, tool_name=tool_name
+        ).observe(duration)
+        record_stage("tool", duration)
+        record_span("tool.call", duration, status=status, tool_name=tool_name)
+
+    @staticmethod
+    def _token_usage(response: LLMResult) -> tuple[int, int, int]:
+        """Return (prompt, completion, cached prompt) tokens from the provider."""
+        prompt_tokens = completion_tokens = cached_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+                    details = usage.get("input_token_details") or {}
+                    cached_tokens += details.get("cache_read", 0) or 0
+        if not prompt_tokens and not completion_tokens and response.llm_output:
+            usage = response.llm_output.get("token_usage") or {}
+            prompt_tokens = usage.get("prompt_tokens", 0) or 0
+            completion_tokens = usage.get("completion_tokens", 0) or 0
+            details = usage.get("prompt_tokens_details") or {}
+            cached_tokens = details.get("cached_tokens", 0) or 0
+        return prompt_tokens, completion_tokens, cached_tokens
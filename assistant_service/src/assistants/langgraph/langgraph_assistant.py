@@ -4,12 +4,18 @@ from typing import Any
 from uuid import UUID
 
 from langchain.agents import create_agent
-from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    ToolMessage,
+)
 from langchain_core.tools import Tool
 from langchain_openai import ChatOpenAI
 from shared_models.api_schemas.message import MessageUpdate
 
-from assistants.base_assistant import BaseAssistant
+from assistants.base_assistant import BaseAssistant, PartialResponseCallback
+from assistants.langgraph.callbacks import PrometheusCallbackHandler
 from assistants.langgraph.middleware import (
     AssistantAgentState,
     ContextLoaderMiddleware,
@@ -26,6 +32,10 @@ from utils.error_handler import AssistantError, MessageProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Graph node of create_agent that calls the chat model. Other LLM calls (e.g.
+# summarization in middleware) run in other nodes and must not be streamed.
+AGENT_MODEL_NODE = "model"
+
 
 class LangGraphAssistant(BaseAssistant):
     """
@@ -86,8 +96,12 @@ class LangGraphAssistant(BaseAssistant):
         self.memory_retrieve_limit = memory_retrieve_limit
         self.memory_retrieve_threshold = memory_retrieve_threshold
         self.rag_client = RagServiceClient(settings=settings)
-        # Store initial_message_id for error handling
-        self._current_initial_message_id: int | None = None
+        # Input rows saved for the current turn (all parts of a coalesced
+        # turn), so they can be marked 'error' if the agent fails
+        self._current_turn_message_ids: list[int] = []
+        self.metrics_callback = PrometheusCallbackHandler(
+            assistant_name=self.name, model_name=self.config["model_name"]
+        )
 
         try:
             # Initialize LLM
@@ -143,15 +157,16 @@ class LangGraphAssistant(BaseAssistant):
         return ChatOpenAI(
             model=model_name,
             api_key=api_key,
+            callbacks=[self.metrics_callback],
         )
 
     def _create_agent(self) -> Any:
         """Creates the agent with middleware using LangChain 1.x create_agent."""
         try:
             # Create middleware instances
-            # Create callback to store initial_message_id for error handling
+            # Create callback to record saved input rows for error handling
             def store_message_id(message_id: int) -> None:
-                self._current_initial_message_id = message_id
+                self._current_turn_message_ids.append(message_id)
 
             middleware = [
                 MessageSaverMiddleware(
@@ -170,7 +185,8 @@ class LangGraphAssistant(BaseAssistant):
                     system_prompt_template=self.system_prompt_template,
                 ),
                 DynamicPromptMiddleware(
-                    system_prompt_template=self.system_prompt_template
+                    system_prompt_template=self.system_prompt_template,
+                    trailing_context=settings.PROMPT_TRAILING_CONTEXT,
                 ),
                 ResponseSaverMiddleware(rest_client=self.rest_client),
             ]
@@ -190,6 +206,7 @@ class LangGraphAssistant(BaseAssistant):
         message: BaseMessage,
         user_id: str,
         log_extra: dict[str, Any] | None = None,
+        on_partial: PartialResponseCallback | None = None,
     ) -> str | None:
         """Processes a single message using the agent.
 
@@ -197,6 +214,8 @@ class LangGraphAssistant(BaseAssistant):
             message: The incoming message from the user or system.
             user_id: User ID as string.
             log_extra: Additional logging context.
+            on_partial: If set, the agent is streamed and this is awaited with
+                the text of the model's current reply as tokens arrive.
 
         Returns:
             Optional[str]: Response string or None if no response needed.
@@ -235,11 +254,10 @@ class LangGraphAssistant(BaseAssistant):
             }
 
             # Invoke the agent
-            # Reset initial_message_id before invocation
-            self._current_initial_message_id = None
-            initial_message_id = None
+            # Reset the saved input rows before invocation
+            self._current_turn_message_ids = []
             try:
-                result = await self.agent.ainvoke(initial_input)
+                result = await self._run_agent(initial_input, on_partial)
 
                 if not result or "messages" not in result:
                     raise MessageProcessingError(
@@ -247,12 +265,6 @@ class LangGraphAssistant(BaseAssistant):
                         self.name,
                     )
 
-                # Get initial_message_id from result state if available
-                initial_message_id = result.get("initial_message_id")
-                # Also update the instance variable
-                if initial_message_id:
-                    self._current_initial_message_id = initial_message_id
-
                 # Extract the response from the result
                 ai_response = None
                 final_messages = result["messages"]
@@ -279,29 +291,27 @@ class LangGraphAssistant(BaseAssistant):
             except Exception as e:
                 # Try to update message status to error
                 # Handles cases where MessageSaverMiddleware saved the message
-                # but agent execution failed
-                message_id_to_update = (
-                    initial_message_id or self._current_initial_message_id
-                )
-                if message_id_to_update:
-                    try:
-                        update_data = MessageUpdate(status="error")
-                        await self.rest_client.update_message(
-                            message_id_to_update, update_data
-                        )
-                        logger.info(
-                            f"Updated message status to 'error' "
-                            f"(ID: {message_id_to_update}) "
-                            f"after agent execution failure",
-                            extra=combined_log_extra,
-                        )
-                    except Exception as update_error:
-                        logger.error(
-                            f"Failed to update message status to 'error': "
-                            f"{update_error}",
-                            extra=combined_log_extra,
-                            exc_info=True,
-                        )
+                # (or every part of a coalesced turn) but agent execution failed
+                if self._current_turn_message_ids:
+                    update_data = MessageUpdate(status="error")
+                    for message_id in self._current_turn_message_ids:
+                        try:
+                            await self.rest_client.update_message(
+                                message_id, update_data
+                            )
+                            logger.info(
+                                f"Updated message status to 'error' "
+                                f"(ID: {message_id}) "
+                                f"after agent execution failure",
+                                extra=combined_log_extra,
+                            )
+                        except Exception as update_error:
+                            logger.error(
+                                f"Failed to update message status to 'error': "
+                                f"{update_error}",
+                                extra=combined_log_extra,
+                                exc_info=True,
+                            )
                 else:
                     logger.debug(
                         "Could not update message status: "
@@ -329,6 +339,41 @@ class LangGraphAssistant(BaseAssistant):
                 f"Failed to process message: {e}", self.name
             ) from e
 
+    async def _run_agent(
+        self,
+        initial_input: dict[str, Any],
+        on_partial: PartialResponseCallback | None,
+    ) -> dict[str, Any] | None:
+        """Run the agent to completion, streaming model output if requested."""
+        # Callbacks in the run config are inherited by tool runs
+        config = {"callbacks": [self.metrics_callback]}
+        if on_partial is None:
+            return await self.agent.ainvoke(initial_input, config=config)
+
+        result = None
+        current_message_id = None
+        text = ""
+        async for mode, payload in self.agent.astream(
+            initial_input, config=config, stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                result = payload  # The last one is the final state
+                continue
+            chunk, metadata = payload
+            if (
+                not isinstance(chunk, AIMessageChunk)
+                or metadata.get("langgraph_node") != AGENT_MODEL_NODE
+            ):
+                continue
+            # Each model call (e.g. after a tool result) starts a new reply
+            if chunk.id != current_message_id:
+                current_message_id = chunk.id
+                text = ""
+            if isinstance(chunk.content, str) and chunk.content:
+                text += chunk.content
+                await on_partial(text)
+        return result
+
     async def close(self):
         """Cleans up resources."""
         if self.rest_client:
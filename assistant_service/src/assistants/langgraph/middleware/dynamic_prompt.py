@@ -2,6 +2,7 @@
 
 import logging
 from collections.abc import Callable
+from string import Formatter
 
 from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
 from langchain_core.messages import SystemMessage
@@ -10,19 +11,45 @@ from .state import AssistantAgentState
 
 logger = logging.getLogger(__name__)
 
+NO_MEMORIES_TEXT = "Нет сохраненной информации о пользователе."
+NO_SUMMARY_TEXT = "Нет предыдущей истории диалога."
+
+# In the static system prompt, {memories} and {summary_previous} point to the
+# trailing context message instead of holding the per-turn values
+CONTEXT_REFERENCE = "(см. сообщение «Контекст диалога» в конце переписки)"
+CONTEXT_TITLE = "Контекст диалога"
+MEMORIES_TITLE = "Информация о пользователе:"
+SUMMARY_TITLE = "Краткое содержание предыдущего диалога:"
+
 
 class DynamicPromptMiddleware(AgentMiddleware[AssistantAgentState]):
     """Middleware that generates dynamic system prompts based on state.
 
-    Uses wrap_model_call to modify the system message before each model call.
-    Injects memories and summary into the system prompt template.
+    Uses wrap_model_call to modify the messages before each model call.
+
+    By default the system prompt is rendered once and stays byte-identical
+    across calls, so together with the (fixed) tool schemas and the
+    append-only history it forms a prefix the provider can cache. The
+    memories and summary, which change every turn, are sent in a system
+    message after the history. The message exists only in the model request;
+    it is never added to the state or saved.
+
+    With ``trailing_context=False`` the memories and summary are formatted
+    into the system prompt on every call, as before.
     """
 
     state_schema = AssistantAgentState
 
-    def __init__(self, system_prompt_template: str):
+    def __init__(self, system_prompt_template: str, trailing_context: bool = True):
         super().__init__()
         self.system_prompt_template = system_prompt_template
+        self.trailing_context = trailing_context
+        self._placeholders = self._template_fields(system_prompt_template)
+        self._static_system_message = SystemMessage(
+            content=self._format_template(
+                summary_previous=CONTEXT_REFERENCE, memories=CONTEXT_REFERENCE
+            )
+        )
 
     def wrap_model_call(
         self,
@@ -30,39 +57,7 @@ class DynamicPromptMiddleware(AgentMiddleware[AssistantAgentState]):
         handler: Callable[[ModelRequest], ModelResponse],
     ) -> ModelResponse:
         """Modify the system message with dynamic content."""
-        state = request.state
-        log_extra = state.get("log_extra", {})
-
-        # Get memories and summary from state
-        relevant_memories = state.get("relevant_memories", [])
-        current_summary = state.get("current_summary_content")
-
-        # Format memories for prompt
-        memories_str = (
-            "\n".join(f"- {m.get('text', '')}" for m in relevant_memories)
-            if relevant_memories
-            else "Нет сохраненной информации о пользователе."
-        )
-        summary_str = (
-            current_summary if current_summary else "Нет предыдущей истории диалога."
-        )
-
-        try:
-            formatted_prompt = self.system_prompt_template.format(
-                summary_previous=summary_str, memories=memories_str
-            )
-        except KeyError as e:
-            logger.error(
-                f"Missing key in system_prompt_template: {e}. Using template as is.",
-                extra=log_extra,
-            )
-            formatted_prompt = self.system_prompt_template
-
-        # Create new system message with formatted content
-        new_system_message = SystemMessage(content=formatted_prompt)
-
-        # Override the system message in the request
-        return handler(request.override(system_message=new_system_message))
+        return handler(self._build_request(request))
 
     async def awrap_model_call(
         self,
@@ -70,6 +65,9 @@ class DynamicPromptMiddleware(AgentMiddleware[AssistantAgentState]):
         handler: Callable[[ModelRequest], ModelResponse],
     ) -> ModelResponse:
         """Async version of wrap_model_call."""
+        return await handler(self._build_request(request))
+
+    def _build_request(self, request: ModelRequest) -> ModelRequest:
         state = request.state
         log_extra = state.get("log_extra", {})
 
@@ -81,25 +79,48 @@ class DynamicPromptMiddleware(AgentMiddleware[AssistantAgentState]):
         memories_str = (
             "\n".join(f"- {m.get('text', '')}" for m in relevant_memories)
             if relevant_memories
-            else "Нет сохраненной информации о пользователе."
+            else NO_MEMORIES_TEXT
+        )
+        summary_str = current_summary if current_summary else NO_SUMMARY_TEXT
+
+        if not self.trailing_context:
+            new_system_message = SystemMessage(
+                content=self._format_template(
+                    log_extra, summary_previous=summary_str, memories=memories_str
+                )
+            )
+            return request.override(system_message=new_system_message)
+
+        sections = []
+        if "memories" in self._placeholders:
+            sections.append(f"{MEMORIES_TITLE}\n{memories_str}")
+        if "summary_previous" in self._placeholders:
+            sections.append(f"{SUMMARY_TITLE}\n{summary_str}")
+        if not sections:
+            return request.override(system_message=self._static_system_message)
+
+        context_message = SystemMessage(
+            content=f"{CONTEXT_TITLE}\n\n" + "\n\n".join(sections)
         )
-        summary_str = (
-            current_summary if current_summary else "Нет предыдущей истории диалога."
+        return request.override(
+            system_message=self._static_system_message,
+            messages=[*request.messages, context_message],
         )
 
+    def _format_template(self, log_extra: dict | None = None, **values: str) -> str:
         try:
-            formatted_prompt = self.system_prompt_template.format(
-                summary_previous=summary_str, memories=memories_str
-            )
-        except KeyError as e:
+            return self.system_prompt_template.format(**values)
+        except (KeyError, IndexError, ValueError) as e:
             logger.error(
-                f"Missing key in system_prompt_template: {e}. Using template as is.",
-                extra=log_extra,
+                f"Cannot format system_prompt_template: {e!r}. Using template as is.",
+                extra=log_extra or {},
             )
-            formatted_prompt = self.system_prompt_template
+            return self.system_prompt_template
 
-        # Create new system message with formatted content
-        new_system_message = SystemMessage(content=formatted_prompt)
-
-        # Override the system message in the request
-        return await handler(request.override(system_message=new_system_message))
+    @staticmethod
+    def _template_fields(template: str) -> set[str]:
+        """Names of the placeholders used in ``template``."""
+        try:
+            return {name for _, name, _, _ in Formatter().parse(template) if name}
+        except ValueError:
+            return set()
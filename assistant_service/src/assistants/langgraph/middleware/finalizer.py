@@ -44,27 +44,28 @@ class FinalizerMiddleware(AgentMiddleware[AssistantAgentState]):
         error_occurred = state.get("error_occurred", False)
         status = "error" if error_occurred else "processed"
 
-        try:
-            update_data = MessageUpdate(status=status)
-            updated = await self.rest_client.update_message(
-                initial_message_id, update_data
-            )
-            if updated:
-                logger.info(
-                    f"Updated message status to '{status}' (ID: {initial_message_id})",
-                    extra=log_extra,
-                )
-            else:
-                logger.warning(
-                    f"Failed to update message status to '{status}' "
-                    f"(ID: {initial_message_id})",
+        # The earlier parts of a coalesced turn share its status
+        message_ids = [*(state.get("coalesced_message_ids") or []), initial_message_id]
+        update_data = MessageUpdate(status=status)
+        for message_id in message_ids:
+            try:
+                updated = await self.rest_client.update_message(message_id, update_data)
+                if updated:
+                    logger.info(
+                        f"Updated message status to '{status}' (ID: {message_id})",
+                        extra=log_extra,
+                    )
+                else:
+                    logger.warning(
+                        f"Failed to update message status to '{status}' "
+                        f"(ID: {message_id})",
+                        extra=log_extra,
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Error updating message status: {str(e)}",
                     extra=log_extra,
+                    exc_info=True,
                 )
-        except Exception as e:
-            logger.error(
-                f"Error updating message status: {str(e)}",
-                extra=log_extra,
-                exc_info=True,
-            )
 
         return None
@@ -7,7 +7,7 @@ import structlog
 from langchain.agents.middleware import AgentMiddleware
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
 from langgraph.runtime import Runtime
-from shared_models.api_schemas.message import MessageCreate
+from shared_models.api_schemas.message import MessageCreate, MessageUpdate
 
 from services.rest_service import RestServiceClient
 
@@ -20,7 +20,8 @@ class MessageSaverMiddleware(AgentMiddleware[AssistantAgentState]):
     """Middleware that saves incoming messages to the database.
 
     Runs before the first model call (before_model hook).
-    Sets initial_message_id in state for later reference.
+    Sets initial_message_id (and, for a coalesced turn, the ids of the
+    earlier parts in coalesced_message_ids) in state for later reference.
     Uses _message_saved flag in state to run only once per invocation.
     """
 
@@ -87,17 +88,27 @@ class MessageSaverMiddleware(AgentMiddleware[AssistantAgentState]):
         # Map LangChain message type to role
         role = self._get_role_from_message(input_message)
 
+        # A coalesced turn is stored as the original messages, one row each.
+        # All rows stay pending until the turn finishes and then share its
+        # final status; the last row's id is the turn's initial_message_id
+        metadata = getattr(input_message, "metadata", None) or {}
+        contents = metadata.get("coalesced_parts") or [input_message.content]
+
         # Prepare message data
-        message_data = MessageCreate(
-            user_id=user_id,
-            assistant_id=assistant_id,
-            role=role,
-            content=input_message.content,
-            content_type="text",
-            status="pending_processing",
-            tool_call_id=None,
-            meta_data={},
-        )
+        messages_data = [
+            MessageCreate(
+                user_id=user_id,
+                assistant_id=assistant_id,
+                role=role,
+                content=content,
+                content_type="text",
+                status="pending_processing",
+                tool_call_id=None,
+                meta_data={},
+            )
+            for content in contents
+        ]
+        message_data = messages_data[-1]
 
         # Special handling for tool messages
         if hasattr(input_message, "tool_call_id") and input_message.tool_call_id:
@@ -105,14 +116,14 @@ class MessageSaverMiddleware(AgentMiddleware[AssistantAgentState]):
 
         # Save message to database
         try:
-            saved_message = await self.rest_client.create_message(message_data)
-            if saved_message and saved_message.id:
-                logger.info(
-                    f"Saved input message (ID: {saved_message.id}, Role: {role})",
-                    extra=log_extra,
-                )
-                # Call callback if provided to store initial_message_id
-                # for error handling
+            saved_ids: list[int] = []
+            for data in messages_data:
+                saved_message = await self.rest_client.create_message(data)
+                if not saved_message or not saved_message.id:
+                    break
+                saved_ids.append(saved_message.id)
+                # Call callback if provided to record the saved rows for
+                # error handling
                 if self.message_id_callback:
                     try:
                         self.message_id_callback(saved_message.id)
@@ -121,8 +132,14 @@ class MessageSaverMiddleware(AgentMiddleware[AssistantAgentState]):
                             f"Error calling message_id_callback: {callback_error}",
                             extra=log_extra,
                         )
+            if len(saved_ids) == len(messages_data):
+                logger.info(
+                    f"Saved input message (ID: {saved_ids[-1]}, Role: {role})",
+                    extra=log_extra,
+                )
                 return {
-                    "initial_message_id": saved_message.id,
+                    "initial_message_id": saved_ids[-1],
+                    "coalesced_message_ids": saved_ids[:-1],
                     "initial_message": input_message,
                     "_message_saved": True,
                 }
@@ -130,6 +147,11 @@ class MessageSaverMiddleware(AgentMiddleware[AssistantAgentState]):
                 logger.error(
                     "Failed to save message: No ID returned from API", extra=log_extra
                 )
+                # Parts saved before the failure must not stay pending
+                for message_id in saved_ids:
+                    await self.rest_client.update_message(
+                        message_id, MessageUpdate(status="error")
+                    )
         except Exception as e:
             logger.error(
                 f"Error saving input message: {str(e)}", extra=log_extra, exc_info=True
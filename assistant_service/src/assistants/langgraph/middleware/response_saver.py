@@ -37,16 +37,13 @@ class ResponseSaverMiddleware(AgentMiddleware[AssistantAgentState]):
         log_extra = state.get("log_extra", {})
         user_id_str = state.get("user_id")
         assistant_id_str = state.get("assistant_id")
-        initial_message_id = state.get("initial_message_id")
 
         if not user_id_str or not assistant_id_str:
             logger.error(
                 "User ID or Assistant ID not found in state. Cannot save messages.",
                 extra=log_extra,
             )
-            await self._update_initial_message_status(
-                initial_message_id, "error", log_extra
-            )
+            await self._update_initial_message_status(state, "error", log_extra)
             return None
 
         try:
@@ -58,9 +55,7 @@ class ResponseSaverMiddleware(AgentMiddleware[AssistantAgentState]):
                 f"Assistant ID '{assistant_id_str}' format.",
                 extra=log_extra,
             )
-            await self._update_initial_message_status(
-                initial_message_id, "error", log_extra
-            )
+            await self._update_initial_message_status(state, "error", log_extra)
             return None
 
         messages = state.get("messages", [])
@@ -94,11 +89,7 @@ class ResponseSaverMiddleware(AgentMiddleware[AssistantAgentState]):
         await self._save_message(last_message, user_id, assistant_id, log_extra)
 
         # Update initial message status to 'processed' (finalization)
-        initial_message_id = state.get("initial_message_id")
-        if initial_message_id:
-            await self._update_initial_message_status(
-                initial_message_id, "processed", log_extra
-            )
+        await self._update_initial_message_status(state, "processed", log_extra)
 
         return None
 
@@ -143,21 +134,27 @@ class ResponseSaverMiddleware(AgentMiddleware[AssistantAgentState]):
             )
 
     async def _update_initial_message_status(
-        self, message_id: int | None, status: str, log_extra: dict
+        self, state: AssistantAgentState, status: str, log_extra: dict
     ) -> None:
-        """Update the status of the initial message."""
-        if not message_id:
+        """Update the status of the initial message.
+
+        The earlier parts of a coalesced turn share the turn's status.
+        """
+        initial_message_id = state.get("initial_message_id")
+        if not initial_message_id:
             return
 
-        try:
-            update_data = MessageUpdate(status=status)
-            await self.rest_client.update_message(message_id, update_data)
-            logger.info(
-                f"Updated message status to '{status}' (ID: {message_id})",
-                extra=log_extra,
-            )
-        except Exception as e:
-            logger.error(
-                f"Error updating message status: {str(e)}",
-                extra=log_extra,
-            )
+        message_ids = [*(state.get("coalesced_message_ids") or []), initial_message_id]
+        update_data = MessageUpdate(status=status)
+        for message_id in message_ids:
+            try:
+                await self.rest_client.update_message(message_id, update_data)
+                logger.info(
+                    f"Updated message status to '{status}' (ID: {message_id})",
+                    extra=log_extra,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error updating message status: {str(e)}",
+                    extra=log_extra,
+                )
@@ -22,6 +22,8 @@ class AssistantAgentState(AgentState):
     - triggered_event: Event that triggered the run (e.g., reminder)
     - log_extra: Additional context for logging
     - initial_message_id: DB ID of the initial message (set by MessageSaverMiddleware)
+    - coalesced_message_ids: DB IDs of the earlier parts of a coalesced turn;
+      they get the same final status as initial_message_id
     - current_summary_content: Current summary text
     - newly_summarized_message_ids: IDs of messages included in new summary
     - relevant_memories: Retrieved memories from RAG service
@@ -35,6 +37,7 @@ class AssistantAgentState(AgentState):
     triggered_event: NotRequired[QueueTrigger | None]
     log_extra: NotRequired[dict[str, Any] | None]
     initial_message_id: NotRequired[int | None]
+    coalesced_message_ids: NotRequired[list[int] | None]
     current_summary_content: NotRequired[str | None]
     newly_summarized_message_ids: NotRequired[list[int] | None]
     relevant_memories: NotRequired[list[dict[str, Any]] | None]
@@ -34,8 +34,13 @@ def _is_ai_message_calling_tool(ai_message: BaseMessage, tool_call_id: str) -> b
     return False
 
 
-def _log_critical_last_orphan_tool_message(messages: list[BaseMessage]) -> bool:
-    """Checks if the last message is an orphaned ToolMessage."""
+def _log_critical_last_orphan_tool_message(
+    messages: list[BaseMessage], previous: BaseMessage | None = None
+) -> bool:
+    """Checks if the last message is an orphaned ToolMessage.
+
+    ``previous`` is the message preceding ``messages[0]``, if any.
+    """
     if not messages:
         return False
 
@@ -53,10 +58,11 @@ def _log_critical_last_orphan_tool_message(messages: list[BaseMessage]) -> bool:
         return True
 
     is_last_orphan = True
-    if len(messages) > 1:
-        prev_msg = messages[-2]
-        if _is_ai_message_calling_tool(prev_msg, tool_call_id_last):
-            is_last_orphan = False
+    prev_msg = messages[-2] if len(messages) > 1 else previous
+    if prev_msg is not None and _is_ai_message_calling_tool(
+        prev_msg, tool_call_id_last
+    ):
+        is_last_orphan = False
 
     if is_last_orphan:
         logger.error(
@@ -71,16 +77,21 @@ def _log_critical_last_orphan_tool_message(messages: list[BaseMessage]) -> bool:
 
 
 def _validate_and_filter_tool_message_pairs(
-    messages: list[BaseMessage], logged_last_orphan_error: bool
+    messages: list[BaseMessage],
+    logged_last_orphan_error: bool,
+    previous: BaseMessage | None = None,
 ) -> list[BaseMessage]:
-    """Validates AIMessage->ToolMessage pairs and filters orphans."""
+    """Validates AIMessage->ToolMessage pairs and filters orphans.
+
+    ``previous`` is the message preceding ``messages[0]``, if any.
+    """
     final_validated_messages: list[BaseMessage] = []
+    prev_msg = previous
     for i, current_msg in enumerate(messages):
         if isinstance(current_msg, ToolMessage):
             tool_call_id = getattr(current_msg, "tool_call_id", None)
             is_valid_pair = False
-            if i > 0 and tool_call_id:
-                prev_msg = messages[i - 1]
+            if prev_msg is not None and tool_call_id:
                 if _is_ai_message_calling_tool(prev_msg, tool_call_id):
                     is_valid_pair = True
 
@@ -99,12 +110,31 @@ def _validate_and_filter_tool_message_pairs(
         else:
             # Keep non-ToolMessages (Human, AI)
             final_validated_messages.append(current_msg)
+        prev_msg = current_msg
     return final_validated_messages
 
 
+def _validate_messages(
+    messages: Sequence[BaseMessage], previous: BaseMessage | None = None
+) -> list[BaseMessage]:
+    """Runs the filtering and validation steps over ``messages``.
+
+    ``previous`` is the already-validated message preceding them, if any.
+    """
+    potentially_valid_messages = _filter_all_system_messages(messages)
+
+    logged_last_orphan_error = _log_critical_last_orphan_tool_message(
+        potentially_valid_messages, previous
+    )
+
+    return _validate_and_filter_tool_message_pairs(
+        potentially_valid_messages, logged_last_orphan_error, previous
+    )
+
+
 def custom_message_reducer(
     current_state_messages: Sequence[BaseMessage] | None,
-    new_messages: Sequence[BaseMessage] | None,
+    new_messages: Sequence[BaseMessage] | BaseMessage | None,
 ) -> list[BaseMessage]:
     """
     Custom reducer for the 'messages' field in AssistantState.
@@ -114,26 +144,30 @@ def custom_message_reducer(
     2. Filters out ALL system messages.
     3. Checks for a critical orphaned ToolMessage at the end.
     4. Validates AIMessage->ToolMessage pairs, removing orphans.
+
+    The current state is the output of an earlier reduction and is trusted.
+    When the update only appends (the usual model or tool step), steps 2-4
+    run over the appended tail and its join with the last trusted message,
+    so the validation cost does not grow with the history and discards in
+    the prefix are not logged again. Updates that replace or remove existing
+    messages revalidate the whole list.
     """
     left = current_state_messages if current_state_messages is not None else []
     right = new_messages if new_messages is not None else []
-    # return right
+    if not isinstance(right, list | tuple):
+        right = [right]
 
-    combined_messages = original_add_messages(left, right)
+    combined_messages = original_add_messages(list(left), list(right))
 
     if not combined_messages:
         return []
 
-    potentially_valid_messages = _filter_all_system_messages(combined_messages)
-
-    logged_last_orphan_error = _log_critical_last_orphan_tool_message(
-        potentially_valid_messages
-    )
-
-    final_validated_messages = _validate_and_filter_tool_message_pairs(
-        potentially_valid_messages, logged_last_orphan_error
-    )
-
-    final_messages = final_validated_messages
+    # add_messages keeps the existing order and appends unknown ids; every
+    # replacement, removal or duplicate id makes the result shorter than this
+    appended_only = len(combined_messages) == len(left) + len(right)
+    if not appended_only:
+        return _validate_messages(combined_messages)
 
-    return final_messages
+    prefix = combined_messages[: len(left)]
+    previous = prefix[-1] if prefix else None
+    return prefix + _validate_messages(combined_messages[len(left) :], previous)
@@ -11,8 +11,19 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     LOG_LEVEL: str = "DEBUG"
     LOG_JSON_FORMAT: bool = True
+    TRACING_ENABLED: bool = True  # Emit per-stage spans as JSON log records
     HTTP_CLIENT_TIMEOUT: float = 60.0
 
+    # Sampled debug tracing of the message loop (off by default). The rate can
+    # be changed at runtime via the "assistant:debug_trace" Redis key.
+    DEBUG_TRACE_SAMPLE_RATE: float = 0.0
+    DEBUG_TRACE_FILE: str | None = None  # stderr if unset
+    DEBUG_TRACE_POLL_INTERVAL: int = 10  # seconds
+
+    # Streaming: publish partial responses while the LLM is generating
+    STREAMING_ENABLED: bool = False
+    STREAM_PARTIAL_INTERVAL: float = 1.0  # min seconds between partial events
+
     # Metrics
     METRICS_PORT: int = 8080
 
@@ -51,6 +62,40 @@ class Settings(BaseSettings):
     STREAM_CONSUMER: str = os.getenv(
         "REDIS_STREAM_CONSUMER", os.getenv("HOSTNAME", "assistant_consumer")
     )
+    # Weighted fair share between user messages (INPUT_QUEUE) and scheduled
+    # triggers (its ":triggers" lane) while both have a backlog
+    INTERACTIVE_LANE_WEIGHT: int = 4
+    TRIGGER_LANE_WEIGHT: int = 1
+    # Merge messages a user sends in quick succession into one agent turn:
+    # wait until the user is quiet for this long (0 disables coalescing)
+    COALESCE_WINDOW_MS: int = 0
+    COALESCE_MAX_MESSAGES: int = 5
+    # Stream retention: approximate MAXLEN caps on XADD (0 disables) and a
+    # periodic MINID trim of entries acknowledged by every consumer group
+    STREAM_MAXLEN: int = 100_000
+    DLQ_MAXLEN: int = 10_000
+    STREAM_TRIM_INTERVAL: int = 300  # seconds; 0 disables trimming
+    QUEUE_STATS_INTERVAL: int = 15  # seconds between consumer-group lag checks
+
+    # Assistant config propagation: apply rest_service change events as they
+    # arrive; the periodic full sync becomes a rare consistency sweep.
+    CONFIG_EVENTS_ENABLED: bool = True
+    CONFIG_SWEEP_INTERVAL: int = 3600  # seconds
+
+    # Build secretary instances for the most recently active users on boot so
+    # their first message after a deploy skips instance construction. /ready
+    # reports ready once this finishes (or times out); 0 users disables it.
+    WARMUP_USERS: int = 50
+    WARMUP_CONCURRENCY: int = 4
+    WARMUP_TIMEOUT: int = 120  # seconds
+    # Only users with a message this recent are considered, which keeps the
+    # active-users query to a bounded slice of the messages table.
+    WARMUP_LOOKBACK: int = 7 * 24 * 3600  # seconds
+
+    # Keep the system prompt byte-stable for provider prefix caching and send
+    # memories and the summary in a trailing message; False formats them into
+    # the system prompt on every call
+    PROMPT_TRAILING_CONTEXT: bool = True
 
     # Google Calendar settings
     GOOGLE_CALENDAR_CREDENTIALS: str | None = None
@@ -1,13 +1,34 @@
+from utils.startup_profile import StartupProfiler
+
+# Installed before any other import so their cost is attributed per module
+startup_profiler = StartupProfiler()
+startup_profiler.start_import_tracking()
+
 import asyncio
 import signal
 
 from dotenv import load_dotenv
-from shared_models import LogEventType, configure_logging, get_logger
+from shared_models import (
+    LogEventType,
+    StreamGroupMonitor,
+    configure_logging,
+    configure_tracing,
+    get_logger,
+    register_queue_monitor,
+)
 
 from config.settings import get_settings
-from metrics import start_metrics_server, update_dlq_metrics
+from metrics import (
+    maintain_streams,
+    record_startup_profile,
+    set_ready,
+    start_metrics_server,
+    update_dlq_metrics,
+)
 from orchestrator import AssistantOrchestrator
 
+startup_profiler.mark("imports")
+
 load_dotenv()
 
 # Configure logging early
@@ -17,7 +38,34 @@ configure_logging(
     log_level=settings.LOG_LEVEL,
     json_format=settings.LOG_JSON_FORMAT,
 )
+configure_tracing(enabled=settings.TRACING_ENABLED)
 logger = get_logger(__name__)
+startup_profiler.mark("configure")
+
+
+async def warm_up_and_mark_ready(service: AssistantOrchestrator) -> None:
+    """Warm the assistant cache, then report readiness on /ready."""
+    try:
+        await asyncio.wait_for(
+            service.factory.warm_up(
+                settings.WARMUP_USERS,
+                concurrency=settings.WARMUP_CONCURRENCY,
+                lookback=settings.WARMUP_LOOKBACK,
+            ),
+            timeout=settings.WARMUP_TIMEOUT,
+        )
+    except TimeoutError:
+        logger.warning("Assistant warm-up timed out", timeout=settings.WARMUP_TIMEOUT)
+    startup_profiler.mark("warm_up")
+    # Tools first configured after this point are imported unprofiled
+    startup_profiler.stop_import_tracking()
+    record_startup_profile(startup_profiler)
+    logger.info(
+        "Startup complete",
+        event_type=LogEventType.STARTUP,
+        **startup_profiler.summary(),
+    )
+    set_ready()
 
 
 async def main():
@@ -27,6 +75,7 @@ async def main():
     logger.info("Metrics server started", port=settings.METRICS_PORT)
 
     service = AssistantOrchestrator(settings)
+    startup_profiler.mark("init")
     listen_task = None
     shutdown_event = asyncio.Event()
 
@@ -45,22 +94,59 @@ async def main():
         logger.info("Starting assistant service", event_type=LogEventType.STARTUP)
         # Preload assignments before starting main loops
         await service.factory._preload_secretaries()
+        startup_profiler.mark("preload")
 
         # Start background tasks using the new method
         await service.factory.start_background_tasks()
+        startup_profiler.mark("background_tasks")
 
         # Start main message listening task
         listen_task = asyncio.create_task(service.listen_for_messages())
 
+        # Build instances for recently active users alongside the listener;
+        # not awaited below since finishing it is no reason to shut down
+        warmup_task = asyncio.create_task(warm_up_and_mark_ready(service))
+
         # Start DLQ metrics update task
         dlq_metrics_task = asyncio.create_task(
             update_dlq_metrics(service.input_stream, interval=60)
         )
 
+        # Trim acknowledged entries and export stream memory usage
+        stream_maintenance_task = asyncio.create_task(
+            maintain_streams(
+                [service.input_stream, service.trigger_stream, service.output_stream],
+                interval=60,
+                trim_interval=settings.STREAM_TRIM_INTERVAL,
+            )
+        )
+
+        # Lag/pending gauges of the groups this service consumes (telegram_bot
+        # reports the output stream), also served as JSON on /queues
+        queue_monitor = StreamGroupMonitor(
+            service.redis,
+            [service.input_stream.stream, service.trigger_stream.stream],
+            groups=[settings.INPUT_STREAM_GROUP],
+        )
+        register_queue_monitor(queue_monitor)
+        queue_stats_task = asyncio.create_task(
+            queue_monitor.run(interval=settings.QUEUE_STATS_INTERVAL)
+        )
+
+        # Apply runtime changes of the debug trace sample rate
+        debug_trace_task = asyncio.create_task(
+            service.debug_tracer.watch(
+                service.redis, interval=settings.DEBUG_TRACE_POLL_INTERVAL
+            )
+        )
+
         # Wait for any task to complete or shutdown signal
         tasks_to_wait = {
             listen_task,
             dlq_metrics_task,
+            stream_maintenance_task,
+            queue_stats_task,
+            debug_trace_task,
             asyncio.create_task(shutdown_event.wait()),
         }
         done, pending = await asyncio.wait(
@@ -69,8 +155,9 @@ async def main():
         )
 
         logger.info("Initiating task cancellation...")
+        set_ready(False)
         # Cancel pending tasks
-        for task in pending:
+        for task in (*pending, warmup_task):
             task.cancel()
             try:
                 await task  # Wait for cancellation
@@ -100,6 +187,7 @@ async def main():
         # Stop background tasks using the new method
         await service.factory.stop_background_tasks()
         await service.factory.close()
+        service.debug_tracer.stop()
         # Close the redis client which is part of the orchestrator
         await service.redis.aclose()
         # Stop metrics server
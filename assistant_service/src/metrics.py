@@ -2,11 +2,16 @@
 
 import asyncio
 import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from services.redis_stream import RedisStreamClient
+    from utils.startup_profile import StartupProfiler
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -16,31 +21,38 @@ from prometheus_client import (
     generate_latest,
 )
 
-# LLM metrics
+# LLM metrics (recorded by assistants.langgraph.callbacks)
 llm_requests_total = Counter(
     "llm_requests_total",
     "Total LLM API requests",
-    ["model", "status"],
+    ["assistant", "model", "status"],
 )
 
 llm_request_duration_seconds = Histogram(
     "llm_request_duration_seconds",
     "LLM request duration",
-    ["model"],
+    ["assistant", "model"],
     buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0],
 )
 
 llm_tokens_total = Counter(
     "llm_tokens_total",
     "Total tokens used",
-    ["model", "type"],
+    ["assistant", "model", "type"],
 )
 
 # Tool metrics
 tool_calls_total = Counter(
     "tool_calls_total",
     "Total tool calls",
-    ["tool_name", "status"],
+    ["assistant", "tool_name", "status"],
+)
+
+tool_call_duration_seconds = Histogram(
+    "tool_call_duration_seconds",
+    "Tool call duration",
+    ["assistant", "tool_name"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
 )
 
 # Message processing metrics
@@ -57,6 +69,15 @@ message_processing_duration_seconds = Histogram(
     buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0],
 )
 
+# Per-stage breakdown of a single message. Stages may overlap (e.g. "rest"
+# calls made from inside a "tool"), so they do not sum to the total.
+message_stage_duration_seconds = Histogram(
+    "message_stage_duration_seconds",
+    "Time spent in each processing stage of a message",
+    ["source", "stage"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0],
+)
+
 # DLQ metrics
 messages_dlq_total = Counter(
     "messages_dlq_total",
@@ -83,6 +104,88 @@ message_retry_count_histogram = Histogram(
     buckets=[0, 1, 2, 3, 4, 5],
 )
 
+# Config cache metrics (stale-while-revalidate in assistants.factory)
+config_cache_stale_serves_total = Counter(
+    "config_cache_stale_serves_total",
+    "Cached configs served past their TTL while a refresh runs in the background",
+    ["cache"],
+)
+
+# Startup metrics (recorded from utils.startup_profile once the service is ready)
+startup_stage_seconds = Gauge(
+    "startup_stage_seconds",
+    "Duration of each service startup stage",
+    ["stage"],
+)
+
+startup_import_seconds = Gauge(
+    "startup_import_seconds",
+    "Import time during startup by top-level package",
+    ["package"],
+)
+
+
+# Stage timings of the message currently being processed. Holds a mutable
+# dict so that child tasks (which copy the context) add to the same totals.
+_stage_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "stage_timings", default=None
+)
+
+
+@contextmanager
+def collect_stage_timings() -> Iterator[dict[str, float]]:
+    """Collect stage durations recorded while processing one message."""
+    timings: dict[str, float] = {}
+    token = _stage_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _stage_timings.reset(token)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Add time spent in a stage; no-op outside collect_stage_timings()."""
+    timings = _stage_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+    """Time the wrapped block as part of the given stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start)
+
+
+def observe_message_processed(
+    source: str,
+    status: str,
+    duration: float,
+    stage_timings: dict[str, float] | None = None,
+) -> None:
+    """Record the outcome, total duration and stage breakdown of a message."""
+    messages_processed_total.labels(source=source, status=status).inc()
+    message_processing_duration_seconds.labels(source=source).observe(duration)
+    for stage, seconds in (stage_timings or {}).items():
+        message_stage_duration_seconds.labels(source=source, stage=stage).observe(
+            seconds
+        )
+
+
+def record_startup_profile(profiler: "StartupProfiler", packages: int = 20) -> None:
+    """Export stage durations and the slowest packages' import time."""
+    for stage, seconds in profiler.stage_times.items():
+        startup_stage_seconds.labels(stage=stage).set(seconds)
+    # Only the slowest packages, to keep label cardinality bounded
+    by_package = sorted(
+        profiler.imports_by_package().items(), key=lambda i: i[1], reverse=True
+    )
+    for package, seconds in by_package[:packages]:
+        startup_import_seconds.labels(package=package).set(seconds)
+
 
 def get_metrics() -> bytes:
     """Return metrics in Prometheus format."""
@@ -94,8 +197,25 @@ def get_content_type() -> str:
     return CONTENT_TYPE_LATEST
 
 
+# Readiness (/ready) is separate from liveness (/health): the process is live
+# as soon as it serves HTTP, ready once startup warm-up has finished
+_ready = threading.Event()
+
+
+def set_ready(ready: bool = True) -> None:
+    """Mark the service ready (or not) to take its share of traffic."""
+    if ready:
+        _ready.set()
+    else:
+        _ready.clear()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
 class MetricsHandler(BaseHTTPRequestHandler):
-    """HTTP handler for /metrics and /health endpoints."""
+    """HTTP handler for /metrics, /health, /ready and /queues endpoints."""
 
     def do_GET(self):
         if self.path == "/metrics":
@@ -108,6 +228,16 @@ class MetricsHandler(BaseHTTPRequestHandler):
             self.send_header("Content-Type", "text/plain")
             self.end_headers()
             self.wfile.write(b"OK")
+        elif self.path == "/ready":
+            ready = is_ready()
+            self.send_response(200 if ready else 503)
+            self.send_header("Content-Type", "text/plain")
+            self.end_headers()
+            self.wfile.write(b"READY" if ready else b"WARMING UP")
+        elif self.path == "/queues":
+            from shared_models import write_queue_stats
+
+            write_queue_stats(self)
         else:
             self.send_response(404)
             self.end_headers()
@@ -145,3 +275,49 @@ async def update_dlq_metrics(
         except Exception as e:
             logger.warning("Failed to update DLQ metrics", error=str(e))
         await asyncio.sleep(interval)
+
+
+async def maintain_streams(
+    streams: list["RedisStreamClient"],
+    interval: int = 60,
+    trim_interval: int = 0,
+) -> None:
+    """Trim acknowledged stream entries and export stream size gauges.
+
+    Args:
+        streams: Stream clients whose consumer groups gate trimming; their
+            DLQ streams are only measured (they are capped by MAXLEN).
+        interval: Gauge update interval in seconds.
+        trim_interval: Seconds between MINID trims; 0 disables trimming.
+    """
+    from shared_models import get_logger, record_stream_usage, trim_acknowledged
+
+    logger = get_logger(__name__)
+    last_trim = 0.0
+
+    while True:
+        if trim_interval and time.monotonic() - last_trim >= trim_interval:
+            last_trim = time.monotonic()
+            for stream in streams:
+                try:
+                    trimmed = await trim_acknowledged(stream.client, stream.stream)
+                    if trimmed:
+                        logger.info(
+                            "Trimmed acknowledged stream entries",
+                            stream=stream.stream,
+                            trimmed=trimmed,
+                        )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to trim stream", stream=stream.stream, error=str(e)
+                    )
+
+        for stream in streams:
+            for name in (stream.stream, stream.dlq_stream):
+                try:
+                    await record_stream_usage(stream.client, name)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to update stream metrics", stream=name, error=str(e)
+                    )
+        await asyncio.sleep(interval)
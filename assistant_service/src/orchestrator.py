@@ -1,7 +1,9 @@
 import asyncio
 import json
-import os
 import time
+import uuid
+from collections import deque
+from contextlib import ExitStack
 
 import redis.asyncio as redis
 from langchain_core.messages import HumanMessage
@@ -12,26 +14,46 @@ from shared_models import (
     QueueLogger,
     QueueMessage,
     QueueTrigger,
+    get_correlation_id,
     get_logger,
+    queue_wait_seconds,
+    record_span,
+    span,
+    start_trace,
+    trigger_lane,
 )
 
-from assistants.base_assistant import BaseAssistant
+from assistants.base_assistant import BaseAssistant, PartialResponseCallback
 from assistants.factory import AssistantFactory
 from config.settings import Settings
 from metrics import (
+    collect_stage_timings,
     message_processing_retries_total,
     message_retry_count_histogram,
     messages_dlq_total,
+    observe_message_processed,
+    record_stage,
+)
+from services.redis_stream import (
+    MAX_RETRIES,
+    PriorityStreamReader,
+    RedisStreamClient,
 )
-from services.redis_stream import MAX_RETRIES, RedisStreamClient
 from services.rest_service import RestServiceClient
-
-RETRY_KEY_PREFIX = "msg_retry:"
-RETRY_KEY_TTL = 3600  # 1 hour
+from utils.debug_trace import DebugTracer
 
 logger = get_logger(__name__)
 
 
+def _routing_chat_id(response_payload: dict) -> int | None:
+    """Telegram chat of the originating message, if it carried one."""
+    metadata = response_payload.get("metadata") or {}
+    try:
+        return int(metadata["chat_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 class AssistantOrchestrator:
     def __init__(self, settings: Settings):
         """Initialize the assistant service."""
@@ -53,13 +75,38 @@ class AssistantOrchestrator:
             stream=settings.INPUT_QUEUE,
             group=settings.INPUT_STREAM_GROUP,
             consumer=settings.STREAM_CONSUMER,
+            maxlen=settings.STREAM_MAXLEN,
+            dlq_maxlen=settings.DLQ_MAXLEN,
+        )
+        # Reminders and calendar callbacks arrive on a separate lane
+        self.trigger_stream = RedisStreamClient(
+            client=self.redis,
+            stream=trigger_lane(settings.INPUT_QUEUE),
+            group=settings.INPUT_STREAM_GROUP,
+            consumer=settings.STREAM_CONSUMER,
+            maxlen=settings.STREAM_MAXLEN,
+            dlq_maxlen=settings.DLQ_MAXLEN,
+        )
+        self.input_reader = PriorityStreamReader(
+            [
+                (self.input_stream, settings.INTERACTIVE_LANE_WEIGHT),
+                (self.trigger_stream, settings.TRIGGER_LANE_WEIGHT),
+            ]
         )
         self.output_stream = RedisStreamClient(
             client=self.redis,
             stream=settings.OUTPUT_QUEUE,
             group=settings.OUTPUT_STREAM_GROUP,
             consumer=settings.STREAM_CONSUMER,
+            maxlen=settings.STREAM_MAXLEN,
+            dlq_maxlen=settings.DLQ_MAXLEN,
         )
+        self.debug_tracer = DebugTracer(
+            sample_rate=settings.DEBUG_TRACE_SAMPLE_RATE,
+            file_path=settings.DEBUG_TRACE_FILE,
+        )
+        # Entries read ahead while coalescing that belong to the next turn
+        self._pushback: deque[tuple[RedisStreamClient, str, dict, int]] = deque()
 
         logger.info(
             "Assistant service initialized",
@@ -69,61 +116,109 @@ class AssistantOrchestrator:
     def _extract_payload_field(message_fields):
         return message_fields.get("payload") or message_fields.get(b"payload")
 
-    # region agent log
-    @staticmethod
-    def _dbg_log(hypothesis_id: str, location: str, message: str, data: dict) -> None:
-        payload = {
-            "sessionId": "debug-session",
-            "runId": "pre-fix",
-            "hypothesisId": hypothesis_id,
-            "location": location,
-            "message": message,
-            "data": data,
-            "timestamp": int(time.time() * 1000),
-        }
-        log_paths = [
-            "/home/vlad/projects/Assistants/.cursor/debug.log",  # host path
-            "/src/debug.log",  # container-mounted path fallback
-        ]
-        for path in log_paths:
-            try:
-                os.makedirs(os.path.dirname(path), exist_ok=True)
-                with open(path, "a") as f:
-                    f.write(json.dumps(payload) + "\n")
+    # region message coalescing
+    def _parse_user_message(self, message_fields: dict) -> QueueMessage | None:
+        """Parse a stream entry as a user message; None for anything else."""
+        raw = self._extract_payload_field(message_fields)
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+            if "trigger_type" in data or "content" not in data:
+                return None
+            return QueueMessage(**data)
+        except (ValueError, TypeError, ValidationError):
+            return None
+
+    async def _collect_burst(
+        self, first: QueueMessage
+    ) -> list[tuple[QueueMessage, str, int, bytes]]:
+        """Gather further messages the same user sends right after ``first``.
+
+        Reads the interactive lane until it stays quiet for COALESCE_WINDOW_MS
+        or COALESCE_MAX_MESSAGES is reached. An entry from another user, one
+        that is not a plain user message, or a redelivered one (it may head a
+        held burst of its own) ends the burst and is processed next.
+        Returns (message, stream_message_id, delivery_count, raw_payload) per
+        extra message.
+        """
+        burst: list[tuple[QueueMessage, str, int, bytes]] = []
+        while len(burst) + 1 < self.settings.COALESCE_MAX_MESSAGES:
+            entry = await self.input_stream.read(
+                block_ms=self.settings.COALESCE_WINDOW_MS
+            )
+            if not entry:
+                break
+            message_id, fields, delivery_count = entry
+            message = self._parse_user_message(fields)
+            if (
+                message is None
+                or message.user_id != first.user_id
+                or delivery_count > 1
+            ):
+                self._pushback.append((self.input_stream, *entry))
                 break
-            except Exception:
+            raw_payload = self._extract_payload_field(fields)
+            burst.append((message, message_id, delivery_count, raw_payload))
+        return burst
+
+    async def _claim_held_burst(
+        self, message_id: str
+    ) -> list[tuple[QueueMessage, str, int, bytes]]:
+        """Entries held with ``message_id`` after its coalesced turn failed."""
+        held = []
+        for entry_id, fields in await self.input_stream.claim_burst(message_id):
+            message = self._parse_user_message(fields)
+            if message is None:
                 continue
+            raw_payload = self._extract_payload_field(fields)
+            # The turn's attempt number is the first entry's delivery count
+            held.append((message, entry_id, 1, raw_payload))
+        return held
 
-    # endregion
+    @staticmethod
+    def _merge_messages(messages: list[QueueMessage]) -> QueueMessage:
+        """Combine consecutive user messages into one agent turn.
 
-    # region retry count management
-    async def _get_message_retry_count(self, message_id: str) -> int:
-        """Get retry count for a message from Redis."""
-        key = f"{RETRY_KEY_PREFIX}{message_id}"
-        count = await self.redis.get(key)
-        return int(count) if count else 0
-
-    async def _increment_message_retry_count(self, message_id: str) -> int:
-        """Increment and return new retry count."""
-        key = f"{RETRY_KEY_PREFIX}{message_id}"
-        new_count = await self.redis.incr(key)
-        await self.redis.expire(key, RETRY_KEY_TTL)
-        return new_count
-
-    async def _clear_message_retry_count(self, message_id: str) -> None:
-        """Clear retry count after successful processing or DLQ."""
-        key = f"{RETRY_KEY_PREFIX}{message_id}"
-        await self.redis.delete(key)
+        Each original keeps its own timestamp line in ``coalesced_parts`` so it
+        can still be saved as a separate message.
+        """
+        parts = [
+            f"(Sent at UTC: {m.timestamp.replace(microsecond=0).isoformat()}) "
+            f"{m.content}"
+            for m in messages
+        ]
+        last = messages[-1]
+        metadata = {**(last.metadata or {}), "coalesced_parts": parts}
+        return last.model_copy(
+            update={
+                "content": "\n".join(str(m.content) for m in messages),
+                "metadata": metadata,
+                "correlation_id": messages[0].correlation_id,
+            }
+        )
 
+    # endregion
+
+    # region retry handling
     async def _handle_processing_failure(
         self,
         message_id: str,
         raw_payload: bytes | None,
         error: Exception,
         event: QueueMessage | QueueTrigger | None,
+        delivery_count: int = 1,
+        lane: RedisStreamClient | None = None,
     ) -> None:
-        """Handle message processing failure - retry or send to DLQ."""
-        retry_count = await self._increment_message_retry_count(message_id)
+        """Handle message processing failure - retry or send to DLQ.
+
+        ``delivery_count`` comes from the stream's pending entry list, so each
+        failed delivery counts as one attempt without extra Redis keys.
+        ``lane`` is the input stream the entry was read from; all lanes share
+        the input stream's DLQ.
+        """
+        lane = lane or self.input_stream
+        retry_count = delivery_count
 
         user_id = getattr(event, "user_id", "unknown") if event else "unknown"
         error_type = type(error).__name__
@@ -151,8 +246,7 @@ class AssistantOrchestrator:
                     retry_count=retry_count,
                 )
                 # After DLQ, ACK original message
-                await self.input_stream.ack(message_id)
-                await self._clear_message_retry_count(message_id)
+                await lane.ack(message_id)
 
                 # Update DLQ metrics
                 messages_dlq_total.labels(
@@ -170,27 +264,133 @@ class AssistantOrchestrator:
                     message_id=message_id,
                 )
         else:
-            # Will be retried via xautoclaim
-            delay = self.input_stream.get_retry_delay(retry_count - 1)
+            # Don't ACK - the entry stays pending and is redelivered once due
+            delay = lane.get_retry_delay(retry_count - 1)
+            try:
+                await lane.schedule_retry(message_id, delay)
+            except Exception as schedule_exc:
+                # Still pending, so xautoclaim picks it up after the idle timeout
+                logger.error(
+                    "Failed to schedule retry",
+                    error=str(schedule_exc),
+                    message_id=message_id,
+                )
             logger.info(
-                "Message will be retried via xautoclaim",
+                "Message scheduled for retry",
                 message_id=message_id,
                 retry_count=retry_count,
                 next_retry_delay_seconds=delay,
                 error_type=error_type,
                 user_id=user_id,
             )
-            # Don't ACK - message stays in pending list for xautoclaim
 
             # Update retry metric
             message_processing_retries_total.labels(
                 queue=self.settings.INPUT_QUEUE,
             ).inc()
 
+    async def _handle_burst_failure(
+        self,
+        message_id: str,
+        coalesced: list[tuple[str, int, bytes]],
+        error: Exception,
+        event: QueueMessage | QueueTrigger | None,
+        delivery_count: int,
+    ) -> None:
+        """Retry the entries merged into a failed turn together with it.
+
+        Below the retry limit they stay pending and are held with
+        ``message_id``, whose retry merges them again; at the limit they go to
+        the DLQ along with it.
+        """
+        if delivery_count >= MAX_RETRIES:
+            for entry_id, _, raw_payload in coalesced:
+                await self._handle_processing_failure(
+                    message_id=entry_id,
+                    raw_payload=raw_payload,
+                    error=error,
+                    event=event,
+                    delivery_count=delivery_count,
+                )
+            return
+        try:
+            await self.input_stream.hold_burst(
+                message_id, [entry_id for entry_id, _, _ in coalesced]
+            )
+        except Exception as hold_exc:
+            # Still pending, so xautoclaim picks them up after the idle timeout
+            logger.error(
+                "Failed to hold coalesced entries for retry",
+                error=str(hold_exc),
+                message_id=message_id,
+            )
+
     # endregion
 
+    def _partial_publisher(
+        self, user_id: int, stream_id: str, metadata: dict
+    ) -> PartialResponseCallback:
+        """Callback publishing throttled partial responses to the output stream.
+
+        Partial events carry the full text so far, so dropping intermediate
+        ones (throttling, or a failed XADD) loses nothing.
+        """
+        interval = self.settings.STREAM_PARTIAL_INTERVAL
+        chat_id = _routing_chat_id({"metadata": metadata})
+        last_published = None
+
+        async def publish(text: str) -> None:
+            nonlocal last_published
+            now = time.monotonic()
+            if last_published is not None and now - last_published < interval:
+                return
+            last_published = now
+            partial = AssistantResponseMessage(
+                user_id=user_id,
+                status="success",
+                source=metadata.get("source"),
+                response=text,
+                correlation_id=get_correlation_id(),
+                chat_id=chat_id,
+                partial=True,
+                stream_id=stream_id,
+            )
+            try:
+                await self.output_stream.add(partial.model_dump_json())
+            except Exception as e:
+                logger.warning(
+                    "Failed to publish partial response",
+                    user_id=user_id,
+                    error=str(e),
+                )
+
+        return publish
+
     async def _dispatch_event(self, event: QueueMessage | QueueTrigger) -> dict | None:
-        """Handle incoming events and dispatch to secretary."""
+        """Handle incoming events and dispatch to secretary.
+
+        Records processing metrics, including the per-stage breakdown
+        (secretary lookup, agent, LLM, tools, REST, RAG) of the message.
+        """
+        start_time = time.perf_counter()
+        with (
+            collect_stage_timings() as stage_timings,
+            span("orchestrator.dispatch", user_id=event.user_id) as span_attrs,
+        ):
+            result = await self._process_event(event)
+            if result:
+                span_attrs["result_status"] = result.get("status")
+        if result:
+            observe_message_processed(
+                source=str(result.get("source") or "unknown"),
+                status=str(result.get("status") or "unknown"),
+                duration=time.perf_counter() - start_time,
+                stage_timings=stage_timings,
+            )
+        return result
+
+    async def _process_event(self, event: QueueMessage | QueueTrigger) -> dict | None:
+        """Build the LangChain message for an event and run the secretary."""
         user_id = None
         start_time = time.perf_counter()
         get_secretary_start_time = None
@@ -226,7 +426,12 @@ class AssistantOrchestrator:
                 lc_metadata["source"] = source
                 lc_metadata["timestamp"] = timestamp_iso
 
-                human_content = f"(Sent at UTC: {timestamp_iso}) {event.content}"
+                coalesced_parts = lc_metadata.get("coalesced_parts")
+                if coalesced_parts:
+                    human_content = "\n".join(coalesced_parts)
+                    log_extra["coalesced_messages"] = len(coalesced_parts)
+                else:
+                    human_content = f"(Sent at UTC: {timestamp_iso}) {event.content}"
                 lc_message = HumanMessage(
                     content=human_content,
                     metadata=lc_metadata,
@@ -280,6 +485,8 @@ class AssistantOrchestrator:
             get_secretary_start_time = time.perf_counter()
             secretary: BaseAssistant = await self.factory.get_user_secretary(user_id)
             get_secretary_duration = time.perf_counter() - get_secretary_start_time
+            record_stage("get_secretary", get_secretary_duration)
+            record_span("orchestrator.get_secretary", get_secretary_duration)
             log_extra["get_secretary_duration_ms"] = round(
                 get_secretary_duration * 1000
             )
@@ -296,12 +503,26 @@ class AssistantOrchestrator:
                 extra=log_extra,
             )
 
+            # Stream replies to user messages; triggers are delivered whole
+            stream_id = None
+            process_kwargs = {}
+            if self.settings.STREAMING_ENABLED and isinstance(event, QueueMessage):
+                stream_id = uuid.uuid4().hex
+                process_kwargs["on_partial"] = self._partial_publisher(
+                    user_id, stream_id, lc_message.metadata
+                )
+
             # Вызов process_message с сообщением, user_id и логами
             process_message_start_time = time.perf_counter()
             ai_response = await secretary.process_message(
-                message=lc_message, user_id=str(user_id), log_extra=log_extra
+                message=lc_message,
+                user_id=str(user_id),
+                log_extra=log_extra,
+                **process_kwargs,
             )
             process_message_duration = time.perf_counter() - process_message_start_time
+            record_stage("process_message", process_message_duration)
+            record_span("agent.process_message", process_message_duration)
             log_extra["process_message_duration_ms"] = round(
                 process_message_duration * 1000
             )
@@ -324,6 +545,8 @@ class AssistantOrchestrator:
                 "type": "assistant",  # Or derive from response?
                 "metadata": lc_message.metadata,  # Pass the metadata we added
             }
+            if stream_id:
+                result["stream_id"] = stream_id
             total_duration = time.perf_counter() - start_time
             log_extra["total_processing_duration_ms"] = round(total_duration * 1000)
             logger.info(
@@ -419,6 +642,7 @@ class AssistantOrchestrator:
     async def listen_for_messages(self):
         """Listen for messages/triggers from Redis and dispatch."""
         await self.input_stream.ensure_group()
+        await self.trigger_stream.ensure_group()
         await self.output_stream.ensure_group()
         logger.info(
             "Starting message listener",
@@ -430,33 +654,42 @@ class AssistantOrchestrator:
             response_payload = None
             event_object: QueueMessage | QueueTrigger | None = None
             stream_message_id: str | None = None
+            delivery_count = 1
+            lane = self.input_stream
+            # Extra entries merged into this turn:
+            # (message_id, delivery_count, raw_payload)
+            coalesced: list[tuple[str, int, bytes]] = []
             should_ack: bool = False
             processing_error: Exception | None = None
+            # Holds the trace of the current entry; closed at the end of the
+            # iteration so the correlation id never leaks into the next one
+            trace_scope = ExitStack()
+            correlation_id: str | None = None
+            trace_debug = self.debug_tracer.sample()
 
             try:
-                stream_entry = await self.input_stream.read()
+                if self._pushback:
+                    stream_entry = self._pushback.popleft()
+                else:
+                    stream_entry = await self.input_reader.read()
                 if not stream_entry:
                     continue
 
-                stream_message_id, message_fields = stream_entry
-                # region agent log
-                self._dbg_log(
-                    "A",
-                    "orchestrator.listen_for_messages:after_read",
-                    "Received stream entry",
-                    {
-                        "message_id": stream_message_id,
-                        "field_keys": list(message_fields.keys()),
-                        "input_queue": self.settings.INPUT_QUEUE,
-                    },
-                )
-                # endregion
+                lane, stream_message_id, message_fields, delivery_count = stream_entry
+                if trace_debug:
+                    self.debug_tracer.log(
+                        "listen_for_messages:after_read",
+                        "Received stream entry",
+                        message_id=stream_message_id,
+                        field_keys=list(message_fields.keys()),
+                        input_queue=self.settings.INPUT_QUEUE,
+                    )
                 raw_message_bytes = self._extract_payload_field(message_fields)
                 if raw_message_bytes is None:
                     logger.error(
                         "Stream message missing payload",
                         extra={
-                            "stream": self.settings.INPUT_QUEUE,
+                            "stream": lane.stream,
                             "message_id": stream_message_id,
                         },
                     )
@@ -475,18 +708,14 @@ class AssistantOrchestrator:
                     "Successfully parsed JSON",
                     extra={"keys": list(message_dict.keys())},
                 )
-                # region agent log
-                self._dbg_log(
-                    "B",
-                    "orchestrator.listen_for_messages:after_json",
-                    "Parsed JSON",
-                    {
-                        "keys": list(message_dict.keys()),
-                        "has_trigger_type": "trigger_type" in message_dict,
-                        "has_content": "content" in message_dict,
-                    },
-                )
-                # endregion
+                if trace_debug:
+                    self.debug_tracer.log(
+                        "listen_for_messages:after_json",
+                        "Parsed JSON",
+                        keys=list(message_dict.keys()),
+                        has_trigger_type="trigger_type" in message_dict,
+                        has_content="content" in message_dict,
+                    )
 
                 # Reset event_object before attempting QueueMessage parse
                 event_object = None
@@ -539,24 +768,63 @@ class AssistantOrchestrator:
                     )
                     event_object = None
 
+                # Merge a burst of messages from the same user into one turn.
+                # A failed burst is held with its first entry, so a retry of
+                # that entry reassembles the same turn
+                held = []
+                if isinstance(event_object, QueueMessage) and delivery_count > 1:
+                    held = await self._claim_held_burst(stream_message_id)
+                if held:
+                    event_object = self._merge_messages(
+                        [event_object] + [entry[0] for entry in held]
+                    )
+                    coalesced = [entry[1:] for entry in held]
+                    logger.info(
+                        "Reassembled coalesced turn for retry",
+                        user_id=event_object.user_id,
+                        messages=len(held) + 1,
+                    )
+                elif (
+                    isinstance(event_object, QueueMessage)
+                    and lane is self.input_stream
+                    and self.settings.COALESCE_WINDOW_MS > 0
+                ):
+                    burst = await self._collect_burst(event_object)
+                    if burst:
+                        event_object = self._merge_messages(
+                            [event_object] + [entry[0] for entry in burst]
+                        )
+                        coalesced = [entry[1:] for entry in burst]
+                        logger.info(
+                            "Coalesced user messages into one turn",
+                            user_id=event_object.user_id,
+                            messages=len(burst) + 1,
+                        )
+
                 # Dispatch if parsing succeeded
                 if event_object:
+                    correlation_id = trace_scope.enter_context(
+                        start_trace(event_object.correlation_id)
+                    )
+                    wait_seconds = queue_wait_seconds(stream_message_id)
+                    if wait_seconds is not None:
+                        record_span(
+                            "queue.wait",
+                            wait_seconds,
+                            stream=lane.stream,
+                        )
                     # Now event_object can be either QueueMessage or QueueTrigger
                     # Assign the result directly to response_payload
-                    # region agent log
-                    self._dbg_log(
-                        "C",
-                        "orchestrator.listen_for_messages:before_dispatch",
-                        "Dispatching event",
-                        {
-                            "event_class": type(event_object).__name__,
-                            "user_id": getattr(event_object, "user_id", None),
-                            "source": getattr(event_object, "source", None).value
+                    if trace_debug:
+                        self.debug_tracer.log(
+                            "listen_for_messages:before_dispatch",
+                            "Dispatching event",
+                            event_class=type(event_object).__name__,
+                            user_id=getattr(event_object, "user_id", None),
+                            source=getattr(event_object, "source", None).value
                             if hasattr(event_object, "source")
                             else None,
-                        },
-                    )
-                    # endregion
+                        )
 
                     # Log inbound message to REST API
                     try:
@@ -599,7 +867,6 @@ class AssistantOrchestrator:
                     # Check if processing was successful
                     if response_payload and response_payload.get("status") == "success":
                         should_ack = True
-                        await self._clear_message_retry_count(stream_message_id)
                     elif response_payload:
                         # Processing returned error - will be handled in finally
                         processing_error = Exception(
@@ -628,18 +895,14 @@ class AssistantOrchestrator:
 
                 # Send response if any
                 if response_payload:
-                    # region agent log
-                    self._dbg_log(
-                        "D",
-                        "orchestrator.listen_for_messages:before_output_add",
-                        "Enqueuing response",
-                        {
-                            "message_id": stream_message_id,
-                            "user_id": response_payload.get("user_id"),
-                            "output_queue": self.settings.OUTPUT_QUEUE,
-                        },
-                    )
-                    # endregion
+                    if trace_debug:
+                        self.debug_tracer.log(
+                            "listen_for_messages:before_output_add",
+                            "Enqueuing response",
+                            message_id=stream_message_id,
+                            user_id=response_payload.get("user_id"),
+                            output_queue=self.settings.OUTPUT_QUEUE,
+                        )
                     try:
                         # Use AssistantResponseMessage for structuring the response
                         response_message = AssistantResponseMessage(
@@ -654,6 +917,10 @@ class AssistantOrchestrator:
                             error=response_payload.get("error")
                             if response_payload.get("status") == "error"
                             else None,
+                            correlation_id=correlation_id,
+                            chat_id=_routing_chat_id(response_payload),
+                            metadata=response_payload.get("metadata") or None,
+                            stream_id=response_payload.get("stream_id"),
                         )
                         response_json = response_message.model_dump_json()
                         logger.debug(
@@ -722,12 +989,14 @@ class AssistantOrchestrator:
                     if should_ack:
                         # Success or non-retryable error - ACK the message
                         try:
-                            await self.input_stream.ack(stream_message_id)
+                            await lane.ack(stream_message_id)
+                            for message_id, _, _ in coalesced:
+                                await self.input_stream.ack(message_id)
                         except Exception as ack_exc:
                             logger.error(
                                 "Failed to ACK message",
                                 extra={
-                                    "stream": self.settings.INPUT_QUEUE,
+                                    "stream": lane.stream,
                                     "message_id": stream_message_id,
                                     "error": str(ack_exc),
                                 },
@@ -739,7 +1008,18 @@ class AssistantOrchestrator:
                             raw_payload=raw_message_bytes,
                             error=processing_error,
                             event=event_object,
+                            delivery_count=delivery_count,
+                            lane=lane,
                         )
+                        if coalesced:
+                            await self._handle_burst_failure(
+                                stream_message_id,
+                                coalesced,
+                                processing_error,
+                                event_object,
+                                delivery_count,
+                            )
+                trace_scope.close()
 
     async def close(self):
         """Close Redis connection."""
@@ -5,9 +5,10 @@ import time
 from uuid import UUID
 
 import httpx
-from shared_models import get_logger
+from shared_models import get_correlation_id, get_logger, span
 
 from config.settings import Settings
+from metrics import track_stage
 
 logger = get_logger(__name__)
 
@@ -35,9 +36,17 @@ class RagServiceClient:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=30.0,
+                event_hooks={"request": [self._add_correlation_header]},
             )
         return self._client
 
+    @staticmethod
+    async def _add_correlation_header(request: httpx.Request) -> None:
+        """Propagate the correlation id so rag_service logs join the trace."""
+        correlation_id = get_correlation_id()
+        if correlation_id:
+            request.headers["X-Correlation-ID"] = correlation_id
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None:
@@ -75,15 +84,16 @@ class RagServiceClient:
 
         try:
             client = self.get_client()
-            response = await client.post(
-                "/api/memory/search",
-                json={
-                    "query": query,
-                    "user_id": user_id,
-                    "limit": limit,
-                    "threshold": threshold,
-                },
-            )
+            with track_stage("rag"), span("rag.search_memories"):
+                response = await client.post(
+                    "/api/memory/search",
+                    json={
+                        "query": query,
+                        "user_id": user_id,
+                        "limit": limit,
+                        "threshold": threshold,
+                    },
+                )
             response.raise_for_status()
             results = response.json()
 
@@ -158,10 +168,11 @@ class RagServiceClient:
             if assistant_id:
                 payload["assistant_id"] = str(assistant_id)
 
-            response = await client.post(
-                "/api/memory/",
-                json=payload,
-            )
+            with track_stage("rag"), span("rag.create_memory"):
+                response = await client.post(
+                    "/api/memory/",
+                    json=payload,
+                )
             response.raise_for_status()
             memory = response.json()
 
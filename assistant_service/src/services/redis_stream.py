@@ -1,27 +1,50 @@
 import logging
+import time
 from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
 import redis.asyncio as redis
 from redis.exceptions import ResponseError
+from shared_models import maxlen_kwargs
 
 logger = logging.getLogger(__name__)
 
 # DLQ Constants
-MAX_RETRIES = 3
 RETRY_DELAYS = [1, 2, 4]  # seconds (exponential backoff)
+# Deliveries before the DLQ: the first attempt plus one retry per delay
+MAX_RETRIES = len(RETRY_DELAYS) + 1
+# Longest a consumer goes without reading the retry schedule, which picks up
+# retries scheduled by other consumers; its own are tracked locally
+RETRY_POLL_INTERVAL = 1.0  # seconds
 DLQ_SUFFIX = ":dlq"
+RETRY_SUFFIX = ":retry"  # sorted set of pending entry ids scored by due time
+BURSTS_SUFFIX = ":bursts"  # hash: entry id -> entries coalesced with it
 
 
 class RedisStreamClient:
     """Lightweight helper around Redis Streams with consumer groups."""
 
-    def __init__(self, client: redis.Redis, stream: str, group: str, consumer: str):
+    def __init__(
+        self,
+        client: redis.Redis,
+        stream: str,
+        group: str,
+        consumer: str,
+        maxlen: int | None = None,
+        dlq_maxlen: int | None = None,
+    ):
         self.client = client
         self.stream = stream
         self.group = group
         self.consumer = consumer
+        # Approximate caps applied on XADD; None leaves the stream unbounded
+        self.maxlen = maxlen
+        self.dlq_maxlen = dlq_maxlen
+        # Earliest scheduled retry as of the last schedule read, and when the
+        # schedule has to be read again
+        self._retry_head: tuple[str, float] | None = None
+        self._retry_check_at = 0.0
 
     async def ensure_group(self) -> None:
         """Create consumer group if it does not exist."""
@@ -40,13 +63,30 @@ class RedisStreamClient:
     async def read(
         self,
         count: int = 1,
-        block_ms: int = 5_000,
+        block_ms: int | None = 5_000,
         idle_reclaim_ms: int = 60_000,
-    ) -> tuple[str, dict[str, Any]] | None:
+    ) -> tuple[str, dict[str, Any], int] | None:
         """
         Read next message from stream, reclaiming stale pending entries if needed.
-        Returns (message_id, fields) or None if nothing is available.
+        Returns (message_id, fields, delivery_count) or None if nothing is
+        available. The delivery count is the one Redis keeps for the pending
+        entry, so it doubles as the attempt number for retry/DLQ decisions.
+
+        Scheduled retries that are due come first, so a busy stream cannot
+        starve them, and blocking never outlasts the next retry's due time.
+        ``block_ms=None`` polls without blocking.
         """
+        next_retry = await self._next_retry()
+        if next_retry is not None:
+            retry_id, due_at = next_retry
+            wait = due_at - time.time()
+            if wait <= 0:
+                message = await self._claim_retry(retry_id)
+                if message:
+                    return message
+            elif block_ms is not None:
+                block_ms = min(block_ms, max(1, int(wait * 1000)))
+
         # Try new messages
         entries = await self.client.xreadgroup(
             groupname=self.group,
@@ -57,7 +97,8 @@ class RedisStreamClient:
         )
         message = self._first_entry(entries)
         if message:
-            return message
+            # Fresh entries from ">" are on their first delivery
+            return (*message, 1)
 
         # Reclaim stale pending messages
         pending = await self.client.xautoclaim(
@@ -69,7 +110,134 @@ class RedisStreamClient:
             count=count,
         )
         _start_id, claimed, _ = pending
-        return self._first_entry([("unused", claimed)]) if claimed else None
+        message = self._first_entry([("unused", claimed)]) if claimed else None
+        if not message:
+            return None
+        return (*message, await self.delivery_count(message[0]))
+
+    async def delivery_count(self, message_id: str) -> int:
+        """Times a pending entry has been delivered to this group (XPENDING)."""
+        pending = await self.client.xpending_range(
+            name=self.stream,
+            groupname=self.group,
+            min=message_id,
+            max=message_id,
+            count=1,
+        )
+        if not pending:
+            return 1
+        return int(pending[0]["times_delivered"])
+
+    # Delayed retries
+
+    @property
+    def retry_key(self) -> str:
+        """Return the retry schedule (sorted set) name."""
+        return f"{self.stream}{RETRY_SUFFIX}"
+
+    async def schedule_retry(self, message_id: str, delay: float) -> None:
+        """Redeliver a pending (unacked) entry once ``delay`` seconds pass."""
+        due_at = time.time() + delay
+        await self.client.zadd(self.retry_key, {message_id: due_at})
+        if self._retry_head is None or due_at < self._retry_head[1]:
+            self._retry_head = (message_id, due_at)
+        self._retry_check_at = min(self._retry_check_at, due_at)
+
+    async def retry_wait_ms(self) -> int | None:
+        """Milliseconds until the next scheduled retry is due, if any."""
+        next_retry = await self._next_retry()
+        if next_retry is None:
+            return None
+        return max(0, int((next_retry[1] - time.time()) * 1000))
+
+    async def _next_retry(self) -> tuple[str, float] | None:
+        """Earliest scheduled retry, reading the schedule only when needed.
+
+        The sorted set is read once the known earliest retry falls due, or
+        RETRY_POLL_INTERVAL after the last read; other reads use the cached
+        head, so a busy stream does not pay a ZRANGE per entry.
+        """
+        now = time.time()
+        if now < self._retry_check_at:
+            return self._retry_head
+        scheduled = await self.client.zrange(self.retry_key, 0, 0, withscores=True)
+        self._retry_check_at = now + RETRY_POLL_INTERVAL
+        if not scheduled:
+            self._retry_head = None
+            return None
+        message_id, due_at = scheduled[0]
+        self._retry_head = (message_id, float(due_at))
+        self._retry_check_at = min(self._retry_check_at, float(due_at))
+        return self._retry_head
+
+    async def _claim_retry(
+        self, message_id: str
+    ) -> tuple[str, dict[str, Any], int] | None:
+        # The head is gone either way; read the schedule again next time
+        self._retry_head = None
+        self._retry_check_at = 0.0
+        # ZREM decides which consumer owns the retry when several are polling
+        if not await self.client.zrem(self.retry_key, message_id):
+            return None
+        claimed = await self.client.xclaim(
+            name=self.stream,
+            groupname=self.group,
+            consumername=self.consumer,
+            min_idle_time=0,
+            message_ids=[message_id],
+        )
+        message = self._first_entry([("unused", claimed)]) if claimed else None
+        if not message or not message[1]:
+            # Acked or trimmed in the meantime
+            return None
+        return (*message, await self.delivery_count(message[0]))
+
+    # Coalesced bursts
+
+    @property
+    def bursts_key(self) -> str:
+        """Return the name of the hash holding failed coalesced bursts."""
+        return f"{self.stream}{BURSTS_SUFFIX}"
+
+    async def hold_burst(self, message_id: str, member_ids: list[str | bytes]) -> None:
+        """Keep ``member_ids`` pending until ``message_id`` is redelivered.
+
+        The members were merged into the turn of ``message_id``; its retry
+        claims them back with :meth:`claim_burst` so the turn runs again as
+        one unit instead of each entry being retried on its own.
+        """
+        members = ",".join(
+            m.decode("utf-8") if isinstance(m, bytes) else m for m in member_ids
+        )
+        await self.client.hset(self.bursts_key, message_id, members)
+        # Reset their idle time so xautoclaim does not hand them out before
+        # the retry; JUSTID leaves the delivery counters unchanged
+        await self.client.xclaim(
+            name=self.stream,
+            groupname=self.group,
+            consumername=self.consumer,
+            min_idle_time=0,
+            message_ids=member_ids,
+            justid=True,
+        )
+
+    async def claim_burst(self, message_id: str) -> list[tuple[str, dict[str, Any]]]:
+        """Claim the entries held with ``message_id``; [] if there are none."""
+        members = await self.client.hget(self.bursts_key, message_id)
+        if not members:
+            return []
+        await self.client.hdel(self.bursts_key, message_id)
+        if isinstance(members, bytes):
+            members = members.decode("utf-8")
+        claimed = await self.client.xclaim(
+            name=self.stream,
+            groupname=self.group,
+            consumername=self.consumer,
+            min_idle_time=0,
+            message_ids=members.split(","),
+        )
+        # Entries acked or trimmed in the meantime come back without fields
+        return [(entry_id, fields) for entry_id, fields in claimed or [] if fields]
 
     async def ack(self, message_id: str) -> None:
         await self.client.xack(self.stream, self.group, message_id)
@@ -77,7 +245,9 @@ class RedisStreamClient:
     async def add(self, payload: bytes | str) -> str:
         if isinstance(payload, str):
             payload = payload.encode("utf-8")
-        return await self.client.xadd(self.stream, {"payload": payload})
+        return await self.client.xadd(
+            self.stream, {"payload": payload}, **maxlen_kwargs(self.maxlen)
+        )
 
     @staticmethod
     def _first_entry(
@@ -137,7 +307,9 @@ class RedisStreamClient:
             "user_id": str(error_info.get("user_id", "")),
         }
 
-        msg_id = await self.client.xadd(self.dlq_stream, dlq_entry)
+        msg_id = await self.client.xadd(
+            self.dlq_stream, dlq_entry, **maxlen_kwargs(self.dlq_maxlen)
+        )
         logger.info(
             "Message sent to DLQ",
             extra={
@@ -194,3 +366,69 @@ class RedisStreamClient:
             },
         )
         return new_id
+
+
+class PriorityStreamReader:
+    """Weighted fair reads across input lanes sharing one consumer group.
+
+    Each read prefers the lane chosen by smooth weighted round-robin, so with
+    weights 4:1 the interactive lane gets at least four of every five reads
+    while it has work, however deep the other lane is. Reads fall through to
+    the remaining lanes when the preferred one is empty, so no capacity is
+    wasted. When every lane is idle, a single XREADGROUP blocks on all of them.
+    """
+
+    def __init__(self, lanes: list[tuple[RedisStreamClient, int]]):
+        if not lanes:
+            raise ValueError("At least one lane is required")
+        self.lanes = [lane for lane, _ in lanes]
+        self.weights = [weight for _, weight in lanes]
+        self._credits = [0] * len(lanes)
+        self._by_stream = {lane.stream: lane for lane in self.lanes}
+
+    def _lane_order(self) -> list[RedisStreamClient]:
+        for i, weight in enumerate(self.weights):
+            self._credits[i] += weight
+        chosen = max(range(len(self.lanes)), key=self._credits.__getitem__)
+        self._credits[chosen] -= sum(self.weights)
+        return [self.lanes[chosen]] + [
+            lane for i, lane in enumerate(self.lanes) if i != chosen
+        ]
+
+    async def read(
+        self,
+        block_ms: int = 5_000,
+        idle_reclaim_ms: int = 60_000,
+    ) -> tuple[RedisStreamClient, str, dict[str, Any], int] | None:
+        """
+        Read the next entry from the lanes.
+        Returns (lane, message_id, fields, delivery_count) or None.
+        """
+        for lane in self._lane_order():
+            entry = await lane.read(block_ms=None, idle_reclaim_ms=idle_reclaim_ms)
+            if entry:
+                return (lane, *entry)
+
+        # Everything is idle: wait for new entries on any lane, but not past
+        # the moment a scheduled retry becomes due
+        for lane in self.lanes:
+            wait_ms = await lane.retry_wait_ms()
+            if wait_ms is not None:
+                block_ms = min(block_ms, max(1, wait_ms))
+        first = self.lanes[0]
+        entries = await first.client.xreadgroup(
+            groupname=first.group,
+            consumername=first.consumer,
+            streams={lane.stream: ">" for lane in self.lanes},
+            count=1,
+            block=block_ms,
+        )
+        if not entries:
+            return None
+        stream, messages = entries[0]
+        if not messages:
+            return None
+        if isinstance(stream, bytes):
+            stream = stream.decode("utf-8")
+        message_id, fields = messages[0]
+        return self._by_stream[stream], message_id, fields, 1
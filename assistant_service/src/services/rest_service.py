@@ -1,5 +1,6 @@
 """REST service client for interacting with the REST API using BaseServiceClient."""
 
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -9,9 +10,12 @@ from shared_models import (
     ServiceClientError,
     ServiceResponseError,
     get_logger,
+    span,
 )
 from shared_models.api_schemas import (
+    ActiveUser,
     AssistantRead,
+    AssistantVersion,
     GlobalSettingsBase,
     ReminderCreate,
     ReminderRead,
@@ -22,6 +26,7 @@ from shared_models.api_schemas import (
 from shared_models.api_schemas.message import MessageCreate, MessageRead, MessageUpdate
 
 from config.settings import settings
+from metrics import track_stage
 
 logger = get_logger(__name__)
 
@@ -55,6 +60,13 @@ class RestServiceClient(BaseServiceClient):
             config=config,
         )
 
+    async def request(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> dict[str, Any] | list[Any] | None:
+        """Make a request, counting its time towards the "rest" stage."""
+        with track_stage("rest"), span("rest.request", method=method, path=endpoint):
+            return await super().request(method, endpoint, **kwargs)
+
     async def get_assistant_tools(self, assistant_id: str) -> list[ToolRead]:
         """Get tools associated with a specific assistant."""
         try:
@@ -129,6 +141,27 @@ class RestServiceClient(BaseServiceClient):
                 return None
             raise
 
+    async def get_assistant_versions(
+        self, assistant_ids: list[UUID]
+    ) -> dict[UUID, datetime]:
+        """Get updated_at for several assistants in one request.
+
+        Assistants that no longer exist are absent from the result.
+        """
+        if not assistant_ids:
+            return {}
+        data = await self.request(
+            "GET",
+            "/api/assistants/versions",
+            params={"ids": [str(assistant_id) for assistant_id in assistant_ids]},
+        )
+        if not isinstance(data, list):
+            raise ServiceClientError(
+                f"Unexpected data type for assistant versions: {type(data)}"
+            )
+        versions = [AssistantVersion(**item) for item in data]
+        return {version.id: version.updated_at for version in versions}
+
     async def get_assistants(self) -> list[AssistantRead]:
         """Get a list of all assistants."""
         try:
@@ -267,6 +300,23 @@ class RestServiceClient(BaseServiceClient):
         )
         return []
 
+    async def get_active_users(
+        self, limit: int, since: datetime | None = None
+    ) -> list[ActiveUser]:
+        """Fetch users ordered by their latest message, most recent first.
+
+        With ``since``, only users with a message at or after it are listed.
+        """
+        params: dict[str, Any] = {"limit": limit}
+        if since is not None:
+            params["since"] = since.isoformat()
+        data = await self.request("GET", "/api/messages/active-users", params=params)
+        if not isinstance(data, list):
+            raise ServiceClientError(
+                f"Unexpected data type for active users: {type(data)}"
+            )
+        return [ActiveUser(**item) for item in data]
+
     async def get_user_secretary_assignment(self, user_id: int) -> dict | None:
         """Fetch the active secretary assignment for a specific user."""
         endpoint = f"/api/users/{user_id}/secretary"
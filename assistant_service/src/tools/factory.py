@@ -1,23 +1,45 @@
 # assistant_service/src/tools/factory.py
+import importlib
 import logging
+from functools import cache
 from typing import TYPE_CHECKING, Optional
 
 from langchain_core.tools import Tool
 from shared_models.api_schemas import ToolRead
 
 from config.settings import Settings
-from tools.calendar_tool import CalendarCreateTool, CalendarListTool
-from tools.memory_tool import MemorySaveTool, MemorySearchTool
-from tools.reminder_tool import ReminderCreateTool, ReminderDeleteTool, ReminderListTool
-from tools.sub_assistant_tool import SubAssistantTool
-from tools.time_tool import TimeToolWrapper
-from tools.web_search_tool import WebSearchTool
 
 if TYPE_CHECKING:
     from assistants.factory import AssistantFactory  # Import for type hinting
 
 logger = logging.getLogger(__name__)
 
+# Tool implementations as "module:Class", imported on first use so that only
+# the tools an assistant actually configures (and their dependencies, such
+# as tavily for web search) are loaded.
+TOOL_CLASSES = {
+    "reminder_create": "tools.reminder_tool:ReminderCreateTool",
+    "reminder_list": "tools.reminder_tool:ReminderListTool",
+    "reminder_delete": "tools.reminder_tool:ReminderDeleteTool",
+    "time": "tools.time_tool:TimeToolWrapper",
+    "web_search": "tools.web_search_tool:WebSearchTool",
+    "memory_save": "tools.memory_tool:MemorySaveTool",  # Memory V2
+    "memory_search": "tools.memory_tool:MemorySearchTool",  # Memory V2
+}
+# Calendar tools share a tool_type and are told apart by name
+CALENDAR_TOOL_CLASSES = {
+    "calendar_create": "tools.calendar_tool:CalendarCreateTool",
+    "calendar_list": "tools.calendar_tool:CalendarListTool",
+}
+SUB_ASSISTANT_TOOL_CLASS = "tools.sub_assistant_tool:SubAssistantTool"
+
+
+@cache
+def load_tool_class(path: str) -> type[Tool]:
+    """Import and return the tool class at ``"module:Class"``."""
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class ToolFactory:
     """Factory class for creating tool instances from definitions."""
@@ -59,30 +81,16 @@ class ToolFactory:
                 tool_class: type[Tool] | None = None
 
                 # Map tool_type to class
-                if tool_type == "reminder_create":  # Changed from "reminder"
-                    tool_class = ReminderCreateTool
-                elif tool_type == "reminder_list":
-                    tool_class = ReminderListTool
-                elif tool_type == "reminder_delete":
-                    tool_class = ReminderDeleteTool
-                elif tool_type == "time":
-                    tool_class = TimeToolWrapper
-                elif tool_type == "calendar":
-                    if tool_name == "calendar_create":
-                        tool_class = CalendarCreateTool
-                    elif tool_name == "calendar_list":
-                        tool_class = CalendarListTool
+                if tool_type == "calendar":
+                    if tool_name in CALENDAR_TOOL_CLASSES:
+                        tool_class = load_tool_class(CALENDAR_TOOL_CLASSES[tool_name])
                     else:
                         logger.warning(
                             f"Unknown calendar tool name: {tool_name} for type "
                             f"{tool_type}"
                         )
-                elif tool_type == "web_search":
-                    tool_class = WebSearchTool
-                elif tool_type == "memory_save":  # Memory V2 - save memories
-                    tool_class = MemorySaveTool
-                elif tool_type == "memory_search":  # Memory V2 - search memories
-                    tool_class = MemorySearchTool
+                elif tool_type in TOOL_CLASSES:
+                    tool_class = load_tool_class(TOOL_CLASSES[tool_type])
                 elif tool_type == "sub_assistant":
                     if not self.assistant_factory:
                         raise ValueError(
@@ -128,7 +136,8 @@ class ToolFactory:
                         "sub_assistant_db_id": sub_assistant_id,
                         "tool_id": tool_id_str,
                     }
-                    tool_instance = SubAssistantTool(**sub_assistant_tool_args)
+                    sub_assistant_tool_class = load_tool_class(SUB_ASSISTANT_TOOL_CLASS)
+                    tool_instance = sub_assistant_tool_class(**sub_assistant_tool_args)
                     logger.info(f"Initialized SubAssistantTool: {tool_instance.name}")
 
                 else:
@@ -0,0 +1,128 @@
+"""Sampled, runtime-switchable debug tracing for the message loop.
+
+Off by default. The sample rate can be changed at runtime by writing a float
+between 0 and 1 to the DEBUG_TRACE_KEY Redis key (e.g.
+`SET assistant:debug_trace 0.1`); deleting the key restores the configured
+default. Records are JSON lines handed to a QueueHandler, so the consume loop
+never blocks on file I/O: a QueueListener thread does the actual writing.
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from shared_models import get_correlation_id, get_logger
+
+logger = get_logger(__name__)
+
+DEBUG_TRACE_KEY = "assistant:debug_trace"
+
+# Bounded so a burst of traced messages cannot grow memory without limit;
+# records are dropped (not waited for) when the writer falls behind.
+_QUEUE_MAXSIZE = 10_000
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class DebugTracer:
+    """Emit debug records for a random sample of messages."""
+
+    def __init__(self, sample_rate: float = 0.0, file_path: str | None = None):
+        self.default_sample_rate = self._clamp(sample_rate)
+        self.sample_rate = self.default_sample_rate
+        self.file_path = file_path
+        self._logger = logging.getLogger("assistant.debug_trace")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.DEBUG)
+        self._listener: QueueListener | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    @staticmethod
+    def _clamp(rate: float) -> float:
+        return min(max(rate, 0.0), 1.0)
+
+    def set_sample_rate(self, rate: float) -> None:
+        rate = self._clamp(rate)
+        if rate != self.sample_rate:
+            logger.info(
+                "Debug trace sample rate changed",
+                old_rate=self.sample_rate,
+                new_rate=rate,
+            )
+        self.sample_rate = rate
+
+    def sample(self) -> bool:
+        """Decide whether the current message is traced (one call per message)."""
+        rate = self.sample_rate
+        return rate > 0 and (rate >= 1 or random.random() < rate)
+
+    def log(self, location: str, message: str, **data: Any) -> None:
+        """Queue a debug record; only call for sampled messages."""
+        if self._listener is None:
+            self.start()
+        record = {
+            "timestamp": int(time.time() * 1000),
+            "location": location,
+            "message": message,
+            "correlation_id": get_correlation_id(),
+            "data": data,
+        }
+        self._logger.debug(json.dumps(record, default=str))
+
+    def start(self) -> None:
+        """Start the background writer (idempotent)."""
+        if self._listener is not None:
+            return
+        if self.file_path:
+            target: logging.Handler = logging.FileHandler(self.file_path)
+        else:
+            target = logging.StreamHandler(sys.stderr)
+        target.setFormatter(logging.Formatter("%(message)s"))
+        record_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._logger.handlers = [_DroppingQueueHandler(record_queue)]
+        self._listener = QueueListener(record_queue, target)
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Flush pending records and stop the writer."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+        self._logger.handlers = []
+
+    async def watch(self, redis_client, interval: float = 10.0) -> None:
+        """Poll DEBUG_TRACE_KEY and apply the sample rate it holds."""
+        while True:
+            try:
+                value = await redis_client.get(DEBUG_TRACE_KEY)
+                if value is None:
+                    self.set_sample_rate(self.default_sample_rate)
+                else:
+                    if isinstance(value, bytes):
+                        value = value.decode()
+                    self.set_sample_rate(float(value))
+            except ValueError:
+                logger.warning("Invalid debug trace sample rate", key=DEBUG_TRACE_KEY)
+            except Exception as e:
+                logger.warning("Failed to read debug trace setting", error=str(e))
+            await asyncio.sleep(interval)
@@ -0,0 +1,82 @@
+"""Startup profiling: per-module import time and per-stage durations.
+
+Uses only the standard library so it can be installed before any other
+import in ``main.py``. Import time is measured by wrapping
+``builtins.__import__``; each newly imported module is charged its self time
+(nested imports excluded), so the figures add up to the total import time.
+Modules first loaded by relative imports or ``from pkg import submodule``
+are charged to the importing module.
+"""
+
+import builtins
+import sys
+import time
+from typing import Any
+
+
+class StartupProfiler:
+    """Collects import and stage timings from process start until ready."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self._last_mark = self.started_at
+        self.import_times: dict[str, float] = {}
+        self.stage_times: dict[str, float] = {}
+        self._original_import: Any = None
+        # Time spent in nested imports, one slot per import in progress
+        self._child_times: list[float] = []
+
+    def start_import_tracking(self) -> None:
+        if self._original_import is not None:
+            return
+        original = builtins.__import__
+        self._original_import = original
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            self._child_times.append(0.0)
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = self._child_times.pop()
+                self.import_times[name] = (
+                    self.import_times.get(name, 0.0) + elapsed - children
+                )
+                if self._child_times:
+                    self._child_times[-1] += elapsed
+
+        builtins.__import__ = timed_import
+
+    def stop_import_tracking(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def mark(self, stage: str) -> float:
+        """Record the time since the previous mark as ``stage``."""
+        now = time.perf_counter()
+        elapsed = now - self._last_mark
+        self._last_mark = now
+        self.stage_times[stage] = self.stage_times.get(stage, 0.0) + elapsed
+        return elapsed
+
+    def imports_by_package(self) -> dict[str, float]:
+        """Import self time summed per top-level package."""
+        packages: dict[str, float] = {}
+        for name, seconds in self.import_times.items():
+            package = name.partition(".")[0]
+            packages[package] = packages.get(package, 0.0) + seconds
+        return packages
+
+    def summary(self, limit: int = 15) -> dict[str, Any]:
+        """Total, per-stage and slowest-import timings, rounded for logging."""
+        slowest = sorted(self.import_times.items(), key=lambda i: i[1], reverse=True)
+        return {
+            "total_seconds": round(time.perf_counter() - self.started_at, 3),
+            "import_seconds": round(sum(self.import_times.values()), 3),
+            "stages": {k: round(v, 3) for k, v in self.stage_times.items()},
+            "slowest_imports": {k: round(v, 3) for k, v in slowest[:limit]},
+        }
@@ -0,0 +1,65 @@
+"""Fixtures for the hot-path micro-benchmarks.
+
+Histories follow the shape of real conversations: user messages, plain
+answers and tool round trips (an AIMessage with a tool call followed by its
+ToolMessage), with Cyrillic text like production traffic.
+"""
+
+import importlib.util
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+# The benchmarks need the pytest-benchmark plugin (test dependency group);
+# without it they are not collected rather than failing on the fixture
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+HISTORY_SIZES = [10, 100, 1000]
+
+USER_TEXT = "Напомни мне завтра в 9 утра позвонить в банк и уточнить платёж. " * 2
+ASSISTANT_TEXT = (
+    "Хорошо, я создал напоминание на завтра, 09:00. Если нужно, могу "
+    "добавить событие в календарь или перенести время. "
+) * 3
+TOOL_RESULT = '{"status": "ok", "reminder_id": 42, "trigger_at": "09:00"}'
+
+
+def make_history(size: int) -> list[BaseMessage]:
+    """``size`` messages of valid history; every fourth turn calls a tool."""
+    messages: list[BaseMessage] = []
+    turn = 0
+    while len(messages) < size:
+        messages.append(HumanMessage(content=USER_TEXT, id=f"h{turn}"))
+        if turn % 4 == 3:
+            call_id = f"call_{turn}"
+            messages.append(
+                AIMessage(
+                    content="",
+                    id=f"t{turn}",
+                    tool_calls=[
+                        {"name": "reminder", "args": {"time": "09:00"}, "id": call_id}
+                    ],
+                )
+            )
+            messages.append(
+                ToolMessage(
+                    content=TOOL_RESULT,
+                    tool_call_id=call_id,
+                    name="reminder",
+                    id=f"r{turn}",
+                )
+            )
+        messages.append(AIMessage(content=ASSISTANT_TEXT, id=f"a{turn}"))
+        turn += 1
+    return messages[:size]
+
+
+@pytest.fixture(params=HISTORY_SIZES, ids=lambda size: f"{size}msgs")
+def history_size(request) -> int:
+    return request.param
+
+
+@pytest.fixture
+def history(history_size) -> list[BaseMessage]:
+    return make_history(history_size)
@@ -0,0 +1,110 @@
+"""Micro-benchmarks for code that runs on every model step.
+
+Not part of the unit run (tests/unit). To measure, and to compare against
+the recorded baseline in ``tests/benchmarks/baselines``::
+
+    pytest tests/benchmarks --no-cov \\
+        --benchmark-storage=tests/benchmarks/baselines \\
+        --benchmark-compare --benchmark-compare-fail=median:20%
+
+Re-record the baseline with ``--benchmark-save=baseline`` instead of the
+compare options; add ``--benchmark-disable`` to run each benchmark once,
+untimed, as a smoke test.
+"""
+
+from langchain.agents.middleware import ModelRequest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from shared_models import AssistantResponseMessage, QueueMessage
+
+from assistants.langgraph.middleware.dynamic_prompt import DynamicPromptMiddleware
+from assistants.langgraph.middleware.summarization import SummarizationMiddleware
+from assistants.langgraph.reducers import custom_message_reducer
+from assistants.langgraph.utils.token_counter import count_tokens
+
+SYSTEM_PROMPT_TEMPLATE = (
+    "Ты — персональный секретарь пользователя. Отвечай кратко и по делу, "
+    "используй инструменты для напоминаний и календаря.\n\n"
+    * 10
+    + "Что известно о пользователе:\n{memories}\n\n"
+    "Краткое содержание предыдущего диалога:\n{summary_previous}"
+)
+MEMORIES = [
+    {"text": f"Пользователь предпочитает встречи после обеда (факт {i})."}
+    for i in range(5)
+]
+SUMMARY = "Пользователь обсуждал перенос встречи с банком и просил напоминания. " * 8
+
+
+def test_custom_message_reducer(benchmark, history):
+    # One model step appends a couple of messages to the existing history
+    left, right = history[:-2], history[-2:]
+
+    result = benchmark(custom_message_reducer, left, right)
+
+    assert len(result) == len(history)
+
+
+def test_count_tokens(benchmark, history):
+    assert benchmark(count_tokens, history) > 0
+
+
+def test_dynamic_prompt_formatting(benchmark, history):
+    middleware = DynamicPromptMiddleware(SYSTEM_PROMPT_TEMPLATE)
+    request = ModelRequest(
+        model=FakeListChatModel(responses=["ok"]),
+        messages=history,
+        state={
+            "messages": history,
+            "relevant_memories": MEMORIES,
+            "current_summary_content": SUMMARY,
+        },
+    )
+
+    result = benchmark(middleware.wrap_model_call, request, lambda r: r)
+
+    assert SUMMARY in result.messages[-1].content
+
+
+def test_summarization_json_chunk(benchmark, history):
+    chunk = benchmark(SummarizationMiddleware._make_json_chunk, history)
+
+    assert chunk.startswith("[")
+
+
+def test_queue_message_round_trip(benchmark, history_size):
+    messages = [
+        QueueMessage(
+            user_id=i,
+            content=f"Сообщение {i}: напомни позвонить в банк завтра утром",
+            metadata={"chat_id": i, "username": f"user{i}", "source": "telegram"},
+            correlation_id=f"bench-{i}",
+        )
+        for i in range(history_size)
+    ]
+
+    def round_trip():
+        return [QueueMessage.model_validate_json(m.model_dump_json()) for m in messages]
+
+    assert benchmark(round_trip) == messages
+
+
+def test_assistant_response_round_trip(benchmark, history_size):
+    responses = [
+        AssistantResponseMessage(
+            user_id=i,
+            status="success",
+            response="Хорошо, напоминание создано на завтра, 09:00. " * 4,
+            correlation_id=f"bench-{i}",
+            chat_id=i,
+            metadata={"source": "telegram"},
+        )
+        for i in range(history_size)
+    ]
+
+    def round_trip():
+        return [
+            AssistantResponseMessage.model_validate_json(r.model_dump_json())
+            for r in responses
+        ]
+
+    assert benchmark(round_trip) == responses
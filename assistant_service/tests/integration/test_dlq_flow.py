@@ -32,9 +32,6 @@ async def clean_streams(redis_client):
 
     # Clean before test
     await redis_client.delete(test_input, test_output, dlq_stream)
-    # Clean retry keys
-    async for key in redis_client.scan_iter("msg_retry:*"):
-        await redis_client.delete(key)
 
     yield {
         "input": test_input,
@@ -44,8 +41,6 @@ async def clean_streams(redis_client):
 
     # Clean after test
     await redis_client.delete(test_input, test_output, dlq_stream)
-    async for key in redis_client.scan_iter("msg_retry:*"):
-        await redis_client.delete(key)
 
 
 class TestRedisStreamDLQFlow:
@@ -208,82 +203,69 @@ class TestOrchestratorRetryWithRedis:
             orchestrator.output_stream = AsyncMock()
             yield orchestrator
 
-    async def test_retry_count_increments_in_redis(
-        self, mock_orchestrator, redis_client
-    ):
-        """Test that retry count is correctly stored and incremented in Redis."""
-        message_id = "test-msg-retry-123"
-
-        # Initial count should be 0
-        count = await mock_orchestrator._get_message_retry_count(message_id)
-        assert count == 0
-
-        # Increment and verify
-        new_count = await mock_orchestrator._increment_message_retry_count(message_id)
-        assert new_count == 1
+    async def test_delivery_count_increments_on_reclaim(self, mock_orchestrator):
+        """Each reclaim of a pending entry bumps its delivery count."""
+        stream = mock_orchestrator.input_stream
+        message_id = await stream.add(b"payload")
 
-        # Verify stored value
-        count = await mock_orchestrator._get_message_retry_count(message_id)
-        assert count == 1
-
-        # Increment again
-        new_count = await mock_orchestrator._increment_message_retry_count(message_id)
-        assert new_count == 2
-
-        # Clear and verify
-        await mock_orchestrator._clear_message_retry_count(message_id)
-        count = await mock_orchestrator._get_message_retry_count(message_id)
-        assert count == 0
+        for attempt in range(1, MAX_RETRIES + 1):
+            entry = await stream.read(block_ms=10, idle_reclaim_ms=0)
+            assert entry is not None
+            read_id, _, delivery_count = entry
+            assert read_id == message_id
+            assert delivery_count == attempt
 
     async def test_message_goes_to_dlq_after_max_retries(
         self, mock_orchestrator, redis_client, clean_streams
     ):
         """Test full flow: message fails MAX_RETRIES times and goes to DLQ."""
         payload = b'{"content": "will fail", "user_id": "user-99"}'
+        stream = mock_orchestrator.input_stream
+        await stream.add(payload)
 
-        # Create a real message in the stream to get a valid message ID
-        message_id = await mock_orchestrator.input_stream.add(payload)
-        message_id_str = (
-            message_id.decode() if isinstance(message_id, bytes) else message_id
-        )
-
-        # Simulate MAX_RETRIES-1 failures (message stays in pending)
+        # Each failed delivery stays pending and is reclaimed for the next try
         for i in range(MAX_RETRIES - 1):
+            message_id, _, delivery_count = await stream.read(
+                block_ms=10, idle_reclaim_ms=0
+            )
+            assert delivery_count == i + 1
             await mock_orchestrator._handle_processing_failure(
-                message_id=message_id_str,
+                message_id=message_id,
                 raw_payload=payload,
                 error=ValueError(f"Failure attempt {i + 1}"),
                 event=None,
+                delivery_count=delivery_count,
             )
 
             # Verify message is NOT in DLQ yet
-            dlq_len = await mock_orchestrator.input_stream.get_dlq_length()
+            dlq_len = await stream.get_dlq_length()
             assert dlq_len == 0, f"Message went to DLQ too early at attempt {i + 1}"
 
-            # Verify retry count
-            count = await mock_orchestrator._get_message_retry_count(message_id_str)
-            assert count == i + 1
-
         # Final failure - should go to DLQ
+        message_id, _, delivery_count = await stream.read(
+            block_ms=10, idle_reclaim_ms=0
+        )
+        assert delivery_count == MAX_RETRIES
         await mock_orchestrator._handle_processing_failure(
-            message_id=message_id_str,
+            message_id=message_id,
             raw_payload=payload,
             error=ValueError(f"Final failure attempt {MAX_RETRIES}"),
             event=None,
+            delivery_count=delivery_count,
         )
 
         # Verify message IS in DLQ
-        dlq_len = await mock_orchestrator.input_stream.get_dlq_length()
+        dlq_len = await stream.get_dlq_length()
         assert dlq_len == 1, "Message should be in DLQ after MAX_RETRIES"
 
         # Verify DLQ message contents
-        dlq_messages = await mock_orchestrator.input_stream.read_dlq()
+        dlq_messages = await stream.read_dlq()
         assert len(dlq_messages) == 1
 
         _, fields = dlq_messages[0]
         assert fields.get(b"error_type").decode() == "ValueError"
         assert fields.get(b"retry_count").decode() == str(MAX_RETRIES)
 
-        # Verify retry count was cleared
-        count = await mock_orchestrator._get_message_retry_count(message_id_str)
-        assert count == 0, "Retry count should be cleared after DLQ"
+        # The original entry is acknowledged, so nothing is left pending
+        pending = await redis_client.xpending(clean_streams["input"], "test_group")
+        assert pending["pending"] == 0
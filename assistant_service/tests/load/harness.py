@@ -0,0 +1,380 @@
+"""Offline load test for the assistant_service message pipeline.
+
+Runs the real ``AssistantOrchestrator`` (stream reading, coalescing, agent,
+middleware, response publishing) against fakeredis or a local Redis, a fake
+chat model and in-process rest_service/rag_service stubs (see ``stubs``).
+Synthetic users send messages at a target rate (Poisson arrivals); the
+report covers throughput, queue wait, end-to-end and per-stage latency
+percentiles and memory growth, and is written as JSON so a later run can
+be compared against it.
+
+Run from ``assistant_service/``::
+
+    PYTHONPATH=src:../shared_models/src python -m tests.load.harness \\
+        --users 50 --rate 10 --duration 60 --output load-baseline.json
+
+    # later: fail (exit 1) if p95 latencies or throughput regressed by >20%
+    PYTHONPATH=src:../shared_models/src python -m tests.load.harness \\
+        --users 50 --rate 10 --duration 60 --compare load-baseline.json
+
+Without ``--redis-url`` the ``fakeredis`` package must be installed.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import structlog
+
+from .stubs import FakeChatModel, Latency, StubServices
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class LoadConfig:
+    users: int = 20
+    rate: float = 5.0  # messages per second across all users
+    duration: float = 30.0  # seconds of message production
+    llm_latency_ms: float = 800.0
+    tool_call_ratio: float = 0.3
+    rest_latency_ms: float = 5.0
+    rag_latency_ms: float = 30.0
+    drain_timeout: float = 60.0  # seconds to wait for outstanding responses
+    redis_url: str | None = None
+    seed: int = 1
+    log_level: str = "WARNING"
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """Nearest-rank percentiles, mean and max, in milliseconds."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {
+        f"p{p}": ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+        for p in PERCENTILES
+    }
+    result["mean"] = sum(ordered) / len(ordered)
+    result["max"] = ordered[-1]
+    return {key: round(value * 1000, 2) for key, value in result.items()}
+
+
+def rss_mb() -> float:
+    """Current resident set size; peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_kb / 1024
+
+
+def _configure_env(log_level: str) -> None:
+    """Settings are read at import time, so set them before importing src.
+
+    Service logs go to stderr at ``log_level`` so stdout holds only the
+    report (and per-message logging does not dominate the timings).
+    """
+    os.environ.setdefault("OPENAI_API_KEY", "load-test")
+    os.environ.setdefault("INPUT_QUEUE", "load_test:to_secretary")
+    os.environ.setdefault("OUTPUT_QUEUE", "load_test:to_telegram")
+    os.environ.setdefault("STREAM_CONSUMER", "load_test")
+    level = getattr(logging, log_level.upper(), logging.WARNING)
+    logging.basicConfig(stream=sys.stderr, level=level)
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.dev.ConsoleRenderer(colors=False),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.PrintLoggerFactory(sys.stderr),
+    )
+
+
+async def _redis_client(redis_url: str | None) -> Any:
+    if redis_url:
+        import redis.asyncio as redis
+
+        client = redis.from_url(redis_url, decode_responses=False)
+    else:
+        try:
+            import fakeredis
+        except ImportError:
+            sys.exit("Install fakeredis or pass --redis-url")
+
+        class BlockingFakeRedis(fakeredis.FakeAsyncRedis):
+            """fakeredis ignores BLOCK on multi-stream XREADGROUP, which
+            would make the idle listener spin; poll until data or timeout."""
+
+            async def xreadgroup(self, *args, block=None, **kwargs):
+                deadline = time.monotonic() + (block or 0) / 1000
+                while True:
+                    entries = await super().xreadgroup(*args, **kwargs)
+                    if entries and any(messages for _, messages in entries):
+                        return entries
+                    if block is None or time.monotonic() >= deadline:
+                        return entries
+                    await asyncio.sleep(0.005)
+
+        client = BlockingFakeRedis(decode_responses=False)
+    await client.flushdb()
+    return client
+
+
+async def run_load(config: LoadConfig) -> dict[str, Any]:
+    """Drive synthetic users through the orchestrator and report timings."""
+    _configure_env(config.log_level)
+    from shared_models import QueueMessage
+
+    import orchestrator as orchestrator_module
+    from assistants.langgraph.langgraph_assistant import LangGraphAssistant
+    from config.settings import get_settings
+
+    rng = random.Random(config.seed)
+    settings = get_settings()
+    stubs = StubServices(
+        settings.REST_SERVICE_URL,
+        settings.RAG_SERVICE_URL,
+        rest_latency=Latency(config.rest_latency_ms / 1000),
+        rag_latency=Latency(config.rag_latency_ms / 1000),
+        rng=rng,
+    )
+    transport = stubs.transport()
+    redis_client = await _redis_client(config.redis_url)
+
+    class StubbedAsyncClient(httpx.AsyncClient):
+        def __init__(self, *args, **kwargs):
+            kwargs["transport"] = transport
+            super().__init__(*args, **kwargs)
+
+    def fake_llm(assistant) -> FakeChatModel:
+        return FakeChatModel(
+            latency=Latency(config.llm_latency_ms / 1000),
+            tool_call_ratio=config.tool_call_ratio,
+            rng=rng,
+            callbacks=[assistant.metrics_callback],
+        )
+
+    processed: list[dict[str, Any]] = []
+    observe_original = orchestrator_module.observe_message_processed
+
+    def observe(source, status, duration, stage_timings=None):
+        processed.append(
+            {"status": status, "duration": duration, "stages": dict(stage_timings)}
+        )
+        observe_original(source, status, duration, stage_timings)
+
+    with ExitStack() as stack:
+        stack.enter_context(patch("httpx.AsyncClient", StubbedAsyncClient))
+        stack.enter_context(
+            patch.object(
+                orchestrator_module,
+                "redis",
+                SimpleNamespace(Redis=lambda **_: redis_client),
+            )
+        )
+        stack.enter_context(
+            patch.object(LangGraphAssistant, "_initialize_llm", fake_llm)
+        )
+        stack.enter_context(
+            patch.object(orchestrator_module, "observe_message_processed", observe)
+        )
+        service = orchestrator_module.AssistantOrchestrator(settings)
+        return await _drive(config, service, QueueMessage, stubs, processed, rng)
+
+
+async def _drive(config, service, queue_message_cls, stubs, processed, rng):
+    sent: dict[str, float] = {}
+    queue_waits: list[float] = []
+    dispatch = service._dispatch_event
+
+    async def timed_dispatch(event):
+        # Message timestamps are serialized to whole seconds, so measure from
+        # the moment the producer wrote the entry
+        sent_at = sent.get(getattr(event, "correlation_id", None))
+        if sent_at is not None:
+            queue_waits.append(time.time() - sent_at)
+        return await dispatch(event)
+
+    service._dispatch_event = timed_dispatch
+
+    received: dict[str, float] = {}
+    errors = 0
+    memory = {"start": rss_mb(), "peak": rss_mb()}
+    all_received = asyncio.Event()
+    producing_done = False
+
+    async def produce() -> None:
+        nonlocal producing_done
+        total = int(config.rate * config.duration)
+        start = time.monotonic()
+        next_at = 0.0
+        for i in range(total):
+            next_at += rng.expovariate(config.rate)
+            await asyncio.sleep(max(0.0, start + next_at - time.monotonic()))
+            user_id = rng.randint(1, config.users)
+            correlation_id = f"load-{i}"
+            message = queue_message_cls(
+                user_id=user_id,
+                content=f"Message {i}: what time is it in Moscow?",
+                metadata={"chat_id": user_id, "source": "telegram"},
+                timestamp=datetime.now(UTC),
+                correlation_id=correlation_id,
+            )
+            sent[correlation_id] = time.time()
+            await service.input_stream.add(message.model_dump_json())
+        producing_done = True
+
+    async def collect() -> None:
+        nonlocal errors
+        last_id = "0-0"
+        stream = service.settings.OUTPUT_QUEUE
+        while True:
+            entries = await service.redis.xread({stream: last_id}, block=200)
+            for _, messages in entries or []:
+                for entry_id, fields in messages:
+                    last_id = entry_id
+                    data = json.loads(fields[b"payload"])
+                    if data.get("partial"):
+                        continue
+                    if data.get("status") != "success":
+                        errors += 1
+                    received[data.get("correlation_id")] = time.time()
+            if producing_done and len(received) >= len(sent):
+                all_received.set()
+
+    async def sample_memory() -> None:
+        while True:
+            memory["peak"] = max(memory["peak"], rss_mb())
+            await asyncio.sleep(0.5)
+
+    tasks = [
+        asyncio.create_task(service.listen_for_messages()),
+        asyncio.create_task(collect()),
+        asyncio.create_task(sample_memory()),
+    ]
+    started = time.time()
+    try:
+        await produce()
+        try:
+            await asyncio.wait_for(all_received.wait(), timeout=config.drain_timeout)
+        except TimeoutError:
+            pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await service.factory.close()
+        await service.redis.aclose()
+
+    finished = max(received.values(), default=time.time())
+    memory["end"] = rss_mb()
+    memory["peak"] = max(memory["peak"], memory["end"])
+    stages: dict[str, list[float]] = {}
+    for item in processed:
+        for stage, seconds in item["stages"].items():
+            stages.setdefault(stage, []).append(seconds)
+
+    return {
+        "config": asdict(config),
+        "generated_at": datetime.now(UTC).isoformat(),
+        "messages": {
+            "sent": len(sent),
+            "completed": len(received),
+            "errors": errors,
+            "agent_turns": len(processed),
+            "missing": len(set(sent) - set(received)),
+        },
+        "throughput_per_second": round(len(received) / (finished - started), 3),
+        "latency_ms": {
+            "end_to_end": percentiles(
+                [received[cid] - sent[cid] for cid in received if cid in sent]
+            ),
+            "queue_wait": percentiles(queue_waits),
+            "processing": percentiles([item["duration"] for item in processed]),
+        },
+        "stages_ms": {stage: percentiles(values) for stage, values in stages.items()},
+        "memory_mb": {
+            "start": round(memory["start"], 1),
+            "end": round(memory["end"], 1),
+            "peak": round(memory["peak"], 1),
+            "growth": round(memory["end"] - memory["start"], 1),
+        },
+        "requests": {
+            "handled": dict(stubs.requests),
+            "unhandled": dict(stubs.unhandled),
+        },
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float = 0.2
+) -> list[str]:
+    """Regressions of p95 latencies and throughput beyond ``tolerance``."""
+    regressions = []
+    pairs = [
+        (f"latency_ms.{name}", baseline["latency_ms"].get(name), stats)
+        for name, stats in current["latency_ms"].items()
+    ] + [
+        (f"stages_ms.{name}", baseline["stages_ms"].get(name), stats)
+        for name, stats in current["stages_ms"].items()
+    ]
+    for label, before, after in pairs:
+        if not before or not after or not before.get("p95"):
+            continue
+        if after["p95"] > before["p95"] * (1 + tolerance):
+            regressions.append(f"{label} p95 {before['p95']} -> {after['p95']} ms")
+    before_rate = baseline.get("throughput_per_second") or 0
+    after_rate = current.get("throughput_per_second") or 0
+    if before_rate and after_rate < before_rate * (1 - tolerance):
+        regressions.append(f"throughput {before_rate} -> {after_rate} msg/s")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    for field, value in asdict(defaults).items():
+        parser.add_argument(
+            f"--{field.replace('_', '-')}",
+            type=type(value) if value is not None else str,
+            default=value,
+        )
+    parser.add_argument("--output", type=Path, help="Write the report here")
+    parser.add_argument("--compare", type=Path, help="Baseline report to check")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(**{field: getattr(args, field) for field in asdict(defaults)})
+    report = asyncio.run(run_load(config))
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text()), report)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
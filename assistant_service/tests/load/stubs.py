@@ -0,0 +1,286 @@
+"""Stand-ins for the services around the orchestrator in load tests.
+
+rest_service and rag_service are served in-process through an
+``httpx.MockTransport`` (every client in the service uses httpx), so the
+real clients, serialization and middleware run unchanged. The chat model is
+a LangChain ``BaseChatModel`` with configurable latency and tool calls.
+"""
+
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import httpx
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+SECRETARY_ID = UUID("00000000-0000-4000-8000-000000000001")
+TIME_TOOL_ID = UUID("00000000-0000-4000-8000-000000000002")
+
+SYSTEM_PROMPT = (
+    "You are a helpful personal secretary. Answer briefly and use the tools "
+    "when the user asks about time.\n\n"
+    "What you know about the user:\n{memories}\n\n"
+    "Conversation summary:\n{summary_previous}"
+)
+
+
+@dataclass
+class Latency:
+    """Mean latency in seconds with uniform +/- ``jitter`` (a fraction)."""
+
+    mean: float
+    jitter: float = 0.2
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean <= 0:
+            return 0.0
+        return max(0.0, rng.uniform(1 - self.jitter, 1 + self.jitter) * self.mean)
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that sleeps like a provider and optionally calls a tool.
+
+    On a user turn it requests the ``time`` tool with probability
+    ``tool_call_ratio``; after a tool result it answers in plain text.
+    """
+
+    latency: Latency
+    tool_call_ratio: float = 0.0
+    rng: random.Random
+    response_words: int = 40
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    @property
+    def _llm_type(self) -> str:
+        return "load_test_fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, *args, **kwargs) -> ChatResult:
+        raise NotImplementedError("FakeChatModel is async only")
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency.sample(self.rng))
+        prompt_tokens = sum(len(str(m.content)) // 4 for m in messages)
+        # The last conversation message; a trailing context message is skipped
+        last = next(
+            (m for m in reversed(messages) if not isinstance(m, SystemMessage)), None
+        )
+
+        if not isinstance(last, ToolMessage) and self.rng.random() < (
+            self.tool_call_ratio
+        ):
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "time",
+                        "args": {"timezone": "Europe/Moscow"},
+                        "id": f"call_{self.rng.getrandbits(48):x}",
+                    }
+                ],
+            )
+        else:
+            message = AIMessage(content=" ".join(["ok"] * self.response_words))
+        completion_tokens = max(1, len(str(message.content)) // 4)
+        message.usage_metadata = {
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _timestamps() -> dict[str, str]:
+    now = datetime.now(UTC).isoformat()
+    return {"created_at": now, "updated_at": now}
+
+
+class StubServices:
+    """In-memory rest_service and rag_service behind one mock transport.
+
+    Messages are stored like rest_service does, so context loading sees the
+    history grow over the run. Unknown routes return 404 and are counted in
+    ``unhandled``.
+    """
+
+    def __init__(
+        self,
+        rest_url: str,
+        rag_url: str,
+        rest_latency: Latency,
+        rag_latency: Latency,
+        rng: random.Random,
+        memories: int = 3,
+    ):
+        self.rest_host = httpx.URL(rest_url).host
+        self.rag_host = httpx.URL(rag_url).host
+        self.rest_latency = rest_latency
+        self.rag_latency = rag_latency
+        self.rng = rng
+        self.memories = memories
+        self.messages: dict[int, dict[str, Any]] = {}
+        self.requests: Counter[str] = Counter()
+        self.unhandled: Counter[str] = Counter()
+        self._created = _timestamps()
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        if host == self.rag_host:
+            await asyncio.sleep(self.rag_latency.sample(self.rng))
+            body = self._rag(request)
+        else:
+            await asyncio.sleep(self.rest_latency.sample(self.rng))
+            body = self._rest(request)
+        route = f"{request.method} {self._route(request.url.path)}"
+        if body is None:
+            self.unhandled[route] += 1
+            return httpx.Response(404, json={"detail": "Not stubbed"})
+        self.requests[route] += 1
+        return httpx.Response(200, json=body)
+
+    @staticmethod
+    def _route(path: str) -> str:
+        """Path with ids replaced, for request counters."""
+        return re.sub(r"/(\d+|[0-9a-f-]{36})(?=/|$)", "/{id}", path)
+
+    # region rest_service
+    def secretary(self) -> dict[str, Any]:
+        return {
+            "id": str(SECRETARY_ID),
+            "name": "load_test_secretary",
+            "is_secretary": True,
+            "model": "fake",
+            "instructions": SYSTEM_PROMPT,
+            "assistant_type": "llm",
+            "is_active": True,
+            "tools": self.tools(),
+            **self._created,
+        }
+
+    def tools(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": str(TIME_TOOL_ID),
+                "name": "time",
+                "tool_type": "time",
+                "description": "Current time in a timezone",
+                "is_active": True,
+                **self._created,
+            }
+        ]
+
+    def _rest(self, request: httpx.Request) -> Any:
+        path = request.url.path.rstrip("/")
+        method = request.method
+
+        if path == "/api/global-settings":
+            return {
+                "id": 1,
+                "summarization_prompt": "Summarize the conversation.",
+                "context_window_size": 16000,
+            }
+        if path == "/api/queue-stats/log":
+            return {}
+        if path == "/api/user-secretaries/assignments":
+            return []
+        if match := re.fullmatch(r"/api/users/(\d+)/secretary", path):
+            return self.secretary()
+        if match := re.fullmatch(r"/api/users/(\d+)", path):
+            return {
+                "id": int(match[1]),
+                "telegram_id": int(match[1]),
+                "username": f"user{match[1]}",
+                **self._created,
+            }
+        if path == f"/api/assistants/{SECRETARY_ID}":
+            return self.secretary()
+        if path == f"/api/assistants/{SECRETARY_ID}/tools":
+            return self.tools()
+        if path == "/api/assistants/versions":
+            return [
+                {"id": str(SECRETARY_ID), "updated_at": self._created["updated_at"]}
+            ]
+        if path == "/api/messages" and method == "POST":
+            return self._create_message(json.loads(request.content))
+        if path == "/api/messages" and method == "GET":
+            return self._list_messages(request.url.params)
+        if match := re.fullmatch(r"/api/messages/(\d+)", path):
+            message = self.messages.get(int(match[1]))
+            if message is not None and method == "PATCH":
+                message.update(json.loads(request.content))
+            return message
+        return None
+
+    def _create_message(self, data: dict[str, Any]) -> dict[str, Any]:
+        message_id = len(self.messages) + 1
+        message = {
+            "content_type": "text",
+            "tool_call_id": None,
+            "status": "active",
+            "meta_data": None,
+            **data,
+            "id": message_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+        self.messages[message_id] = message
+        return message
+
+    def _list_messages(self, params: httpx.QueryParams) -> list[dict[str, Any]]:
+        filters = {
+            key: params[key]
+            for key in ("user_id", "assistant_id", "role", "status")
+            if key in params
+        }
+        id_gt = int(params.get("id_gt", 0) or 0)
+        id_lt = int(params["id_lt"]) if "id_lt" in params else None
+        matched = [
+            m
+            for m in self.messages.values()
+            if all(str(m.get(k)) == v for k, v in filters.items())
+            and m["id"] > id_gt
+            and (id_lt is None or m["id"] < id_lt)
+        ]
+        matched.sort(key=lambda m: m["id"], reverse=params.get("sort_order") == "desc")
+        offset = int(params.get("offset", 0))
+        return matched[offset : offset + int(params.get("limit", 100))]
+
+    # endregion
+
+    # region rag_service
+    def _rag(self, request: httpx.Request) -> Any:
+        path = request.url.path.rstrip("/")
+        if path == "/api/memory/search":
+            return [
+                {
+                    "id": f"00000000-0000-4000-9000-{i:012d}",
+                    "text": f"Synthetic fact number {i} about the user.",
+                    "similarity": 0.9 - i * 0.05,
+                }
+                for i in range(self.memories)
+            ]
+        if path == "/api/memory":
+            return {"id": "00000000-0000-4000-9000-999999999999", **_timestamps()}
+        return None
+
+    # endregion
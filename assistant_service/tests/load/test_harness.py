@@ -0,0 +1,33 @@
+from tests.load.harness import compare, percentiles
+
+
+def test_percentiles_nearest_rank_in_ms():
+    stats = percentiles([i / 1000 for i in range(1, 101)])
+
+    assert stats["p50"] == 51.0
+    assert stats["p95"] == 96.0
+    assert stats["p99"] == 100.0
+    assert stats["max"] == 100.0
+    assert stats["mean"] == 50.5
+    assert percentiles([]) == {}
+
+
+def test_compare_flags_p95_and_throughput_regressions():
+    baseline = {
+        "throughput_per_second": 10.0,
+        "latency_ms": {"end_to_end": {"p95": 1000.0}},
+        "stages_ms": {"llm": {"p95": 800.0}, "rag": {"p95": 50.0}},
+    }
+    current = {
+        "throughput_per_second": 7.0,
+        "latency_ms": {"end_to_end": {"p95": 1100.0}},
+        "stages_ms": {"llm": {"p95": 1000.0}, "tool": {"p95": 5.0}},
+    }
+
+    regressions = compare(baseline, current, tolerance=0.2)
+
+    assert regressions == [
+        "stages_ms.llm p95 800.0 -> 1000.0 ms",
+        "throughput 10.0 -> 7.0 msg/s",
+    ]
+    assert compare(baseline, baseline) == []
@@ -0,0 +1,91 @@
+from langchain.agents.middleware import ModelRequest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from assistants.langgraph.middleware.dynamic_prompt import (
+    CONTEXT_REFERENCE,
+    NO_MEMORIES_TEXT,
+    NO_SUMMARY_TEXT,
+    DynamicPromptMiddleware,
+)
+
+TEMPLATE = "Ты секретарь.\nПамять:\n{memories}\nИстория:\n{summary_previous}"
+
+
+def make_request(memories=None, summary=None) -> ModelRequest:
+    history = [HumanMessage("Привет", id="h1")]
+    return ModelRequest(
+        model=FakeListChatModel(responses=["ok"]),
+        messages=history,
+        state={
+            "messages": history,
+            "relevant_memories": memories,
+            "current_summary_content": summary,
+        },
+    )
+
+
+def build(middleware, request) -> ModelRequest:
+    return middleware.wrap_model_call(request, lambda r: r)
+
+
+def test_system_prompt_is_static_and_context_trails_history():
+    middleware = DynamicPromptMiddleware(TEMPLATE)
+
+    first = build(middleware, make_request([{"text": "любит чай"}], "говорили о банке"))
+    second = build(middleware, make_request([{"text": "живёт в Москве"}], None))
+
+    assert first.system_message.content == second.system_message.content
+    assert CONTEXT_REFERENCE in first.system_message.content
+    assert "любит чай" not in first.system_message.content
+
+    history, context = first.messages[:-1], first.messages[-1]
+    assert [m.id for m in history] == ["h1"]
+    assert isinstance(context, SystemMessage)
+    assert "- любит чай" in context.content
+    assert "говорили о банке" in context.content
+    assert "- живёт в Москве" in second.messages[-1].content
+    assert NO_SUMMARY_TEXT in second.messages[-1].content
+
+
+def test_request_history_and_state_are_not_modified():
+    request = make_request()
+
+    built = build(DynamicPromptMiddleware(TEMPLATE), request)
+
+    assert len(built.messages) == 2
+    assert len(request.messages) == 1
+    assert len(request.state["messages"]) == 1
+
+
+def test_only_sections_used_by_template_are_sent():
+    only_memories = DynamicPromptMiddleware("Ты секретарь.\n{memories}")
+    built = build(only_memories, make_request())
+    assert NO_MEMORIES_TEXT in built.messages[-1].content
+    assert NO_SUMMARY_TEXT not in built.messages[-1].content
+
+    static = DynamicPromptMiddleware("Ты секретарь.")
+    built = build(static, make_request([{"text": "любит чай"}], "сводка"))
+    assert built.system_message.content == "Ты секретарь."
+    assert len(built.messages) == 1
+
+
+def test_inline_mode_formats_context_into_system_prompt():
+    middleware = DynamicPromptMiddleware(TEMPLATE, trailing_context=False)
+
+    built = build(middleware, make_request([{"text": "любит чай"}], "сводка"))
+
+    assert built.system_message.content == (
+        "Ты секретарь.\nПамять:\n- любит чай\nИстория:\nсводка"
+    )
+    assert len(built.messages) == 1
+
+
+def test_template_with_unknown_placeholder_is_used_as_is():
+    template = "Ты секретарь {name}.\n{memories}"
+    middleware = DynamicPromptMiddleware(template)
+
+    built = build(middleware, make_request())
+
+    assert built.system_message.content == template
+    assert NO_MEMORIES_TEXT in built.messages[-1].content
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from shared_models import SingleFlight
+
+from assistants.factory import AssistantFactory
+
+
+class BulkRestClient:
+    def __init__(self, versions=None, fail=False):
+        self.versions = versions or {}
+        self.fail = fail
+        self.bulk_calls = 0
+        self.single_calls = 0
+
+    async def get_assistant_versions(self, assistant_ids):
+        self.bulk_calls += 1
+        if self.fail:
+            raise RuntimeError("endpoint unavailable")
+        return {
+            assistant_id: self.versions[assistant_id]
+            for assistant_id in assistant_ids
+            if assistant_id in self.versions
+        }
+
+    async def get_assistant(self, assistant_id: str):
+        self.single_calls += 1
+        return None
+
+
+def make_factory(rest_client) -> tuple[AssistantFactory, list]:
+    factory: AssistantFactory = AssistantFactory.__new__(AssistantFactory)
+    factory.rest_client = rest_client
+    factory._assistant_cache = {}
+    factory._cache_lock = asyncio.Lock()
+    factory._assistant_creations = SingleFlight()
+    factory._cache_generation = 0
+    reloaded = []
+
+    async def fake_create_assistant(assistant_id, user_id):
+        reloaded.append((assistant_id, user_id))
+
+    factory._create_assistant = fake_create_assistant  # type: ignore[method-assign]
+    return factory, reloaded
+
+
+@pytest.mark.asyncio
+async def test_bulk_revalidation_reloads_only_stale_and_evicts_deleted():
+    now = datetime.now(UTC)
+    fresh, stale, deleted = uuid4(), uuid4(), uuid4()
+    rest_client = BulkRestClient(
+        versions={fresh: now - timedelta(minutes=5), stale: now + timedelta(minutes=5)}
+    )
+    factory, reloaded = make_factory(rest_client)
+    factory._assistant_cache = {
+        (fresh, "1"): (object(), now),
+        (stale, "1"): (object(), now),
+        (stale, "2"): (object(), now),
+        (deleted, "1"): (object(), now),
+    }
+
+    await factory._revalidate_assistant_cache(list(factory._assistant_cache.items()))
+
+    assert rest_client.bulk_calls == 1
+    assert rest_client.single_calls == 0
+    assert sorted(reloaded) == sorted([(stale, "1"), (stale, "2")])
+    assert (deleted, "1") not in factory._assistant_cache
+    assert (fresh, "1") in factory._assistant_cache
+
+
+@pytest.mark.asyncio
+async def test_current_instance_keeps_its_config_load_time():
+    loaded_at = datetime.now(UTC) - timedelta(minutes=10)
+    assistant_id = uuid4()
+    rest_client = BulkRestClient(
+        versions={assistant_id: loaded_at - timedelta(minutes=5)}
+    )
+    factory, reloaded = make_factory(rest_client)
+    instance = object()
+    factory._assistant_cache = {(assistant_id, "1"): (instance, loaded_at)}
+
+    await factory._revalidate_assistant_cache(list(factory._assistant_cache.items()))
+
+    # Not bumped: a change saved during the sweep must still look newer
+    assert factory._assistant_cache[(assistant_id, "1")] == (instance, loaded_at)
+    assert reloaded == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_revalidation_falls_back_to_per_assistant_checks():
+    now = datetime.now(UTC)
+    rest_client = BulkRestClient(fail=True)
+    factory, reloaded = make_factory(rest_client)
+    factory._assistant_cache = {(uuid4(), "1"): (object(), now) for _ in range(2)}
+
+    await factory._revalidate_assistant_cache(list(factory._assistant_cache.items()))
+
+    assert rest_client.single_calls == 2
+    assert reloaded == []
+    assert len(factory._assistant_cache) == 2
@@ -3,6 +3,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+from shared_models import SingleFlight
 
 from assistants.factory import AssistantFactory
 
@@ -25,13 +26,14 @@ async def test_check_and_update_uses_aware_datetimes(monkeypatch):
     factory.logger = factory.logger if hasattr(factory, "logger") else None
     factory._assistant_cache = {}
     factory._cache_lock = asyncio.Lock()
+    factory._assistant_creations = SingleFlight()
 
     called = asyncio.Event()
 
-    async def fake_get_assistant_by_id(_assistant_id, _user_id=None):
+    async def fake_create_assistant(_assistant_id, _user_id):
         called.set()
 
-    factory.get_assistant_by_id = fake_get_assistant_by_id  # type: ignore[attr-defined]
+    factory._create_assistant = fake_create_assistant  # type: ignore[method-assign]
 
     await factory._check_and_update_assistant_cache(
         (uuid4(), "user"), instance=object(), loaded_at=datetime.now(UTC)
@@ -47,14 +49,15 @@ async def test_check_and_update_errors_on_naive():
     factory.logger = factory.logger if hasattr(factory, "logger") else None
     factory._assistant_cache = {}
     factory._cache_lock = asyncio.Lock()
+    factory._assistant_creations = SingleFlight()
 
     called = False
 
-    async def fake_get_assistant_by_id(_assistant_id, _user_id=None):
+    async def fake_create_assistant(_assistant_id, _user_id):
         nonlocal called
         called = True
 
-    factory.get_assistant_by_id = fake_get_assistant_by_id  # type: ignore[attr-defined]
+    factory._create_assistant = fake_create_assistant  # type: ignore[method-assign]
 
     await factory._check_and_update_assistant_cache(
         (uuid4(), "user"), instance=object(), loaded_at=datetime.now()
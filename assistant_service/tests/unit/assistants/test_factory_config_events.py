@@ -0,0 +1,164 @@
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from shared_models import ConfigChangeEvent, ConfigEventType
+from shared_models.enums import AssistantType
+
+from assistants.factory import AssistantFactory
+
+
+def make_factory() -> AssistantFactory:
+    factory: AssistantFactory = AssistantFactory.__new__(AssistantFactory)
+    factory._assistant_cache = {}
+    factory._secretary_assignments = {}
+    factory._cache_lock = asyncio.Lock()
+    factory._cache_generation = 0
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_assignment_changed_updates_assignment_cache():
+    factory = make_factory()
+    old_secretary, new_secretary = uuid4(), uuid4()
+    factory._secretary_assignments[42] = (old_secretary, datetime.now(UTC))
+
+    await factory._apply_config_event(
+        ConfigChangeEvent(
+            event_type=ConfigEventType.ASSIGNMENT_CHANGED,
+            user_id=42,
+            assistant_id=new_secretary,
+        )
+    )
+
+    assert factory._secretary_assignments[42][0] == new_secretary
+
+
+@pytest.mark.asyncio
+async def test_assignment_removed_only_drops_matching_secretary():
+    factory = make_factory()
+    secretary = uuid4()
+    factory._secretary_assignments[1] = (secretary, datetime.now(UTC))
+    factory._secretary_assignments[2] = (secretary, datetime.now(UTC))
+
+    await factory._apply_config_event(
+        ConfigChangeEvent(
+            event_type=ConfigEventType.ASSIGNMENT_REMOVED,
+            user_id=1,
+            assistant_id=uuid4(),  # stale event for another secretary
+        )
+    )
+    await factory._apply_config_event(
+        ConfigChangeEvent(
+            event_type=ConfigEventType.ASSIGNMENT_REMOVED,
+            user_id=2,
+            assistant_id=secretary,
+        )
+    )
+
+    assert 1 in factory._secretary_assignments
+    assert 2 not in factory._secretary_assignments
+
+
+@pytest.mark.asyncio
+async def test_assistant_changed_evicts_all_users_of_assistant():
+    factory = make_factory()
+    changed, other = uuid4(), uuid4()
+    now = datetime.now(UTC)
+    factory._assistant_cache = {
+        (changed, "1"): (object(), now),
+        (changed, "2"): (object(), now),
+        (other, "1"): (object(), now),
+    }
+
+    await factory._apply_config_event(
+        ConfigChangeEvent(
+            event_type=ConfigEventType.ASSISTANT_CHANGED, assistant_id=changed
+        )
+    )
+
+    assert list(factory._assistant_cache) == [(other, "1")]
+
+
+@pytest.mark.asyncio
+async def test_tool_changed_evicts_instances_using_tool():
+    factory = make_factory()
+    tool_id = uuid4()
+    now = datetime.now(UTC)
+    with_tool = SimpleNamespace(tool_definitions=[SimpleNamespace(id=tool_id)])
+    without_tool = SimpleNamespace(tool_definitions=[SimpleNamespace(id=uuid4())])
+    factory._assistant_cache = {
+        (uuid4(), "1"): (with_tool, now),
+        (uuid4(), "2"): (without_tool, now),
+    }
+
+    await factory._apply_config_event(
+        ConfigChangeEvent(event_type=ConfigEventType.TOOL_CHANGED, tool_id=tool_id)
+    )
+
+    remaining = [instance for instance, _ in factory._assistant_cache.values()]
+    assert remaining == [without_tool]
+
+
+@pytest.mark.asyncio
+async def test_creation_overlapping_an_eviction_is_not_cached(mocker):
+    mocker.patch("assistants.factory.LangGraphAssistant", return_value=AsyncMock())
+    factory = make_factory()
+    factory.logger = MagicMock()
+    factory.settings = MagicMock()
+    factory.tool_factory = AsyncMock()
+    factory._get_cached_global_settings = AsyncMock()
+    assistant_id = uuid4()
+    factory.rest_client = AsyncMock()
+    factory.rest_client.get_assistant.return_value = SimpleNamespace(
+        id=assistant_id,
+        name="secretary",
+        model="gpt-x",
+        instructions="",
+        config={},
+        assistant_type=AssistantType.LLM,
+    )
+
+    async def tools_fetched_while_config_changes(_assistant_id):
+        await factory._apply_config_event(
+            ConfigChangeEvent(
+                event_type=ConfigEventType.ASSISTANT_CHANGED,
+                assistant_id=assistant_id,
+            )
+        )
+        return []
+
+    factory.rest_client.get_assistant_tools.side_effect = (
+        tools_fetched_while_config_changes
+    )
+
+    instance = await factory._create_assistant(assistant_id, "1")
+
+    assert instance is not None
+    assert factory._assistant_cache == {}
+
+    factory.rest_client.get_assistant_tools.side_effect = None
+    factory.rest_client.get_assistant_tools.return_value = []
+    await factory._create_assistant(assistant_id, "1")
+
+    assert (assistant_id, "1") in factory._assistant_cache
+
+
+@pytest.mark.asyncio
+async def test_first_subscription_runs_a_full_refresh(mocker):
+    factory = make_factory()
+    factory._redis_client = object()
+    factory._periodic_refresh = AsyncMock()
+
+    async def subscribe(_redis, _handler, on_subscribed):
+        await on_subscribed()
+        raise asyncio.CancelledError
+
+    mocker.patch("assistants.factory.subscribe_config_events", side_effect=subscribe)
+
+    await factory._run_config_event_listener()
+
+    factory._periodic_refresh.assert_awaited_once()
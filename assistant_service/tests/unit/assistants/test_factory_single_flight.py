@@ -0,0 +1,46 @@
+import asyncio
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+import structlog
+from shared_models import SingleFlight
+
+from assistants.factory import AssistantFactory
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_requests_create_one_instance():
+    factory: AssistantFactory = AssistantFactory.__new__(AssistantFactory)
+    factory.logger = structlog.get_logger()
+    factory._assistant_cache = {}
+    factory._cache_lock = asyncio.Lock()
+    factory._assistant_creations = SingleFlight()
+    created = []
+    release = asyncio.Event()
+
+    async def fake_create(assistant_uuid, user_id):
+        await release.wait()
+        instance = object()
+        created.append(instance)
+        factory._assistant_cache[(assistant_uuid, user_id)] = (
+            instance,
+            datetime.now(UTC),
+        )
+        return instance
+
+    factory._create_assistant = fake_create  # type: ignore[method-assign]
+    assistant_id = uuid4()
+
+    requests = [
+        asyncio.create_task(factory.get_assistant_by_id(assistant_id, "user"))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    instances = await asyncio.gather(*requests)
+
+    assert len(created) == 1
+    assert all(instance is created[0] for instance in instances)
+    # Later requests are served from the cache
+    assert await factory.get_assistant_by_id(assistant_id, "user") is created[0]
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+import structlog
+from shared_models import SingleFlight
+
+from assistants.factory import AssistantFactory
+from metrics import config_cache_stale_serves_total
+
+
+class SettingsRestClient:
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def get_global_settings(self):
+        self.calls += 1
+        await self.release.wait()
+        return SimpleNamespace(version=self.calls, model_dump=dict)
+
+
+def make_factory(rest_client) -> AssistantFactory:
+    factory: AssistantFactory = AssistantFactory.__new__(AssistantFactory)
+    factory.logger = structlog.get_logger()
+    factory.rest_client = rest_client
+    factory._redis_cache = None
+    factory._assistant_cache = {}
+    factory._cache_lock = asyncio.Lock()
+    factory._assistant_creations = SingleFlight()
+    factory._global_settings_loads = SingleFlight()
+    factory._refresh_tasks = {}
+    factory._global_settings_cache = None
+    factory._global_settings_last_fetched = None
+    factory._global_settings_cache_ttl = timedelta(minutes=5)
+    factory._global_settings_max_staleness = timedelta(hours=1)
+    return factory
+
+
+def stale_serves(cache: str) -> float:
+    return config_cache_stale_serves_total.labels(cache=cache)._value.get()
+
+
+@pytest.mark.asyncio
+async def test_stale_global_settings_served_while_refreshing():
+    rest_client = SettingsRestClient()
+    factory = make_factory(rest_client)
+    cached = SimpleNamespace(version=0)
+    factory._global_settings_cache = cached
+    factory._global_settings_last_fetched = datetime.now(UTC) - timedelta(minutes=10)
+    rest_client.release.clear()
+    served_before = stale_serves("global_settings")
+
+    # Both callers get the stale value without waiting for REST
+    assert await factory._get_cached_global_settings() is cached
+    assert await factory._get_cached_global_settings() is cached
+    assert stale_serves("global_settings") == served_before + 2
+
+    rest_client.release.set()
+    await asyncio.gather(*factory._refresh_tasks.values())
+
+    assert rest_client.calls == 1
+    refreshed = await factory._get_cached_global_settings()
+    assert refreshed.version == 1
+    assert rest_client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_global_settings_past_max_staleness_are_reloaded():
+    rest_client = SettingsRestClient()
+    factory = make_factory(rest_client)
+    factory._global_settings_cache = SimpleNamespace(version=0)
+    factory._global_settings_last_fetched = datetime.now(UTC) - timedelta(hours=2)
+
+    settings = await factory._get_cached_global_settings()
+
+    assert settings.version == 1
+    assert not factory._refresh_tasks
+
+
+@pytest.mark.asyncio
+async def test_cached_assistant_served_without_rest_calls_at_any_age():
+    rest_client = SettingsRestClient()
+    factory = make_factory(rest_client)
+    cache_key = (uuid4(), "user")
+    instance = object()
+    factory._assistant_cache[cache_key] = (
+        instance,
+        datetime.now(UTC) - timedelta(hours=2),
+    )
+
+    assert await factory.get_assistant_by_id(*cache_key) is instance
+
+    # Freshness comes from config events and the bulk versions sweep
+    assert rest_client.calls == 0
+    assert not factory._refresh_tasks
@@ -0,0 +1,87 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from assistants.factory import AssistantFactory
+
+
+class ActiveUsersRestClient:
+    def __init__(self, user_ids, fail=False):
+        self.user_ids = user_ids
+        self.fail = fail
+        self.limits = []
+        self.since = []
+
+    async def get_active_users(self, limit: int, since=None):
+        self.limits.append(limit)
+        self.since.append(since)
+        if self.fail:
+            raise RuntimeError("rest_service unavailable")
+        return [
+            SimpleNamespace(user_id=user_id, last_message_at=datetime.now(UTC))
+            for user_id in self.user_ids[:limit]
+        ]
+
+
+def make_factory(rest_client) -> tuple[AssistantFactory, dict]:
+    factory: AssistantFactory = AssistantFactory.__new__(AssistantFactory)
+    factory.rest_client = rest_client
+    state = {"running": 0, "peak": 0, "warmed": []}
+
+    async def fake_get_user_secretary(user_id: int):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        if user_id < 0:
+            raise ValueError(f"No secretary assigned for user {user_id}")
+        state["warmed"].append(user_id)
+        return object()
+
+    factory.get_user_secretary = fake_get_user_secretary  # type: ignore[method-assign]
+    return factory, state
+
+
+@pytest.mark.asyncio
+async def test_warm_up_builds_top_users_with_bounded_concurrency():
+    rest_client = ActiveUsersRestClient([1, 2, 3, 4, 5, 6, 7])
+    factory, state = make_factory(rest_client)
+
+    warmed = await factory.warm_up(5, concurrency=2)
+
+    assert warmed == 5
+    assert rest_client.limits == [5]
+    assert rest_client.since == [None]
+    assert sorted(state["warmed"]) == [1, 2, 3, 4, 5]
+    assert state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_up_skips_failures():
+    factory, state = make_factory(ActiveUsersRestClient([1, -2, 3]))
+
+    assert await factory.warm_up(10, concurrency=4) == 2
+    assert sorted(state["warmed"]) == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_tolerates_rest_failure_and_can_be_disabled():
+    rest_client = ActiveUsersRestClient([1], fail=True)
+    factory, _ = make_factory(rest_client)
+
+    assert await factory.warm_up(10, concurrency=4) == 0
+    assert await factory.warm_up(0, concurrency=4) == 0
+    assert rest_client.limits == [10]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_only_asks_for_users_active_within_lookback():
+    rest_client = ActiveUsersRestClient([1])
+    factory, _ = make_factory(rest_client)
+
+    await factory.warm_up(10, concurrency=4, lookback=3600)
+
+    (since,) = rest_client.since
+    assert abs(datetime.now(UTC) - timedelta(hours=1) - since) < timedelta(minutes=1)
@@ -0,0 +1,95 @@
+from uuid import uuid4
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from prometheus_client import REGISTRY
+
+from assistants.langgraph.callbacks import PrometheusCallbackHandler
+from metrics import collect_stage_timings, observe_message_processed
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_llm_call_records_requests_tokens_and_stage():
+    assistant = f"assistant-{uuid4().hex[:8]}"
+    handler = PrometheusCallbackHandler(assistant_name=assistant, model_name="gpt-x")
+    run_id = uuid4()
+    message = AIMessage(
+        content="hi",
+        usage_metadata={"input_tokens": 12, "output_tokens": 5, "total_tokens": 17},
+    )
+
+    with collect_stage_timings() as timings:
+        await handler.on_chat_model_start({}, [[]], run_id=run_id)
+        await handler.on_llm_end(
+            LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id
+        )
+
+    labels = {"assistant": assistant, "model": "gpt-x"}
+    assert sample("llm_requests_total", status="success", **labels) == 1
+    assert sample("llm_tokens_total", type="prompt", **labels) == 12
+    assert sample("llm_tokens_total", type="completion", **labels) == 5
+    assert sample("llm_request_duration_seconds_count", **labels) == 1
+    assert "llm" in timings
+
+
+@pytest.mark.asyncio
+async def test_llm_call_records_cached_prompt_tokens():
+    assistant = f"assistant-{uuid4().hex[:8]}"
+    handler = PrometheusCallbackHandler(assistant_name=assistant, model_name="gpt-x")
+    run_id = uuid4()
+    message = AIMessage(
+        content="hi",
+        usage_metadata={
+            "input_tokens": 2000,
+            "output_tokens": 5,
+            "total_tokens": 2005,
+            "input_token_details": {"cache_read": 1792},
+        },
+    )
+
+    await handler.on_chat_model_start({}, [[]], run_id=run_id)
+    await handler.on_llm_end(
+        LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id
+    )
+
+    labels = {"assistant": assistant, "model": "gpt-x"}
+    assert sample("llm_tokens_total", type="prompt", **labels) == 2000
+    assert sample("llm_tokens_total", type="cached_prompt", **labels) == 1792
+
+
+@pytest.mark.asyncio
+async def test_tool_error_is_counted_with_tool_label():
+    assistant = f"assistant-{uuid4().hex[:8]}"
+    handler = PrometheusCallbackHandler(assistant_name=assistant, model_name="gpt-x")
+    run_id = uuid4()
+
+    await handler.on_tool_start({"name": "calendar"}, "{}", run_id=run_id)
+    await handler.on_tool_error(RuntimeError("boom"), run_id=run_id)
+
+    labels = {"assistant": assistant, "tool_name": "calendar"}
+    assert sample("tool_calls_total", status="error", **labels) == 1
+    assert sample("tool_call_duration_seconds_count", **labels) == 1
+
+
+def test_observe_message_processed_records_stage_breakdown():
+    source = f"source-{uuid4().hex[:8]}"
+
+    observe_message_processed(
+        source=source,
+        status="success",
+        duration=1.5,
+        stage_timings={"llm": 1.0, "rest": 0.2},
+    )
+
+    assert sample("messages_processed_total", source=source, status="success") == 1
+    assert (
+        sample("message_stage_duration_seconds_sum", source=source, stage="llm") == 1.0
+    )
+    assert (
+        sample("message_stage_duration_seconds_count", source=source, stage="rest") == 1
+    )
@@ -0,0 +1,90 @@
+import logging
+
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from assistants.langgraph.reducers import custom_message_reducer
+
+
+def ai_calling(call_id: str, msg_id: str) -> AIMessage:
+    return AIMessage(
+        content="",
+        id=msg_id,
+        tool_calls=[{"name": "time", "args": {}, "id": call_id}],
+    )
+
+
+def tool_result(call_id: str, msg_id: str) -> ToolMessage:
+    return ToolMessage(content="12:00", tool_call_id=call_id, id=msg_id)
+
+
+def ids(messages) -> list[str]:
+    return [m.id for m in messages]
+
+
+def test_append_validates_tail_and_join_with_prefix():
+    state = custom_message_reducer([], [HumanMessage("hi", id="h1")])
+    state = custom_message_reducer(state, [ai_calling("c1", "a1")])
+
+    # The tool result pairs with the last message of the trusted prefix;
+    # the system message and the orphan in the tail are discarded
+    state = custom_message_reducer(
+        state,
+        [
+            tool_result("c1", "t1"),
+            SystemMessage("instructions", id="s1"),
+            tool_result("missing", "t2"),
+            AIMessage("It is noon", id="a2"),
+        ],
+    )
+
+    assert ids(state) == ["h1", "a1", "t1", "a2"]
+
+
+def test_append_trusts_prefix_and_does_not_log_it_again(caplog):
+    # A prefix that full validation would reject is kept as is
+    prefix = [tool_result("c0", "t0"), HumanMessage("hi", id="h1")]
+
+    with caplog.at_level(logging.WARNING):
+        state = custom_message_reducer(prefix, [AIMessage("hello", id="a1")])
+
+    assert ids(state) == ["t0", "h1", "a1"]
+    assert caplog.records == []
+
+
+def test_orphan_at_join_point_is_discarded():
+    state = [HumanMessage("hi", id="h1")]
+
+    state = custom_message_reducer(state, tool_result("c1", "t1"))
+
+    assert ids(state) == ["h1"]
+
+
+def test_replacement_and_removal_revalidate_whole_history():
+    state = custom_message_reducer(
+        [],
+        [HumanMessage("hi", id="h1"), ai_calling("c1", "a1"), tool_result("c1", "t1")],
+    )
+
+    # Replacing the AI message drops its tool call, orphaning the result
+    replaced = custom_message_reducer(state, [AIMessage("plain", id="a1")])
+    assert ids(replaced) == ["h1", "a1"]
+
+    removed = custom_message_reducer(state, [RemoveMessage(id="a1")])
+    assert ids(removed) == ["h1"]
+
+
+def test_duplicate_ids_in_update_are_merged():
+    state = [HumanMessage("hi", id="h1")]
+
+    state = custom_message_reducer(
+        state, [AIMessage("draft", id="a1"), AIMessage("final", id="a1")]
+    )
+
+    assert ids(state) == ["h1", "a1"]
+    assert state[-1].content == "final"
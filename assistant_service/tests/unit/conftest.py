@@ -14,6 +14,17 @@ def mock_settings():
     mock.rest_service_url = "http://mock-rest-service:8000"
     mock.tavily_api_key = "mock_tavily_key"
     mock.RAG_SERVICE_URL = "http://mock-rag-service:8002"
+    mock.DEBUG_TRACE_SAMPLE_RATE = 0.0
+    mock.DEBUG_TRACE_FILE = None
+    mock.STREAMING_ENABLED = False
+    mock.STREAM_PARTIAL_INTERVAL = 1.0
+    mock.STREAM_MAXLEN = 100_000
+    mock.DLQ_MAXLEN = 10_000
+    mock.STREAM_TRIM_INTERVAL = 0
+    mock.INTERACTIVE_LANE_WEIGHT = 4
+    mock.TRIGGER_LANE_WEIGHT = 1
+    mock.COALESCE_WINDOW_MS = 0
+    mock.COALESCE_MAX_MESSAGES = 5
     # Add other necessary settings attributes here
     return mock
 
@@ -0,0 +1,167 @@
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from shared_models import QueueMessage
+
+from orchestrator import AssistantOrchestrator
+from services.redis_stream import MAX_RETRIES
+
+
+def stream_fields(**data) -> dict:
+    return {b"payload": json.dumps(data).encode()}
+
+
+@pytest.fixture
+def orchestrator(mock_settings, mock_factory, mocker):
+    mocker.patch("orchestrator.RestServiceClient")
+    mocker.patch("orchestrator.AssistantFactory", return_value=mock_factory)
+    mock_settings.COALESCE_WINDOW_MS = 500
+    mock_settings.COALESCE_MAX_MESSAGES = 5
+    orchestrator = AssistantOrchestrator(mock_settings)
+    orchestrator.input_stream = AsyncMock()
+    return orchestrator
+
+
+def user_message(content: str, user_id: int = 123, second: int = 0) -> QueueMessage:
+    return QueueMessage(
+        user_id=user_id,
+        content=content,
+        metadata={"chat_id": 456, "source": "telegram"},
+        timestamp=datetime(2026, 1, 1, 9, 0, second, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_collect_burst_gathers_same_user_until_quiet(orchestrator):
+    orchestrator.input_stream.read.side_effect = [
+        ("2-0", stream_fields(user_id=123, content="second"), 1),
+        ("3-0", stream_fields(user_id=123, content="third"), 1),
+        None,
+    ]
+
+    burst = await orchestrator._collect_burst(user_message("first"))
+
+    assert [(m.content, message_id) for m, message_id, _, _ in burst] == [
+        ("second", "2-0"),
+        ("third", "3-0"),
+    ]
+    assert orchestrator.input_stream.read.call_args.kwargs == {"block_ms": 500}
+    assert not orchestrator._pushback
+
+
+@pytest.mark.asyncio
+async def test_collect_burst_stops_at_other_user(orchestrator):
+    other = ("2-0", stream_fields(user_id=999, content="hi"), 1)
+    orchestrator.input_stream.read.side_effect = [other]
+
+    burst = await orchestrator._collect_burst(user_message("first"))
+
+    assert burst == []
+    assert list(orchestrator._pushback) == [(orchestrator.input_stream, *other)]
+
+
+@pytest.mark.asyncio
+async def test_collect_burst_stops_at_redelivered_burst_head(orchestrator):
+    # 5-0 heads a failed burst held in <stream>:bursts; its retry falls due
+    # while a newer turn of the same user is being coalesced
+    retried = ("5-0", stream_fields(user_id=123, content="earlier"), 2)
+    orchestrator.input_stream.read.side_effect = [
+        ("6-0", stream_fields(user_id=123, content="second"), 1),
+        retried,
+    ]
+
+    burst = await orchestrator._collect_burst(user_message("first"))
+
+    assert [message_id for _, message_id, _, _ in burst] == ["6-0"]
+    assert list(orchestrator._pushback) == [(orchestrator.input_stream, *retried)]
+
+    # Its own pass reassembles the held burst
+    orchestrator.input_stream.claim_burst.return_value = [
+        ("7-0", stream_fields(user_id=123, content="held")),
+    ]
+    held = await orchestrator._claim_held_burst("5-0")
+    assert [message_id for _, message_id, _, _ in held] == ["7-0"]
+    orchestrator.input_stream.claim_burst.assert_awaited_once_with("5-0")
+
+
+@pytest.mark.asyncio
+async def test_collect_burst_respects_max_messages(orchestrator):
+    orchestrator.settings.COALESCE_MAX_MESSAGES = 2
+    orchestrator.input_stream.read.return_value = (
+        "2-0",
+        stream_fields(user_id=123, content="more"),
+        1,
+    )
+
+    burst = await orchestrator._collect_burst(user_message("first"))
+
+    assert len(burst) == 1
+    orchestrator.input_stream.read.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_turn_is_one_agent_call(orchestrator, mock_secretary):
+    merged = orchestrator._merge_messages(
+        [user_message("first"), user_message("second", second=5)]
+    )
+
+    await orchestrator._dispatch_event(merged)
+
+    mock_secretary.process_message.assert_awaited_once()
+    lc_message = mock_secretary.process_message.call_args.kwargs["message"]
+    assert lc_message.content == (
+        "(Sent at UTC: 2026-01-01T09:00:00+00:00) first\n"
+        "(Sent at UTC: 2026-01-01T09:00:05+00:00) second"
+    )
+    assert lc_message.metadata["coalesced_parts"] == lc_message.content.split("\n")
+    assert lc_message.metadata["chat_id"] == 456
+
+
+@pytest.mark.asyncio
+async def test_claim_held_burst_parses_held_entries(orchestrator):
+    orchestrator.input_stream.claim_burst.return_value = [
+        ("2-0", stream_fields(user_id=123, content="second")),
+    ]
+
+    held = await orchestrator._claim_held_burst("1-0")
+
+    assert [(m.content, message_id) for m, message_id, _, _ in held] == [
+        ("second", "2-0")
+    ]
+    orchestrator.input_stream.claim_burst.assert_awaited_once_with("1-0")
+
+
+@pytest.mark.asyncio
+async def test_failed_burst_is_held_for_one_retry(orchestrator):
+    orchestrator._handle_processing_failure = AsyncMock()
+
+    await orchestrator._handle_burst_failure(
+        "1-0",
+        [("2-0", 1, b"a"), ("3-0", 1, b"b")],
+        RuntimeError("boom"),
+        user_message("first"),
+        delivery_count=1,
+    )
+
+    orchestrator.input_stream.hold_burst.assert_awaited_once_with("1-0", ["2-0", "3-0"])
+    orchestrator._handle_processing_failure.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_burst_goes_to_dlq_with_its_turn(orchestrator):
+    orchestrator._handle_processing_failure = AsyncMock()
+
+    await orchestrator._handle_burst_failure(
+        "1-0",
+        [("2-0", 1, b"a")],
+        RuntimeError("boom"),
+        user_message("first"),
+        delivery_count=MAX_RETRIES,
+    )
+
+    orchestrator.input_stream.hold_burst.assert_not_awaited()
+    call = orchestrator._handle_processing_failure.call_args.kwargs
+    assert call["message_id"] == "2-0"
+    assert call["delivery_count"] == MAX_RETRIES
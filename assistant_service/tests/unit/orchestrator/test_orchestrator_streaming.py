@@ -0,0 +1,109 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from assistants.langgraph.langgraph_assistant import LangGraphAssistant
+from orchestrator import AssistantOrchestrator
+
+
+class FakeAgent:
+    def __init__(self, events):
+        self.events = events
+
+    async def astream(self, initial_input, config=None, stream_mode=None):
+        for event in self.events:
+            yield event
+
+
+def model_chunk(message_id: str, content: str, node: str = "model"):
+    return (
+        "messages",
+        (AIMessageChunk(id=message_id, content=content), {"langgraph_node": node}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_agent_streams_only_model_node_text():
+    final_state = {"messages": [AIMessage(content="Hello there")]}
+    assistant = SimpleNamespace(
+        metrics_callback=None,
+        agent=FakeAgent(
+            [
+                model_chunk("summary", "Summary text", node="summarize"),
+                model_chunk("m1", "Hel"),
+                model_chunk("m1", "lo there"),
+                ("values", final_state),
+            ]
+        ),
+    )
+    partials = []
+
+    async def on_partial(text):
+        partials.append(text)
+
+    result = await LangGraphAssistant._run_agent(assistant, {}, on_partial)
+
+    assert partials == ["Hel", "Hello there"]
+    assert result is final_state
+
+
+@pytest.mark.asyncio
+async def test_run_agent_restarts_text_for_each_model_reply():
+    assistant = SimpleNamespace(
+        metrics_callback=None,
+        agent=FakeAgent(
+            [
+                model_chunk("m1", "Let me check."),
+                model_chunk("m2", "It is sunny"),
+                ("values", {"messages": []}),
+            ]
+        ),
+    )
+    partials = []
+
+    async def on_partial(text):
+        partials.append(text)
+
+    await LangGraphAssistant._run_agent(assistant, {}, on_partial)
+
+    assert partials == ["Let me check.", "It is sunny"]
+
+
+@pytest.mark.asyncio
+async def test_partial_publisher_throttles_and_marks_events(mock_settings, mocker):
+    mocker.patch("orchestrator.RestServiceClient")
+    mocker.patch("orchestrator.AssistantFactory")
+    mock_settings.STREAM_PARTIAL_INTERVAL = 60
+    orchestrator = AssistantOrchestrator(mock_settings)
+    orchestrator.output_stream = AsyncMock()
+
+    publish = orchestrator._partial_publisher(
+        123, "stream-1", {"chat_id": 456, "source": "telegram"}
+    )
+    await publish("Hel")
+    await publish("Hello")  # Within the interval: dropped
+
+    orchestrator.output_stream.add.assert_awaited_once()
+    event = json.loads(orchestrator.output_stream.add.call_args.args[0])
+    assert event["partial"] is True
+    assert event["stream_id"] == "stream-1"
+    assert event["chat_id"] == 456
+    assert event["response"] == "Hel"
+
+
+@pytest.mark.asyncio
+async def test_streaming_dispatch_passes_callback_and_stream_id(
+    mock_settings, mock_factory, mock_secretary, human_queue_message, mocker
+):
+    mocker.patch("orchestrator.RestServiceClient")
+    mocker.patch("orchestrator.AssistantFactory", return_value=mock_factory)
+    mock_settings.STREAMING_ENABLED = True
+    orchestrator = AssistantOrchestrator(mock_settings)
+
+    response = await orchestrator._dispatch_event(human_queue_message)
+
+    assert callable(mock_secretary.process_message.call_args.kwargs["on_partial"])
+    assert response["stream_id"]
@@ -1,6 +1,6 @@
 """Unit tests for RedisStreamClient DLQ functionality."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -8,13 +8,16 @@ from services.redis_stream import (
     DLQ_SUFFIX,
     MAX_RETRIES,
     RETRY_DELAYS,
+    PriorityStreamReader,
     RedisStreamClient,
 )
 
 
 @pytest.fixture
 def mock_redis():
-    return AsyncMock()
+    client = AsyncMock()
+    client.zrange.return_value = []  # no scheduled retries
+    return client
 
 
 @pytest.fixture
@@ -37,6 +40,11 @@ class TestConstants:
     def test_retry_delays_are_positive(self):
         assert all(d > 0 for d in RETRY_DELAYS)
 
+    def test_every_delay_is_used_before_dlq(self, stream_client):
+        # Deliveries 1..MAX_RETRIES-1 are retried after get_retry_delay(n - 1)
+        delays = [stream_client.get_retry_delay(n - 1) for n in range(1, MAX_RETRIES)]
+        assert delays == RETRY_DELAYS
+
     def test_dlq_suffix(self):
         assert DLQ_SUFFIX == ":dlq"
 
@@ -55,6 +63,191 @@ class TestDLQStreamProperty:
         assert client.dlq_stream == "my_queue:dlq"
 
 
+class TestRead:
+    @pytest.mark.asyncio
+    async def test_new_entry_is_first_delivery(self, stream_client, mock_redis):
+        mock_redis.xreadgroup.return_value = [
+            ("test_stream", [("1-0", {b"payload": b"x"})])
+        ]
+
+        result = await stream_client.read()
+
+        assert result == ("1-0", {b"payload": b"x"}, 1)
+        mock_redis.xautoclaim.assert_not_called()
+        mock_redis.xpending_range.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_entry_carries_delivery_count(
+        self, stream_client, mock_redis
+    ):
+        mock_redis.xreadgroup.return_value = []
+        mock_redis.xautoclaim.return_value = ("0-0", [("2-0", {b"payload": b"y"})], [])
+        mock_redis.xpending_range.return_value = [
+            {"message_id": b"2-0", "consumer": b"c", "times_delivered": 3}
+        ]
+
+        result = await stream_client.read()
+
+        assert result == ("2-0", {b"payload": b"y"}, 3)
+        mock_redis.xpending_range.assert_called_once_with(
+            name="test_stream",
+            groupname="test_group",
+            min="2-0",
+            max="2-0",
+            count=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_idle(self, stream_client, mock_redis):
+        mock_redis.xreadgroup.return_value = []
+        mock_redis.xautoclaim.return_value = ("0-0", [], [])
+
+        assert await stream_client.read() is None
+
+
+class TestDelayedRetries:
+    @pytest.mark.asyncio
+    async def test_schedule_retry_adds_due_time(self, stream_client, mock_redis):
+        with patch("services.redis_stream.time.time", return_value=100.0):
+            await stream_client.schedule_retry("1-0", 2)
+
+        mock_redis.zadd.assert_called_once_with("test_stream:retry", {"1-0": 102.0})
+
+    @pytest.mark.asyncio
+    async def test_due_retry_is_claimed_before_new_messages(
+        self, stream_client, mock_redis
+    ):
+        mock_redis.zrange.return_value = [(b"1-0", 50.0)]
+        mock_redis.zrem.return_value = 1
+        mock_redis.xclaim.return_value = [(b"1-0", {b"payload": b"x"})]
+        mock_redis.xpending_range.return_value = [{"times_delivered": 2}]
+
+        with patch("services.redis_stream.time.time", return_value=100.0):
+            result = await stream_client.read()
+
+        assert result == (b"1-0", {b"payload": b"x"}, 2)
+        mock_redis.zrem.assert_called_once_with("test_stream:retry", b"1-0")
+        mock_redis.xreadgroup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retry_taken_by_another_consumer(self, stream_client, mock_redis):
+        mock_redis.zrange.return_value = [(b"1-0", 50.0)]
+        mock_redis.zrem.return_value = 0
+        mock_redis.xreadgroup.return_value = []
+        mock_redis.xautoclaim.return_value = ("0-0", [], [])
+
+        with patch("services.redis_stream.time.time", return_value=100.0):
+            assert await stream_client.read() is None
+
+        mock_redis.xclaim.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_schedule_is_not_read_on_every_read(self, stream_client, mock_redis):
+        mock_redis.xreadgroup.return_value = [
+            ("test_stream", [(b"2-0", {b"payload": b"x"})])
+        ]
+
+        with patch("services.redis_stream.time.time", return_value=100.0):
+            await stream_client.read()
+            await stream_client.read()
+
+        mock_redis.zrange.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_own_retry_is_claimed_once_due(self, stream_client, mock_redis):
+        mock_redis.xreadgroup.return_value = []
+        mock_redis.xautoclaim.return_value = ("0-0", [], [])
+        with patch("services.redis_stream.time.time", return_value=100.0):
+            await stream_client.read()
+            await stream_client.schedule_retry("1-0", 0.5)
+
+        mock_redis.zrange.return_value = [(b"1-0", 100.5)]
+        mock_redis.zrem.return_value = 1
+        mock_redis.xclaim.return_value = [(b"1-0", {b"payload": b"x"})]
+        mock_redis.xpending_range.return_value = [{"times_delivered": 2}]
+        with patch("services.redis_stream.time.time", return_value=100.6):
+            result = await stream_client.read()
+
+        assert result == (b"1-0", {b"payload": b"x"}, 2)
+
+    @pytest.mark.asyncio
+    async def test_hold_burst_keeps_members_without_counting_a_delivery(
+        self, stream_client, mock_redis
+    ):
+        await stream_client.hold_burst(b"1-0", [b"2-0", "3-0"])
+
+        mock_redis.hset.assert_called_once_with("test_stream:bursts", b"1-0", "2-0,3-0")
+        assert mock_redis.xclaim.call_args.kwargs["message_ids"] == [b"2-0", "3-0"]
+        assert mock_redis.xclaim.call_args.kwargs["justid"] is True
+
+    @pytest.mark.asyncio
+    async def test_claim_burst_skips_acked_members(self, stream_client, mock_redis):
+        mock_redis.hget.return_value = b"2-0,3-0"
+        mock_redis.xclaim.return_value = [
+            (b"2-0", {b"payload": b"x"}),
+            (b"3-0", {}),
+        ]
+
+        assert await stream_client.claim_burst(b"1-0") == [(b"2-0", {b"payload": b"x"})]
+        mock_redis.hdel.assert_called_once_with("test_stream:bursts", b"1-0")
+        assert mock_redis.xclaim.call_args.kwargs["message_ids"] == ["2-0", "3-0"]
+
+    @pytest.mark.asyncio
+    async def test_claim_burst_without_held_entries(self, stream_client, mock_redis):
+        mock_redis.hget.return_value = None
+
+        assert await stream_client.claim_burst(b"1-0") == []
+        mock_redis.xclaim.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_blocks_no_longer_than_next_retry(self, stream_client, mock_redis):
+        mock_redis.zrange.return_value = [(b"1-0", 100.5)]
+        mock_redis.xreadgroup.return_value = []
+        mock_redis.xautoclaim.return_value = ("0-0", [], [])
+
+        with patch("services.redis_stream.time.time", return_value=100.0):
+            await stream_client.read(block_ms=5_000)
+
+        assert mock_redis.xreadgroup.call_args.kwargs["block"] == 500
+        mock_redis.zrem.assert_not_called()
+
+
+class TestStreamCaps:
+    @pytest.mark.asyncio
+    async def test_add_is_unbounded_by_default(self, stream_client, mock_redis):
+        await stream_client.add("payload")
+
+        mock_redis.xadd.assert_called_once_with("test_stream", {"payload": b"payload"})
+
+    @pytest.mark.asyncio
+    async def test_add_applies_approximate_maxlen(self, mock_redis):
+        client = RedisStreamClient(
+            client=mock_redis, stream="s", group="g", consumer="c", maxlen=1000
+        )
+
+        await client.add("payload")
+
+        mock_redis.xadd.assert_called_once_with(
+            "s", {"payload": b"payload"}, maxlen=1000, approximate=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_dlq_uses_its_own_cap(self, mock_redis):
+        client = RedisStreamClient(
+            client=mock_redis,
+            stream="s",
+            group="g",
+            consumer="c",
+            maxlen=1000,
+            dlq_maxlen=10,
+        )
+
+        await client.send_to_dlq("1-0", b"x", {"error_type": "E"}, retry_count=3)
+
+        kwargs = mock_redis.xadd.call_args.kwargs
+        assert kwargs == {"maxlen": 10, "approximate": True}
+
+
 class TestGetRetryCount:
     def test_returns_zero_when_no_count(self):
         assert RedisStreamClient.get_retry_count({}) == 0
@@ -270,3 +463,53 @@ class TestRequeueFromDLQ:
         result = await stream_client.requeue_from_dlq("dlq-msg-2")
 
         assert result == "new-msg-2"
+
+
+class TestPriorityStreamReader:
+    @pytest.fixture
+    def lanes(self, mock_redis):
+        interactive = RedisStreamClient(mock_redis, "in", "g", "c")
+        triggers = RedisStreamClient(mock_redis, "in:triggers", "g", "c")
+        return interactive, triggers
+
+    def test_lane_order_follows_weights(self, lanes):
+        interactive, triggers = lanes
+        reader = PriorityStreamReader([(interactive, 4), (triggers, 1)])
+
+        preferred = [reader._lane_order()[0] for _ in range(10)]
+
+        assert preferred.count(interactive) == 8
+        assert preferred.count(triggers) == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_through_to_lane_with_work(self, lanes):
+        interactive, triggers = lanes
+        interactive.read = AsyncMock(return_value=None)
+        triggers.read = AsyncMock(return_value=("1-0", {b"payload": b"x"}, 1))
+        reader = PriorityStreamReader([(interactive, 4), (triggers, 1)])
+
+        result = await reader.read()
+
+        assert result == (triggers, "1-0", {b"payload": b"x"}, 1)
+        interactive.read.assert_called_once_with(block_ms=None, idle_reclaim_ms=60_000)
+
+    @pytest.mark.asyncio
+    async def test_blocks_on_all_lanes_when_idle(self, lanes, mock_redis):
+        interactive, triggers = lanes
+        interactive.read = AsyncMock(return_value=None)
+        triggers.read = AsyncMock(return_value=None)
+        mock_redis.xreadgroup.return_value = [
+            (b"in:triggers", [("2-0", {b"payload": b"y"})])
+        ]
+        reader = PriorityStreamReader([(interactive, 4), (triggers, 1)])
+
+        result = await reader.read(block_ms=5_000)
+
+        assert result == (triggers, "2-0", {b"payload": b"y"}, 1)
+        kwargs = mock_redis.xreadgroup.call_args.kwargs
+        assert kwargs["streams"] == {"in": ">", "in:triggers": ">"}
+        assert kwargs["block"] == 5_000
+
+    def test_requires_lanes(self):
+        with pytest.raises(ValueError):
+            PriorityStreamReader([])
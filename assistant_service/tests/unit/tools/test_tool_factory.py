@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+from tools.base import BaseTool
+from tools.factory import (
+    CALENDAR_TOOL_CLASSES,
+    SUB_ASSISTANT_TOOL_CLASS,
+    TOOL_CLASSES,
+    load_tool_class,
+)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [*TOOL_CLASSES.values(), *CALENDAR_TOOL_CLASSES.values(), SUB_ASSISTANT_TOOL_CLASS],
+)
+def test_registered_tool_classes_resolve(path):
+    assert issubclass(load_tool_class(path), BaseTool)
+
+
+def test_tool_implementations_are_not_imported_eagerly():
+    code = (
+        "import sys\n"
+        "import tools.factory\n"
+        "print(sorted(m for m in sys.modules"
+        " if m == 'tavily' or m.startswith('tools.') and m.endswith('_tool')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,56 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from utils.debug_trace import DEBUG_TRACE_KEY, DebugTracer
+
+
+def test_disabled_by_default():
+    tracer = DebugTracer()
+
+    assert not tracer.enabled
+    assert not any(tracer.sample() for _ in range(100))
+
+
+def test_full_sample_rate_traces_every_message():
+    tracer = DebugTracer(sample_rate=1.0)
+
+    assert all(tracer.sample() for _ in range(100))
+
+
+def test_sample_rate_is_clamped():
+    tracer = DebugTracer(sample_rate=5)
+    assert tracer.sample_rate == 1.0
+
+    tracer.set_sample_rate(-1)
+    assert tracer.sample_rate == 0.0
+
+
+def test_log_writes_json_lines_through_background_writer(tmp_path):
+    path = tmp_path / "debug.log"
+    tracer = DebugTracer(sample_rate=1.0, file_path=str(path))
+
+    tracer.log("listen_for_messages:after_read", "Received", message_id="1-0")
+    tracer.stop()  # flushes the queue
+
+    record = json.loads(path.read_text().strip())
+    assert record["location"] == "listen_for_messages:after_read"
+    assert record["data"] == {"message_id": "1-0"}
+
+
+@pytest.mark.asyncio
+async def test_watch_applies_and_resets_runtime_rate():
+    tracer = DebugTracer()
+    redis_client = AsyncMock()
+    redis_client.get.side_effect = [b"0.25", None]
+
+    task = asyncio.create_task(tracer.watch(redis_client, interval=0))
+    await asyncio.sleep(0)
+    assert tracer.sample_rate == 0.25
+    await asyncio.sleep(0)
+    task.cancel()
+
+    redis_client.get.assert_called_with(DEBUG_TRACE_KEY)
+    assert tracer.sample_rate == 0.0
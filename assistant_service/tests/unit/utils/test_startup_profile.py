@@ -0,0 +1,49 @@
+import builtins
+import sys
+
+from utils.startup_profile import StartupProfiler
+
+
+def test_import_tracking_charges_self_time_per_module(tmp_path, monkeypatch):
+    (tmp_path / "profiled_outer.py").write_text(
+        "import time\nimport profiled_inner\ntime.sleep(0.02)\n"
+    )
+    (tmp_path / "profiled_inner.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = StartupProfiler()
+
+    profiler.start_import_tracking()
+    try:
+        import profiled_outer  # noqa: F401
+    finally:
+        profiler.stop_import_tracking()
+        sys.modules.pop("profiled_outer", None)
+        sys.modules.pop("profiled_inner", None)
+
+    inner = profiler.import_times["profiled_inner"]
+    outer = profiler.import_times["profiled_outer"]
+    assert inner >= 0.05
+    assert 0.02 <= outer < inner
+    assert profiler.imports_by_package()["profiled_inner"] == inner
+
+
+def test_stop_restores_builtin_import():
+    original = builtins.__import__
+    profiler = StartupProfiler()
+
+    profiler.start_import_tracking()
+    assert builtins.__import__ is not original
+    profiler.stop_import_tracking()
+
+    assert builtins.__import__ is original
+
+
+def test_marks_record_consecutive_stages():
+    profiler = StartupProfiler()
+
+    profiler.mark("imports")
+    profiler.mark("init")
+
+    summary = profiler.summary()
+    assert list(summary["stages"]) == ["imports", "init"]
+    assert summary["total_seconds"] >= sum(summary["stages"].values())
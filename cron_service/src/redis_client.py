@@ -7,7 +7,13 @@ from typing import Any
 import redis
 
 # Импортируем необходимые модели из shared_models
-from shared_models import QueueMessageSource, QueueTrigger, TriggerType
+from shared_models import (
+    QueueMessageSource,
+    QueueTrigger,
+    TriggerType,
+    maxlen_kwargs,
+    trigger_lane,
+)
 
 # from models import CronMessage # Remove old model import
 
@@ -22,6 +28,10 @@ if not OUTPUT_QUEUE:
     logger.critical("Environment variable REDIS_QUEUE_TO_SECRETARY is not set.")
     # Можно либо вызвать sys.exit(1), либо использовать значение по умолчанию
     OUTPUT_QUEUE = "queue:to_secretary"  # Пример значения по умолчанию
+# Reminders go to the trigger lane so they never queue ahead of user messages
+OUTPUT_QUEUE = trigger_lane(OUTPUT_QUEUE)
+# Approximate cap on the stream length; 0 disables it
+STREAM_MAXLEN = int(os.getenv("REDIS_STREAM_MAXLEN", "100000"))
 
 redis_client = redis.Redis(
     host=REDIS_HOST,
@@ -113,6 +123,7 @@ def send_reminder_trigger(reminder_data: dict[str, Any]) -> None:
         redis_client.xadd(
             name=OUTPUT_QUEUE,
             fields={"payload": message_json.encode("utf-8")},
+            **maxlen_kwargs(STREAM_MAXLEN),
         )
 
         logger.info(
@@ -42,5 +42,6 @@ class Settings(BaseSettings):
 
     # Queue names
     REDIS_QUEUE_TO_SECRETARY: str
+    REDIS_STREAM_MAXLEN: int = 100_000  # approximate MAXLEN on XADD; 0 disables
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
@@ -5,7 +5,13 @@ import structlog
 
 # Import new models and remove old ones
 # from shared_models import HumanQueueMessage, QueueMessageSource, ToolQueueMessage
-from shared_models import QueueMessageSource, QueueTrigger, TriggerType
+from shared_models import (
+    QueueMessageSource,
+    QueueTrigger,
+    TriggerType,
+    maxlen_kwargs,
+    trigger_lane,
+)
 
 from config.settings import Settings
 
@@ -23,6 +29,8 @@ class RedisService:
             db=settings.REDIS_DB,
             decode_responses=False,  # Keep False for sending JSON bytes
         )
+        # Triggers use their own lane so they never delay user messages
+        self.queue = trigger_lane(settings.REDIS_QUEUE_TO_SECRETARY)
 
     async def send_to_assistant(
         self,
@@ -56,13 +64,14 @@ class RedisService:
                 trigger_type=trigger_type.value,
                 source=source.value,
                 payload_preview=str(payload)[:100],
-                queue=self.settings.REDIS_QUEUE_TO_SECRETARY,
+                queue=self.queue,
             )
 
             # Push the JSON string (as bytes) to Redis
             await self.redis.xadd(
-                name=self.settings.REDIS_QUEUE_TO_SECRETARY,
+                name=self.queue,
                 fields={"payload": message_json.encode("utf-8")},
+                **maxlen_kwargs(self.settings.REDIS_STREAM_MAXLEN),
             )
 
             logger.info("QueueTrigger sent successfully")
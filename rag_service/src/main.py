@@ -1,8 +1,14 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import Response
-from shared_models import LogEventType, configure_logging, get_logger
+from shared_models import (
+    LogEventType,
+    clear_correlation_id,
+    configure_logging,
+    get_logger,
+    set_correlation_id,
+)
 
 from api.memory_routes import router as memory_router
 from api.routes import router
@@ -35,6 +41,19 @@ app = FastAPI(
 # Add metrics middleware
 app.add_middleware(PrometheusMiddleware)
 
+
+@app.middleware("http")
+async def correlation_id_middleware(request: Request, call_next):
+    """Join the caller's trace: log with its correlation id and forward it."""
+    correlation_id = request.headers.get("X-Correlation-ID")
+    if correlation_id:
+        set_correlation_id(correlation_id)
+    try:
+        return await call_next(request)
+    finally:
+        clear_correlation_id()
+
+
 app.include_router(router, prefix="/api", tags=["RAG Data"])
 app.include_router(memory_router, prefix="/api", tags=["Memory"])
 
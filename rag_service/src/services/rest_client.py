@@ -6,7 +6,7 @@ Provides unified HTTP communication with rest_service.
 
 from uuid import UUID
 
-from shared_models import BaseServiceClient, ClientConfig, get_logger
+from shared_models import BaseServiceClient, ClientConfig, encode_vector, get_logger
 
 from config.settings import settings
 
@@ -46,7 +46,8 @@ class RagRestClient(BaseServiceClient):
                 "POST",
                 "/api/memories/search",
                 json={
-                    "embedding": embedding,
+                    # base64 float32 is far smaller than a JSON float array
+                    "embedding": encode_vector(embedding),
                     "user_id": user_id,
                     "limit": limit,
                     "threshold": threshold,
@@ -74,7 +75,7 @@ class RagRestClient(BaseServiceClient):
                 "user_id": user_id,
                 "text": text,
                 "memory_type": memory_type,
-                "embedding": embedding,
+                "embedding": encode_vector(embedding),
                 "importance": importance,
             }
             if assistant_id:
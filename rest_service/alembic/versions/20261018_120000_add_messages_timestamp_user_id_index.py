@@ -0,0 +1,29 @@
+"""Add (timestamp, user_id) index on messages for the active-users query.
+
+Revision ID: add_messages_ts_user_idx
+Revises: add_queue_message_logs
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "add_messages_ts_user_idx"
+down_revision: str | None = "add_queue_message_logs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_messages_timestamp_user_id",
+        "messages",
+        ["timestamp", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_messages_timestamp_user_id", table_name="messages")
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     REDIS_HOST: str = os.getenv("REDIS_HOST", "redis")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
+    # Approximate MAXLEN applied when requeueing into a stream; 0 disables it
+    REDIS_STREAM_MAXLEN: int = int(os.getenv("REDIS_STREAM_MAXLEN", "100000"))
 
     # Cache settings
     CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from uuid import UUID
 
 # from schemas import AssistantCreate, AssistantUpdate  # Assuming schemas are defined
@@ -39,6 +40,25 @@ async def get_assistants(
     return assistants
 
 
+async def get_assistant_versions(
+    db: AsyncSession,
+    assistant_ids: list[UUID] | None = None,
+    updated_since: datetime | None = None,
+) -> list[tuple[UUID, datetime]]:
+    """Get (id, updated_at) pairs, optionally filtered by ids and/or update time.
+
+    Selects only the two columns so callers can revalidate cached configs
+    without loading full assistant rows and their tools.
+    """
+    query = select(Assistant.id, Assistant.updated_at)
+    if assistant_ids:
+        query = query.where(Assistant.id.in_(assistant_ids))
+    if updated_since is not None:
+        query = query.where(Assistant.updated_at > updated_since)
+    result = await db.execute(query)
+    return [(row[0], row[1]) for row in result.all()]
+
+
 async def create_assistant(
     db: AsyncSession, assistant_in: AssistantCreate
 ) -> Assistant:
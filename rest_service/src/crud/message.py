@@ -1,8 +1,9 @@
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from shared_models.api_schemas import MessageCreate, MessageUpdate
-from sqlalchemy import asc, desc, select
+from sqlalchemy import asc, desc, func, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from models.message import Message
@@ -61,6 +62,24 @@ async def get_multi(
     return result.scalars().all()
 
 
+async def get_recently_active_users(
+    db: AsyncSession, *, limit: int = 100, since: datetime | None = None
+) -> list[tuple[int, datetime]]:
+    """Get (user_id, last_message_at) pairs, most recently active first.
+
+    Pass ``since``: it turns the query into a range scan of the
+    (timestamp, user_id) index, grouped without reading table rows. Without
+    it every message is aggregated.
+    """
+    last_message_at = func.max(Message.timestamp).label("last_message_at")
+    query = select(Message.user_id, last_message_at).group_by(Message.user_id)
+    if since is not None:
+        query = query.where(Message.timestamp >= since)
+    query = query.order_by(desc(last_message_at)).limit(limit)
+    result = await db.execute(query)
+    return [(row[0], row[1]) for row in result.all()]
+
+
 async def create(db: AsyncSession, *, obj_in: MessageCreate) -> Message:
     # SQLModel uses model_validate for Pydantic v2
     # For older Pydantic v1 style with SQLModel, it's usually:
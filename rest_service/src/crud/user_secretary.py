@@ -1,6 +1,7 @@
 import logging
 from uuid import UUID
 
+from sqlalchemy import and_
 from sqlalchemy.orm import selectinload  # Import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -28,6 +29,41 @@ async def get_active_secretary_for_user(
     return result.scalar_one_or_none()
 
 
+async def get_user_with_active_secretary(
+    db: AsyncSession, telegram_id: int
+) -> tuple[TelegramUser, Assistant | None] | None:
+    """Get a user by telegram_id together with their active secretary.
+
+    Single query (outer joins), so callers needing both avoid two round trips.
+    Returns None if the user does not exist.
+    """
+    query = (
+        select(TelegramUser, Assistant)
+        .outerjoin(
+            UserSecretaryLink,
+            and_(
+                UserSecretaryLink.user_id == TelegramUser.id,
+                UserSecretaryLink.is_active.is_(True),
+            ),
+        )
+        .outerjoin(
+            Assistant,
+            and_(
+                Assistant.id == UserSecretaryLink.secretary_id,
+                Assistant.is_secretary.is_(True),
+            ),
+        )
+        .where(TelegramUser.telegram_id == telegram_id)
+        .limit(1)
+    )
+    result = await db.execute(query)
+    row = result.first()
+    if row is None:
+        return None
+    user, secretary = row
+    return user, secretary
+
+
 async def assign_secretary_to_user(
     db: AsyncSession, user_id: int, secretary_id: UUID
 ) -> UserSecretaryLink:
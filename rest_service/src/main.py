@@ -11,7 +11,11 @@ from shared_models import LogEventType, RedisCache, configure_logging, get_logge
 from config import settings
 from database import init_db
 from metrics import PrometheusMiddleware, get_content_type, get_metrics
-from middleware import CacheInvalidationMiddleware, CorrelationIdMiddleware
+from middleware import (
+    CacheInvalidationMiddleware,
+    ConfigEventsMiddleware,
+    CorrelationIdMiddleware,
+)
 
 # Import routers from correct locations
 from routers import (
@@ -108,6 +112,7 @@ app = FastAPI(lifespan=lifespan, title="Assistant Service API")
 
 # Add middleware (order matters: first added = innermost = runs last)
 app.add_middleware(CacheInvalidationMiddleware)  # Runs after request, invalidates cache
+app.add_middleware(ConfigEventsMiddleware)  # Runs after request, publishes changes
 app.add_middleware(CorrelationIdMiddleware)  # Runs first, sets correlation ID
 app.add_middleware(PrometheusMiddleware)  # Runs around everything, collects metrics
 
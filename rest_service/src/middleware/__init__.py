@@ -1,6 +1,11 @@
 """Middleware modules for REST service."""
 
 from .cache_invalidation import CacheInvalidationMiddleware
+from .config_events import ConfigEventsMiddleware
 from .correlation import CorrelationIdMiddleware
 
-__all__ = ["CorrelationIdMiddleware", "CacheInvalidationMiddleware"]
+__all__ = [
+    "CorrelationIdMiddleware",
+    "CacheInvalidationMiddleware",
+    "ConfigEventsMiddleware",
+]
@@ -0,0 +1,138 @@
+"""Middleware that publishes config change events on data changes."""
+
+import re
+from uuid import UUID
+
+from fastapi import Request
+from shared_models import (
+    ConfigChangeEvent,
+    ConfigEventType,
+    get_logger,
+    publish_config_event,
+)
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = get_logger(__name__)
+
+_UUID = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+
+
+class ConfigEventsMiddleware(BaseHTTPMiddleware):
+    """Publish secretary-assignment and assistant-config change events.
+
+    Monitors successful mutating HTTP operations and publishes a
+    ConfigChangeEvent on Redis Pub/Sub so that consumers (AssistantFactory)
+    can update their caches immediately.
+
+    Uses app.state.redis_client for lazy access (initialized in lifespan).
+    """
+
+    # (HTTP method, path regex) -> event type. Named groups map to event fields.
+    EVENT_RULES: list[tuple[str, re.Pattern, ConfigEventType]] = [
+        # User secretary assignments
+        (
+            "POST",
+            re.compile(
+                rf"^/api/users/(?P<user_id>\d+)/secretary/(?P<assistant_id>{_UUID})$"
+            ),
+            ConfigEventType.ASSIGNMENT_CHANGED,
+        ),
+        (
+            "DELETE",
+            re.compile(
+                rf"^/api/users/(?P<user_id>\d+)/secretary/(?P<assistant_id>{_UUID})$"
+            ),
+            ConfigEventType.ASSIGNMENT_REMOVED,
+        ),
+        # Assistant configuration
+        (
+            "PUT",
+            re.compile(rf"^/api/assistants/(?P<assistant_id>{_UUID})$"),
+            ConfigEventType.ASSISTANT_CHANGED,
+        ),
+        (
+            "PATCH",
+            re.compile(rf"^/api/assistants/(?P<assistant_id>{_UUID})$"),
+            ConfigEventType.ASSISTANT_CHANGED,
+        ),
+        (
+            "DELETE",
+            re.compile(rf"^/api/assistants/(?P<assistant_id>{_UUID})$"),
+            ConfigEventType.ASSISTANT_DELETED,
+        ),
+        # Assistant tools (linking)
+        (
+            "POST",
+            re.compile(rf"^/api/assistants/(?P<assistant_id>{_UUID})/tools/{_UUID}$"),
+            ConfigEventType.ASSISTANT_CHANGED,
+        ),
+        (
+            "DELETE",
+            re.compile(rf"^/api/assistants/(?P<assistant_id>{_UUID})/tools/{_UUID}$"),
+            ConfigEventType.ASSISTANT_CHANGED,
+        ),
+        # Tool definitions
+        (
+            "PUT",
+            re.compile(rf"^/api/tools/(?P<tool_id>{_UUID})$"),
+            ConfigEventType.TOOL_CHANGED,
+        ),
+        (
+            "DELETE",
+            re.compile(rf"^/api/tools/(?P<tool_id>{_UUID})$"),
+            ConfigEventType.TOOL_CHANGED,
+        ),
+    ]
+
+    async def dispatch(self, request: Request, call_next):
+        """Process request and publish an event on successful mutations."""
+        response = await call_next(request)
+
+        if response.status_code < 300:
+            await self._maybe_publish(request, request.method, request.url.path)
+
+        return response
+
+    @classmethod
+    def match_event(cls, method: str, path: str) -> ConfigChangeEvent | None:
+        """Build the event for a request, or None if it changes no config."""
+        for rule_method, pattern, event_type in cls.EVENT_RULES:
+            if method != rule_method:
+                continue
+            match = pattern.match(path)
+            if not match:
+                continue
+            groups = match.groupdict()
+            return ConfigChangeEvent(
+                event_type=event_type,
+                assistant_id=UUID(groups["assistant_id"])
+                if groups.get("assistant_id")
+                else None,
+                user_id=int(groups["user_id"]) if groups.get("user_id") else None,
+                tool_id=UUID(groups["tool_id"]) if groups.get("tool_id") else None,
+            )
+        return None
+
+    async def _maybe_publish(self, request: Request, method: str, path: str) -> None:
+        """Publish a config event if the request matches a rule.
+
+        Args:
+            request: FastAPI request (to access app.state)
+            method: HTTP method (GET, POST, etc.)
+            path: Request path
+        """
+        redis_client = getattr(request.app.state, "redis_client", None)
+        if redis_client is None:
+            return
+
+        event = self.match_event(method, path)
+        if event is None:
+            return
+
+        logger.debug(
+            "Publishing config event",
+            method=method,
+            path=path,
+            event_type=event.event_type.value,
+        )
+        await publish_config_event(redis_client, event)
@@ -38,4 +38,6 @@ class Message(BaseModel, table=True):
 
     __table_args__ = (
         Index("ix_messages_user_id_assistant_id_id", "user_id", "assistant_id", "id"),
+        # Recently active users: range on timestamp, user_id read from the index
+        Index("ix_messages_timestamp_user_id", "timestamp", "user_id"),
     )
@@ -1,13 +1,15 @@
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from shared_models.api_schemas import (
     AssistantCreate,
     AssistantRead,
     AssistantReadSimple,
     AssistantUpdate,
+    AssistantVersion,
 )
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -33,6 +35,33 @@ async def list_assistants(
     return assistants
 
 
+# Must be registered before /assistants/{assistant_id}
+@router.get("/assistants/versions", response_model=list[AssistantVersion])
+async def list_assistant_versions(
+    session: SessionDep,
+    ids: Annotated[list[UUID] | None, Query()] = None,
+    updated_since: datetime | None = None,
+) -> list[AssistantVersion]:
+    """Get {id, updated_at} pairs for cache revalidation.
+
+    Filters by `ids` (repeatable) and/or `updated_since`; returns all
+    assistants when neither is given. Unknown ids are simply absent.
+    """
+    versions = await assistant_crud.get_assistant_versions(
+        db=session, assistant_ids=ids, updated_since=updated_since
+    )
+    logger.info(
+        "Listed assistant versions",
+        requested=len(ids) if ids else None,
+        updated_since=updated_since.isoformat() if updated_since else None,
+        found=len(versions),
+    )
+    return [
+        AssistantVersion(id=assistant_id, updated_at=updated_at)
+        for assistant_id, updated_at in versions
+    ]
+
+
 @router.get("/assistants/{assistant_id}", response_model=AssistantRead)
 async def get_assistant(assistant_id: UUID, session: SessionDep) -> Assistant:
     """Get an assistant by ID"""
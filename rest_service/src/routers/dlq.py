@@ -5,7 +5,9 @@ from typing import Annotated
 
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from shared_models import maxlen_kwargs
 
+from config import settings
 from models.dlq import DLQMessageResponse, DLQStatsResponse
 
 router = APIRouter(prefix="/dlq", tags=["dlq"])
@@ -131,7 +133,9 @@ async def retry_dlq_message(
     _, fields = entries[0]
     payload = fields.get("payload", "")
 
-    new_id = await redis_client.xadd(queue, {"payload": payload})
+    new_id = await redis_client.xadd(
+        queue, {"payload": payload}, **maxlen_kwargs(settings.REDIS_STREAM_MAXLEN)
+    )
 
     await redis_client.xdel(dlq_stream, message_id)
 
@@ -2,8 +2,15 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
-from shared_models import MemoryCreate, MemoryRead, MemoryUpdate
+from shared_models import (
+    MemoryCreate,
+    MemoryRead,
+    MemoryReadWithEmbedding,
+    MemorySearchRequest,
+    MemorySearchResult,
+    MemoryUpdate,
+)
+from sqlalchemy.orm import defer
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -13,17 +20,6 @@ from models import Memory
 router = APIRouter(prefix="/memories", tags=["memories"])
 
 
-class MemorySearchRequest(BaseModel):
-    """Request body for memory search endpoint."""
-
-    embedding: list[float] = Field(..., description="Query embedding vector")
-    user_id: int = Field(..., description="User ID to filter memories")
-    limit: int = Field(default=10, ge=1, le=100, description="Max results to return")
-    threshold: float = Field(
-        default=0.7, ge=0.0, le=1.0, description="Similarity threshold"
-    )
-
-
 @router.post("/", response_model=MemoryRead)
 async def create_memory(
     memory_in: MemoryCreate,
@@ -36,15 +32,24 @@ async def create_memory(
     return memory
 
 
-@router.get("/{memory_id}", response_model=MemoryRead)
+@router.get(
+    "/{memory_id}",
+    response_model=MemoryReadWithEmbedding,
+    response_model_exclude_unset=True,
+)
 async def get_memory(
     memory_id: UUID,
     session: Annotated[AsyncSession, Depends(get_session)],
+    include_embedding: bool = False,
 ):
-    memory = await session.get(Memory, memory_id)
+    """Get a memory; the embedding vector is only returned on request."""
+    options = [] if include_embedding else [defer(Memory.embedding)]
+    memory = await session.get(Memory, memory_id, options=options)
     if not memory:
         raise HTTPException(status_code=404, detail="Memory not found")
-    return memory
+    if include_embedding:
+        return MemoryReadWithEmbedding.model_validate(memory)
+    return MemoryRead.model_validate(memory)
 
 
 @router.patch("/{memory_id}", response_model=MemoryRead)
@@ -87,20 +92,19 @@ async def get_user_memories(
     limit: int = 100,
     offset: int = 0,
 ):
+    # Vectors are never needed by list callers; don't even load them
     statement = (
-        select(Memory).where(Memory.user_id == user_id).offset(offset).limit(limit)
+        select(Memory)
+        .options(defer(Memory.embedding))
+        .where(Memory.user_id == user_id)
+        .offset(offset)
+        .limit(limit)
     )
     result = await session.exec(statement)
     return result.all()
 
 
-class MemorySearchResponse(MemoryRead):
-    """Memory with similarity score for search results."""
-
-    score: float = Field(..., description="Similarity score (0-1, higher is better)")
-
-
-@router.post("/search", response_model=list[MemorySearchResponse])
+@router.post("/search", response_model=list[MemorySearchResult])
 async def search_memories(
     request: MemorySearchRequest,
     session: Annotated[AsyncSession, Depends(get_session)],
@@ -109,12 +113,15 @@ async def search_memories(
 
     Returns memories ordered by cosine similarity, filtered by threshold.
     Score is calculated as 1 - cosine_distance (so 1 = identical, 0 = orthogonal).
+    The query embedding may be sent base64-encoded; stored vectors are not
+    loaded or returned.
     """
     statement = (
         select(
             Memory,
             (1 - Memory.embedding.cosine_distance(request.embedding)).label("score"),
         )
+        .options(defer(Memory.embedding))
         .where(Memory.user_id == request.user_id)
         .where(Memory.embedding.isnot(None))
         .order_by(Memory.embedding.cosine_distance(request.embedding))
@@ -128,8 +135,8 @@ async def search_memories(
     response = []
     for memory, score in results:
         if score >= request.threshold:
-            memory_dict = memory.model_dump()
+            memory_dict = MemoryRead.model_validate(memory).model_dump()
             memory_dict["score"] = round(score, 4)
-            response.append(MemorySearchResponse(**memory_dict))
+            response.append(MemorySearchResult(**memory_dict))
 
     return response
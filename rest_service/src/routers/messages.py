@@ -1,9 +1,11 @@
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from shared_models.api_schemas import (
+    ActiveUser,
     MessageCreate,
     MessageRead,
     MessageUpdate,
@@ -78,6 +80,24 @@ async def list_messages_endpoint(
     return messages
 
 
+# Must be registered before /messages/{message_id}
+@router.get("/active-users", response_model=list[ActiveUser])
+async def list_active_users_endpoint(
+    session: SessionDep,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    since: datetime | None = None,
+) -> list[ActiveUser]:
+    """Users ordered by their latest message, for assistant cache warm-up."""
+    users = await message_crud.get_recently_active_users(
+        db=session, limit=limit, since=since
+    )
+    logger.info("Listed active users", limit=limit, found=len(users))
+    return [
+        ActiveUser(user_id=user_id, last_message_at=last_message_at)
+        for user_id, last_message_at in users
+    ]
+
+
 @router.get("/{message_id}", response_model=MessageRead)
 async def get_message_endpoint(message_id: int, session: SessionDep) -> Message:
     logger.info("Getting message by ID", message_id=message_id)
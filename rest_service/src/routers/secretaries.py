@@ -3,7 +3,11 @@ from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
-from shared_models.api_schemas import AssistantRead, UserSecretaryLinkRead
+from shared_models.api_schemas import (
+    AssistantRead,
+    TelegramUserContext,
+    UserSecretaryLinkRead,
+)
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -48,6 +52,27 @@ async def get_active_secretary_for_user_route(
     return secretary
 
 
+@router.get(
+    "/users/by-telegram-id/{telegram_id}/context",
+    response_model=TelegramUserContext,
+)
+async def get_user_context_route(
+    telegram_id: int, session: SessionDep
+) -> TelegramUserContext:
+    """Get a user by telegram_id together with their active secretary."""
+    logger.info("Getting user context", telegram_id=telegram_id)
+    row = await user_secretary_crud.get_user_with_active_secretary(
+        db=session, telegram_id=telegram_id
+    )
+    if row is None:
+        logger.warning("User not found by telegram_id", telegram_id=telegram_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    user, secretary = row
+    return TelegramUserContext.model_validate({"user": user, "secretary": secretary})
+
+
 @router.post(
     "/users/{user_id}/secretary/{secretary_id}",
     response_model=UserSecretaryLinkRead,
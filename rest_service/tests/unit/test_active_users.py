@@ -0,0 +1,48 @@
+"""Unit tests for the recently active users endpoint."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_get_recently_active_users_returns_user_and_time():
+    from crud.message import get_recently_active_users
+
+    last_message_at = datetime.now(UTC)
+    result = MagicMock()
+    result.all.return_value = [(42, last_message_at)]
+    session = AsyncMock()
+    session.execute.return_value = result
+
+    users = await get_recently_active_users(session, limit=10)
+
+    assert users == [(42, last_message_at)]
+    query = str(session.execute.call_args.args[0])
+    assert "GROUP BY messages.user_id" in query
+    assert "ORDER BY last_message_at DESC" in query
+
+
+@pytest.mark.asyncio
+async def test_get_recently_active_users_filters_by_since():
+    from crud.message import get_recently_active_users
+
+    result = MagicMock()
+    result.all.return_value = []
+    session = AsyncMock()
+    session.execute.return_value = result
+
+    await get_recently_active_users(session, limit=10, since=datetime.now(UTC))
+
+    query = str(session.execute.call_args.args[0])
+    assert "WHERE messages.timestamp >=" in query
+
+
+def test_active_users_route_registered_before_message_id_route():
+    """/messages/active-users must not be captured by /messages/{message_id}."""
+    from routers.messages import router
+
+    paths = [route.path for route in router.routes if "GET" in route.methods]
+
+    assert paths.index("/messages/active-users") < paths.index("/messages/{message_id}")
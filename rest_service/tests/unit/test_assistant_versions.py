@@ -0,0 +1,44 @@
+"""Unit tests for the bulk assistant version endpoint."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_get_assistant_versions_returns_id_and_updated_at():
+    """CRUD returns plain (id, updated_at) pairs."""
+    from crud.assistant import get_assistant_versions
+
+    assistant_id = uuid4()
+    updated_at = datetime.now(UTC)
+    result = MagicMock()
+    result.all.return_value = [(assistant_id, updated_at)]
+    session = AsyncMock()
+    session.execute.return_value = result
+
+    versions = await get_assistant_versions(session, assistant_ids=[assistant_id])
+
+    assert versions == [(assistant_id, updated_at)]
+    session.execute.assert_awaited_once()
+
+
+def test_versions_route_registered_before_assistant_id_route():
+    """/assistants/versions must not be captured by /assistants/{assistant_id}."""
+    from routers.assistants import router
+
+    paths = [route.path for route in router.routes if "GET" in route.methods]
+
+    assert paths.index("/assistants/versions") < paths.index(
+        "/assistants/{assistant_id}"
+    )
+
+
+def test_assistant_version_schema_normalizes_naive_datetimes():
+    from shared_models.api_schemas import AssistantVersion
+
+    version = AssistantVersion(id=uuid4(), updated_at=datetime(2024, 1, 1, 12, 0))
+
+    assert version.updated_at.tzinfo == UTC
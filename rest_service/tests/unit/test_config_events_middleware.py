@@ -0,0 +1,59 @@
+"""Unit tests for ConfigEventsMiddleware path matching."""
+
+from uuid import uuid4
+
+from shared_models import ConfigEventType
+
+from middleware.config_events import ConfigEventsMiddleware
+
+
+def test_assignment_routes_produce_assignment_events():
+    secretary_id = uuid4()
+    path = f"/api/users/15/secretary/{secretary_id}"
+
+    assigned = ConfigEventsMiddleware.match_event("POST", path)
+    removed = ConfigEventsMiddleware.match_event("DELETE", path)
+
+    assert assigned.event_type == ConfigEventType.ASSIGNMENT_CHANGED
+    assert assigned.user_id == 15
+    assert assigned.assistant_id == secretary_id
+    assert removed.event_type == ConfigEventType.ASSIGNMENT_REMOVED
+
+
+def test_assistant_and_tool_link_routes_produce_assistant_events():
+    assistant_id = uuid4()
+
+    updated = ConfigEventsMiddleware.match_event(
+        "PUT", f"/api/assistants/{assistant_id}"
+    )
+    deleted = ConfigEventsMiddleware.match_event(
+        "DELETE", f"/api/assistants/{assistant_id}"
+    )
+    linked = ConfigEventsMiddleware.match_event(
+        "POST", f"/api/assistants/{assistant_id}/tools/{uuid4()}"
+    )
+
+    assert updated.event_type == ConfigEventType.ASSISTANT_CHANGED
+    assert updated.assistant_id == assistant_id
+    assert deleted.event_type == ConfigEventType.ASSISTANT_DELETED
+    assert linked.event_type == ConfigEventType.ASSISTANT_CHANGED
+    assert linked.assistant_id == assistant_id
+
+
+def test_tool_update_produces_tool_event():
+    tool_id = uuid4()
+
+    event = ConfigEventsMiddleware.match_event("PUT", f"/api/tools/{tool_id}")
+
+    assert event.event_type == ConfigEventType.TOOL_CHANGED
+    assert event.tool_id == tool_id
+
+
+def test_reads_and_unrelated_mutations_are_ignored():
+    assistant_id = uuid4()
+
+    assert (
+        ConfigEventsMiddleware.match_event("GET", f"/api/assistants/{assistant_id}")
+        is None
+    )
+    assert ConfigEventsMiddleware.match_event("POST", "/api/messages/") is None
@@ -0,0 +1,59 @@
+# rest_service/tests/unit/test_user_context.py
+"""Unit tests for the combined user + active secretary lookup."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_session():
+    """Create mock async database session."""
+    session = AsyncMock()
+    session.execute = AsyncMock()
+    return session
+
+
+class TestGetUserWithActiveSecretary:
+    """Tests for get_user_with_active_secretary."""
+
+    @pytest.mark.asyncio
+    async def test_returns_user_and_secretary_from_one_query(self, mock_session):
+        """Test both objects come back from a single execute."""
+        from crud.user_secretary import get_user_with_active_secretary
+
+        user, secretary = MagicMock(), MagicMock()
+        result = MagicMock()
+        result.first.return_value = (user, secretary)
+        mock_session.execute.return_value = result
+
+        row = await get_user_with_active_secretary(mock_session, telegram_id=12345)
+
+        assert row == (user, secretary)
+        mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_user_without_secretary(self, mock_session):
+        """Test the outer join yields None for a user with no secretary."""
+        from crud.user_secretary import get_user_with_active_secretary
+
+        user = MagicMock()
+        result = MagicMock()
+        result.first.return_value = (user, None)
+        mock_session.execute.return_value = result
+
+        assert await get_user_with_active_secretary(mock_session, 12345) == (
+            user,
+            None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(self, mock_session):
+        """Test None is returned when no user matches."""
+        from crud.user_secretary import get_user_with_active_secretary
+
+        result = MagicMock()
+        result.first.return_value = None
+        mock_session.execute.return_value = result
+
+        assert await get_user_with_active_secretary(mock_session, 12345) is None
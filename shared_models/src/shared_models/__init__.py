@@ -13,10 +13,27 @@ from .api_schemas import (
 )
 
 # Import Memory schemas
-from .api_schemas.memory import MemoryCreate, MemoryRead, MemoryUpdate
+from .api_schemas.memory import (
+    MemoryCreate,
+    MemoryRead,
+    MemoryReadWithEmbedding,
+    MemorySearchRequest,
+    MemorySearchResult,
+    MemoryUpdate,
+    decode_vector,
+    encode_vector,
+)
 from .cache import (
     CachedServiceClient,
     RedisCache,
+    SingleFlight,
+)
+from .config_events import (
+    CONFIG_EVENTS_CHANNEL,
+    ConfigChangeEvent,
+    ConfigEventType,
+    publish_config_event,
+    subscribe_config_events,
 )
 from .enums import AssistantType, ReminderStatus, ReminderType, ToolType
 from .http_client import (
@@ -54,6 +71,30 @@ from .queue import (
     TriggerType,
 )
 from .queue_logger import QueueDirection, QueueLogger
+from .streams import (
+    DEFAULT_DLQ_MAXLEN,
+    DEFAULT_STREAM_MAXLEN,
+    TRIGGER_LANE_SUFFIX,
+    StreamGroupMonitor,
+    collect_group_stats,
+    get_queue_stats,
+    maxlen_kwargs,
+    record_stream_usage,
+    register_queue_monitor,
+    safe_trim_id,
+    trigger_lane,
+    trim_acknowledged,
+    write_queue_stats,
+)
+from .tracing import (
+    configure_tracing,
+    mark_once,
+    new_correlation_id,
+    queue_wait_seconds,
+    record_span,
+    span,
+    start_trace,
+)
 
 # Note: LLM providers are available via shared_models.llm_providers
 # but not imported at top level to avoid requiring openai in all services
@@ -69,6 +110,13 @@ __all__ = [
     # Cache
     "RedisCache",
     "CachedServiceClient",
+    "SingleFlight",
+    # Config change events
+    "CONFIG_EVENTS_CHANNEL",
+    "ConfigChangeEvent",
+    "ConfigEventType",
+    "publish_config_event",
+    "subscribe_config_events",
     # Logging
     "LogEventType",
     "LogLevel",
@@ -93,6 +141,28 @@ __all__ = [
     "TriggerType",
     "QueueDirection",
     "QueueLogger",
+    # Stream retention
+    "DEFAULT_DLQ_MAXLEN",
+    "DEFAULT_STREAM_MAXLEN",
+    "TRIGGER_LANE_SUFFIX",
+    "StreamGroupMonitor",
+    "collect_group_stats",
+    "get_queue_stats",
+    "maxlen_kwargs",
+    "record_stream_usage",
+    "register_queue_monitor",
+    "safe_trim_id",
+    "trigger_lane",
+    "trim_acknowledged",
+    "write_queue_stats",
+    # Tracing
+    "configure_tracing",
+    "mark_once",
+    "new_correlation_id",
+    "queue_wait_seconds",
+    "record_span",
+    "span",
+    "start_trace",
     # Enums
     "AssistantType",
     "ToolType",
@@ -9,6 +9,7 @@ from .assistant import (
     AssistantToolLinkCreate,
     AssistantToolLinkRead,
     AssistantUpdate,
+    AssistantVersion,
     ToolBase,
     ToolCreate,
     ToolRead,
@@ -26,10 +27,17 @@ from .global_settings import (
     GlobalSettingsRead,
     GlobalSettingsUpdate,
 )
-from .message import MessageBase, MessageCreate, MessageRead, MessageUpdate
+from .message import (
+    ActiveUser,
+    MessageBase,
+    MessageCreate,
+    MessageRead,
+    MessageUpdate,
+)
 from .reminder import ReminderBase, ReminderCreate, ReminderRead, ReminderUpdate
 from .user import TelegramUserCreate, TelegramUserRead, TelegramUserUpdate
 from .user_secretary import (
+    TelegramUserContext,
     UserSecretaryLinkBase,
     UserSecretaryLinkCreate,
     UserSecretaryLinkRead,
@@ -45,6 +53,7 @@ __all__ = [
     "AssistantRead",
     "AssistantReadSimple",
     "AssistantUpdate",
+    "AssistantVersion",
     "ToolBase",
     "ToolCreate",
     "ToolRead",
@@ -70,6 +79,7 @@ __all__ = [
     "TelegramUserRead",
     "TelegramUserUpdate",
     # UserSecretaryLink
+    "TelegramUserContext",
     "UserSecretaryLinkBase",
     "UserSecretaryLinkCreate",
     "UserSecretaryLinkRead",
@@ -78,6 +88,7 @@ __all__ = [
     "GlobalSettingsRead",
     "GlobalSettingsUpdate",
     # Message
+    "ActiveUser",
     "MessageBase",
     "MessageCreate",
     "MessageRead",
@@ -1,5 +1,8 @@
+from datetime import UTC, datetime
 from uuid import UUID
 
+from pydantic import field_validator
+
 # Need enums from models, adjust path if needed
 # from models.assistant import AssistantType, ToolType
 from ..enums import AssistantType, ToolType  # Import from shared_models.enums
@@ -74,6 +77,19 @@ class AssistantReadSimple(AssistantBase, TimestampSchema):
     description: str | None = None
 
 
+# Minimal projection for cache revalidation (bulk version checks)
+class AssistantVersion(BaseSchema):
+    id: UUID
+    updated_at: datetime
+
+    @field_validator("updated_at")
+    @classmethod
+    def ensure_timezone_aware(cls, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+
 # ========= AssistantToolLink Schemas ==========
 # Link between Assistant and Tool
 
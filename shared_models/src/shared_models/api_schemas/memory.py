@@ -1,8 +1,54 @@
+import base64
+import sys
+from array import array
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
+from pydantic import BeforeValidator, Field
+
 from .base import BaseSchema, TimestampSchema
 
+# ========= Vector transport ==========
+# Embeddings are large (1536 floats). JSON arrays of floats are ~10x bigger
+# than the raw data, so vector fields also accept a base64 string of packed
+# little-endian float32 values.
+
+
+def encode_vector(vector: list[float]) -> str:
+    """Encode a vector as base64 of little-endian float32 values."""
+    packed = array("f", vector)
+    if packed.itemsize != 4:  # pragma: no cover - exotic platforms
+        raise ValueError("float32 array support required")
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def decode_vector(encoded: str) -> list[float]:
+    """Decode a vector produced by encode_vector()."""
+    raw = base64.b64decode(encoded, validate=True)
+    if len(raw) % 4:
+        raise ValueError("Encoded vector length is not a multiple of 4 bytes")
+    packed = array("f")
+    packed.frombytes(raw)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _coerce_vector(value):
+    if isinstance(value, str):
+        return decode_vector(value)
+    return value
+
+
+# A vector given either as a JSON array or as an encode_vector() string
+Vector = Annotated[list[float], BeforeValidator(_coerce_vector)]
+
+
+# ========= Memory Schemas ==========
+
 
 class MemoryBase(BaseSchema):
     user_id: int
@@ -11,11 +57,10 @@ class MemoryBase(BaseSchema):
     memory_type: str
     source_message_id: UUID | None = None
     importance: int = 1
-    embedding: list[float] | None = None
 
 
 class MemoryCreate(MemoryBase):
-    pass
+    embedding: Vector | None = None
 
 
 class MemoryUpdate(BaseSchema):
@@ -23,9 +68,33 @@ class MemoryUpdate(BaseSchema):
     memory_type: str | None = None
     importance: int | None = None
     last_accessed_at: datetime | None = None
-    embedding: list[float] | None = None
+    embedding: Vector | None = None
 
 
+# Read projections: vectors are omitted unless explicitly requested
 class MemoryRead(MemoryBase, TimestampSchema):
     id: UUID
     last_accessed_at: datetime
+
+
+class MemoryReadWithEmbedding(MemoryRead):
+    embedding: list[float] | None = None
+
+
+class MemorySearchRequest(BaseSchema):
+    """Request body for vector search over a user's memories."""
+
+    embedding: Vector = Field(
+        ..., description="Query embedding (JSON array or base64 float32)"
+    )
+    user_id: int = Field(..., description="User ID to filter memories")
+    limit: int = Field(default=10, ge=1, le=100, description="Max results to return")
+    threshold: float = Field(
+        default=0.7, ge=0.0, le=1.0, description="Similarity threshold"
+    )
+
+
+class MemorySearchResult(MemoryRead):
+    """Memory with similarity score for search results."""
+
+    score: float = Field(..., description="Similarity score (0-1, higher is better)")
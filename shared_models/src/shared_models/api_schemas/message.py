@@ -1,8 +1,8 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from .base import BaseSchema
 
@@ -40,3 +40,17 @@ class MessageRead(MessageBase):
 class MessageUpdate(BaseSchema):
     status: str | None = None
     meta_data: dict[str, Any] | None = None
+
+
+class ActiveUser(BaseSchema):
+    """A user and the time of their latest message, for cache warm-up."""
+
+    user_id: int
+    last_message_at: datetime
+
+    @field_validator("last_message_at")
+    @classmethod
+    def ensure_timezone_aware(cls, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
@@ -1,6 +1,8 @@
 from uuid import UUID
 
+from .assistant import AssistantReadSimple
 from .base import BaseSchema, TimestampSchema
+from .user import TelegramUserRead
 
 
 # Schema for the link between User and Secretary (Assistant)
@@ -25,3 +27,9 @@ class UserSecretaryLinkRead(UserSecretaryLinkBase, TimestampSchema):
     id: UUID  # Internal DB ID of the link itself
     # Optional: Include nested secretary info if needed
     # secretary: Optional[AssistantRead] = None
+
+
+# User plus active secretary, resolved together for each incoming chat message
+class TelegramUserContext(BaseSchema):
+    user: TelegramUserRead
+    secretary: AssistantReadSimple | None = None
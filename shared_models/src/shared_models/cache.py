@@ -6,11 +6,14 @@ Provides:
 - Pattern-based invalidation
 - Pub/Sub for cache invalidation events
 - Prometheus metrics
+- Singleflight deduplication of concurrent loads
 """
 
+import asyncio
 import json
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import timedelta
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from prometheus_client import Counter, Histogram
 from pydantic import BaseModel
@@ -20,6 +23,7 @@ from shared_models.logging import get_logger
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+V = TypeVar("V")
 
 # === Prometheus Metrics ===
 
@@ -43,6 +47,42 @@ CACHE_OPERATIONS_DURATION = Histogram(
 )
 
 
+class SingleFlight:
+    """Deduplicate concurrent loads of the same key.
+
+    The first caller for a key starts the loader; callers arriving while it
+    is in flight await the same result (or exception) instead of loading
+    again. Nothing is kept after the load finishes, so pair it with a cache.
+    A caller being cancelled does not cancel the load for the others.
+
+    Example:
+        flight = SingleFlight()
+        config = await flight.do(("assistant", 1), lambda: fetch_config(1))
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return ``await loader()``, sharing one call among concurrent callers."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # Retrieved even if every caller went away
+
+
 class RedisCache:
     """Redis cache with typed get/set and Pub/Sub invalidation.
 
@@ -75,6 +115,7 @@ class RedisCache:
         self.redis = redis_client
         self.prefix = prefix
         self._pubsub = None
+        self._loads = SingleFlight()
 
     def _key(self, key: str) -> str:
         """Build full cache key with prefix."""
@@ -251,6 +292,39 @@ class RedisCache:
             )
             return False
 
+    async def get_or_load(
+        self,
+        key: str,
+        model_class: type[T],
+        loader: Callable[[], Awaitable[T | None]],
+        ttl: timedelta | int = 300,
+    ) -> T | None:
+        """Get cached value, loading and caching it on a miss.
+
+        Concurrent misses for the same key share a single ``loader`` call.
+        ``None`` results are not cached.
+
+        Args:
+            key: Cache key (without prefix)
+            model_class: Pydantic model class to deserialize into
+            loader: Coroutine function producing the value on a miss
+            ttl: Time to live in seconds or timedelta (default: 300s)
+
+        Returns:
+            Cached or freshly loaded value, or None
+        """
+        cached = await self.get(key, model_class)
+        if cached is not None:
+            return cached
+
+        async def load() -> Any:
+            value = await loader()
+            if value is not None:
+                await self.set(key, value, ttl)
+            return value
+
+        return await self._loads.do(key, load)
+
     async def delete(self, key: str) -> bool:
         """Delete cached value.
 
@@ -0,0 +1,129 @@
+"""Configuration change events published over Redis Pub/Sub.
+
+rest_service publishes an event whenever a secretary assignment or an
+assistant configuration changes. Consumers (e.g. assistant_service's
+AssistantFactory) subscribe and apply the change to their local caches
+immediately instead of waiting for a periodic full sync.
+
+Pub/Sub is fire-and-forget: events published while a subscriber is
+disconnected are lost, so subscribers should run a full consistency sweep
+after (re)subscribing.
+"""
+
+import json
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, Field, ValidationError
+
+from shared_models.logging import get_logger
+
+logger = get_logger(__name__)
+
+CONFIG_EVENTS_CHANNEL = "config:events"
+
+
+class ConfigEventType(str, Enum):
+    """Kinds of configuration changes."""
+
+    ASSIGNMENT_CHANGED = "assignment_changed"  # user -> secretary (re)assigned
+    ASSIGNMENT_REMOVED = "assignment_removed"  # user -> secretary deactivated
+    ASSISTANT_CHANGED = "assistant_changed"  # config or tool links updated
+    ASSISTANT_DELETED = "assistant_deleted"
+    TOOL_CHANGED = "tool_changed"  # tool definition updated or deleted
+
+
+class ConfigChangeEvent(BaseModel):
+    """A single configuration change.
+
+    Which ids are set depends on event_type:
+    - ASSIGNMENT_*: user_id and assistant_id (the secretary)
+    - ASSISTANT_*: assistant_id
+    - TOOL_CHANGED: tool_id
+    """
+
+    event_type: ConfigEventType
+    assistant_id: UUID | None = None
+    user_id: int | None = None
+    tool_id: UUID | None = None
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+
+ConfigEventCallback = Callable[[ConfigChangeEvent], Awaitable[None]]
+
+
+async def publish_config_event(redis_client, event: ConfigChangeEvent) -> bool:
+    """Publish a config change event.
+
+    Args:
+        redis_client: Async redis client (redis.asyncio.Redis)
+        event: Event to publish
+
+    Returns:
+        True if published, False on error (errors are logged, not raised)
+    """
+    try:
+        await redis_client.publish(CONFIG_EVENTS_CHANNEL, event.model_dump_json())
+        logger.debug(
+            "Config event published",
+            event_type=event.event_type.value,
+            assistant_id=str(event.assistant_id) if event.assistant_id else None,
+            user_id=event.user_id,
+        )
+        return True
+    except Exception as e:
+        logger.warning(
+            "Failed to publish config event",
+            event_type=event.event_type.value,
+            error=str(e),
+        )
+        return False
+
+
+async def subscribe_config_events(
+    redis_client,
+    callback: ConfigEventCallback,
+    on_subscribed: Callable[[], Awaitable[None]] | None = None,
+) -> None:
+    """Subscribe to config change events and invoke callback for each one.
+
+    Runs until cancelled. Connection errors are propagated so the caller can
+    decide how to reconnect.
+
+    Args:
+        redis_client: Async redis client (redis.asyncio.Redis)
+        callback: Async callback receiving each ConfigChangeEvent
+        on_subscribed: Optional async hook called once the subscription is
+            active (e.g. to run a consistency sweep for missed events)
+    """
+    pubsub = redis_client.pubsub()
+    try:
+        await pubsub.subscribe(CONFIG_EVENTS_CHANNEL)
+        logger.info("Subscribed to config events", channel=CONFIG_EVENTS_CHANNEL)
+        if on_subscribed is not None:
+            await on_subscribed()
+
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                event = ConfigChangeEvent.model_validate_json(message["data"])
+            except (ValidationError, json.JSONDecodeError) as e:
+                logger.warning("Discarding malformed config event", error=str(e))
+                continue
+            try:
+                await callback(event)
+            except Exception as e:
+                logger.warning(
+                    "Config event callback failed",
+                    event_type=event.event_type.value,
+                    error=str(e),
+                )
+    finally:
+        try:
+            await pubsub.unsubscribe(CONFIG_EVENTS_CHANNEL)
+            await pubsub.aclose()
+        except Exception:
+            pass
@@ -64,6 +64,9 @@ class LogEventType(str, Enum):
     MESSAGE_PROCESSED = "message_processed"
     MESSAGE_SENT = "message_sent"
 
+    # Tracing
+    SPAN = "span"
+
     # General events
     ERROR = "error"
     WARNING = "warning"
@@ -44,6 +44,7 @@ class QueueMessage(BaseModel):
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(UTC).replace(microsecond=0)
     )
+    correlation_id: str | None = None  # Trace id propagated across services
 
     @model_validator(mode="before")
     @classmethod
@@ -112,6 +113,7 @@ class QueueTrigger(BaseModel):
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(UTC).replace(microsecond=0)
     )  # Timestamp of trigger generation
+    correlation_id: str | None = None  # Trace id propagated across services
 
     model_config = {
         "frozen": True,  # Make trigger objects immutable after creation
@@ -146,6 +148,15 @@ class AssistantResponseMessage(BaseModel):
     source: str | None = None  # e.g., "assistant", "tool:reminder_tool"
     response: str | None = None  # Text response content if status is "success"
     error: str | None = None  # Error message content if status is "error"
+    correlation_id: str | None = None  # Trace id of the originating message
+    # Routing info from the originating message, so consumers can deliver
+    # without looking the user up again
+    chat_id: int | None = None
+    metadata: dict[str, Any] | None = None
+    # Streaming: partial=True events carry the text generated so far; all
+    # events of one turn, including the final one, share stream_id
+    partial: bool = False
+    stream_id: str | None = None
 
     @model_validator(mode="before")
     def check_status_and_content(cls, values):
@@ -0,0 +1,239 @@
+"""Retention and monitoring helpers for Redis streams.
+
+XACK does not remove entries, so producers cap streams with an approximate
+MAXLEN on XADD and a periodic job trims (MINID) whatever every consumer group
+has already acknowledged. Consumer-group lag and pending age are exported so
+consumers can be scaled before the backlog becomes visible to users.
+"""
+
+import asyncio
+import json
+import time
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+
+from prometheus_client import Gauge
+from redis.exceptions import ResponseError
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_STREAM_MAXLEN = 100_000
+DEFAULT_DLQ_MAXLEN = 10_000
+
+# Scheduled work (reminders, calendar callbacks) goes to a separate lane next
+# to the interactive input stream, so consumers can prioritise user messages
+TRIGGER_LANE_SUFFIX = ":triggers"
+
+stream_length = Gauge(
+    "redis_stream_length",
+    "Number of entries in a Redis stream",
+    ["stream"],
+)
+
+stream_memory_bytes = Gauge(
+    "redis_stream_memory_bytes",
+    "Memory used by a Redis stream (MEMORY USAGE)",
+    ["stream"],
+)
+
+stream_group_lag = Gauge(
+    "redis_stream_group_lag",
+    "Entries not yet delivered to a consumer group",
+    ["stream", "group"],
+)
+
+stream_group_pending = Gauge(
+    "redis_stream_group_pending",
+    "Entries delivered to a consumer group but not acknowledged",
+    ["stream", "group"],
+)
+
+stream_group_oldest_pending_age = Gauge(
+    "redis_stream_group_oldest_pending_age_seconds",
+    "Age of the oldest unacknowledged entry of a consumer group",
+    ["stream", "group"],
+)
+
+
+def maxlen_kwargs(maxlen: int | None) -> dict[str, Any]:
+    """XADD keyword arguments for an approximate MAXLEN cap.
+
+    Approximate trimming (``MAXLEN ~``) only drops whole radix-tree nodes, so
+    it costs next to nothing per XADD. ``None`` or ``0`` disables the cap.
+    """
+    if not maxlen:
+        return {}
+    return {"maxlen": maxlen, "approximate": True}
+
+
+def trigger_lane(stream: str) -> str:
+    """Name of the trigger lane that accompanies input ``stream``."""
+    return f"{stream}{TRIGGER_LANE_SUFFIX}"
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _parse_id(entry_id: str) -> tuple[int, int]:
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _next_id(entry_id: str) -> str:
+    ms, seq = _parse_id(entry_id)
+    return f"{ms}-{seq + 1}"
+
+
+async def safe_trim_id(client: Any, stream: str) -> str | None:
+    """Lowest entry id any consumer group of ``stream`` may still need.
+
+    Per group this is the oldest pending (delivered, unacked) id or, when
+    nothing is pending, the id right after the last delivered one. Returns
+    ``None`` when the stream or its groups do not exist, since without a
+    group there is no acknowledgement to trim by.
+    """
+    try:
+        groups = await client.xinfo_groups(stream)
+    except ResponseError:
+        return None
+    if not groups:
+        return None
+
+    candidates = []
+    for group in groups:
+        pending = await client.xpending(stream, _decode(group["name"]))
+        if pending and pending.get("pending"):
+            candidates.append(_decode(pending["min"]))
+        else:
+            candidates.append(_next_id(_decode(group["last-delivered-id"])))
+    return min(candidates, key=_parse_id)
+
+
+async def trim_acknowledged(client: Any, stream: str) -> int:
+    """Trim entries acknowledged by every consumer group; returns the count."""
+    minid = await safe_trim_id(client, stream)
+    if minid is None:
+        return 0
+    return await client.xtrim(stream, minid=minid, approximate=True)
+
+
+async def record_stream_usage(client: Any, stream: str) -> None:
+    """Update the length and memory gauges for ``stream``."""
+    stream_length.labels(stream=stream).set(await client.xlen(stream))
+    memory = await client.memory_usage(stream)
+    stream_memory_bytes.labels(stream=stream).set(memory or 0)
+
+
+async def collect_group_stats(
+    client: Any, stream: str, groups: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """Lag, pending count and oldest pending age of the groups of ``stream``.
+
+    Only ``groups`` are reported when given, otherwise every group. Also
+    updates the matching gauges. ``lag`` is ``None`` when Redis cannot
+    tell (servers before 7.0, or after entries were deleted mid-stream). The
+    age is measured from the entry id, i.e. since the entry was enqueued.
+    """
+    try:
+        infos = await client.xinfo_groups(stream)
+    except ResponseError:
+        return []
+
+    now = time.time()
+    stats = []
+    for group in infos:
+        name = _decode(group["name"])
+        if groups is not None and name not in groups:
+            continue
+        pending = int(group.get("pending") or 0)
+        oldest_age = 0.0
+        if pending:
+            summary = await client.xpending(stream, name)
+            if summary and summary.get("pending"):
+                pending = int(summary["pending"])
+                enqueued_ms, _ = _parse_id(_decode(summary["min"]))
+                oldest_age = max(0.0, now - enqueued_ms / 1000)
+        lag = group.get("lag")
+        lag = int(lag) if lag is not None else None
+
+        if lag is not None:
+            stream_group_lag.labels(stream=stream, group=name).set(lag)
+        stream_group_pending.labels(stream=stream, group=name).set(pending)
+        stream_group_oldest_pending_age.labels(stream=stream, group=name).set(
+            oldest_age
+        )
+        stats.append(
+            {
+                "stream": stream,
+                "group": name,
+                "lag": lag,
+                "pending": pending,
+                "oldest_pending_age_seconds": round(oldest_age, 3),
+            }
+        )
+    return stats
+
+
+class StreamGroupMonitor:
+    """Periodically collects consumer-group stats for a set of streams.
+
+    A service monitors only the streams and groups it consumes, so each
+    ``redis_stream_group_*{stream,group}`` series is exported by one service
+    and sums across services do not double-count. The latest snapshot is kept
+    for JSON endpoints (e.g. an autoscaler) and can be read from any thread.
+    """
+
+    def __init__(
+        self, client: Any, streams: list[str], groups: list[str] | None = None
+    ):
+        self.client = client
+        self.streams = streams
+        self.groups = groups
+        self._snapshot: dict[str, Any] = {"updated_at": None, "groups": []}
+
+    def snapshot(self) -> dict[str, Any]:
+        return self._snapshot
+
+    async def collect(self) -> dict[str, Any]:
+        groups = []
+        for stream in self.streams:
+            groups.extend(await collect_group_stats(self.client, stream, self.groups))
+        # Replaced as a whole so readers never see a partial update
+        self._snapshot = {"updated_at": time.time(), "groups": groups}
+        return self._snapshot
+
+    async def run(self, interval: float = 15) -> None:
+        while True:
+            try:
+                await self.collect()
+            except Exception as e:
+                logger.warning("Failed to collect stream group stats", error=str(e))
+            await asyncio.sleep(interval)
+
+
+# Consumer-group snapshot served on /queues (set once the Redis client exists)
+_queue_monitor: StreamGroupMonitor | None = None
+
+
+def register_queue_monitor(monitor: StreamGroupMonitor) -> None:
+    """Serve ``monitor``'s latest consumer-group snapshot on /queues."""
+    global _queue_monitor
+    _queue_monitor = monitor
+
+
+def get_queue_stats() -> dict[str, Any]:
+    """Latest consumer-group lag/pending snapshot for autoscalers."""
+    if _queue_monitor is None:
+        return {"updated_at": None, "groups": []}
+    return _queue_monitor.snapshot()
+
+
+def write_queue_stats(handler: BaseHTTPRequestHandler) -> None:
+    """Answer a /queues request with :func:`get_queue_stats` as JSON."""
+    handler.send_response(200)
+    handler.send_header("Content-Type", "application/json")
+    handler.end_headers()
+    handler.wfile.write(json.dumps(get_queue_stats()).encode())
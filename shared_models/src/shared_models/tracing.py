@@ -0,0 +1,189 @@
+"""
+Lightweight span tracing on top of the correlation id.
+
+A trace is one user message (or trigger) followed across services: the
+correlation id travels in queue payloads (QueueMessage, QueueTrigger,
+AssistantResponseMessage) and in the X-Correlation-ID header of HTTP calls,
+and is used as the trace id of every span.
+
+Spans are written as structured log records (event_type="span") through the
+regular structlog pipeline, so with JSON logging they end up in the same
+log store as everything else and can be grouped by trace_id.
+
+Usage:
+    from shared_models.tracing import record_span, span, start_trace
+
+    with start_trace(event.correlation_id):
+        record_span("queue.wait", wait_seconds)
+        with span("agent.process_message", user_id=42):
+            ...
+"""
+
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from shared_models.logging import LogEventType, correlation_id_ctx, get_logger
+
+logger = get_logger("tracing")
+
+_enabled = True
+
+# Span id of the innermost open span (parent of new spans)
+_current_span_id: ContextVar[str | None] = ContextVar("current_span_id", default=None)
+# Start of the current trace in this service: (perf_counter, names marked once)
+_trace_state: ContextVar[tuple[float, set[str]] | None] = ContextVar(
+    "trace_state", default=None
+)
+
+
+def configure_tracing(enabled: bool = True) -> None:
+    """Enable or disable span emission for this process."""
+    global _enabled
+    _enabled = enabled
+
+
+def new_correlation_id() -> str:
+    """Generate a new correlation (trace) id."""
+    return str(uuid.uuid4())
+
+
+def stream_entry_time(entry_id: str | bytes | None) -> datetime | None:
+    """Return the time a Redis stream entry was added, from its id.
+
+    Stream ids have the form "<milliseconds>-<sequence>".
+    """
+    if entry_id is None:
+        return None
+    if isinstance(entry_id, bytes):
+        entry_id = entry_id.decode()
+    try:
+        millis = int(str(entry_id).split("-", 1)[0])
+    except ValueError:
+        return None
+    return datetime.fromtimestamp(millis / 1000, tz=UTC)
+
+
+def queue_wait_seconds(entry_id: str | bytes | None) -> float | None:
+    """Seconds a stream entry spent in the queue until now."""
+    added_at = stream_entry_time(entry_id)
+    if added_at is None:
+        return None
+    return max((datetime.now(UTC) - added_at).total_seconds(), 0.0)
+
+
+@contextmanager
+def start_trace(correlation_id: str | None = None) -> Iterator[str]:
+    """Continue (or start) a trace for the current unit of work.
+
+    Sets the correlation id used for logs, outgoing HTTP headers and spans,
+    and remembers the trace start for mark_once().
+
+    Yields:
+        The correlation id in effect
+    """
+    cid = correlation_id or correlation_id_ctx.get() or new_correlation_id()
+    cid_token = correlation_id_ctx.set(cid)
+    state_token = _trace_state.set((time.perf_counter(), set()))
+    span_token = _current_span_id.set(None)
+    try:
+        yield cid
+    finally:
+        _current_span_id.reset(span_token)
+        _trace_state.reset(state_token)
+        correlation_id_ctx.reset(cid_token)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+    """Record the wrapped block as a span.
+
+    Yields the attribute dict so callers can add attributes while running.
+    The span is marked as "error" if the block raises.
+    """
+    span_id = uuid.uuid4().hex[:16]
+    parent_id = _current_span_id.get()
+    token = _current_span_id.set(span_id)
+    started_at = datetime.now(UTC)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield attributes
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _current_span_id.reset(token)
+        _emit(
+            name,
+            span_id=span_id,
+            parent_id=parent_id,
+            started_at=started_at,
+            duration=time.perf_counter() - start,
+            status=status,
+            attributes=attributes,
+        )
+
+
+def record_span(
+    name: str, duration: float, status: str = "ok", **attributes: Any
+) -> None:
+    """Record an already-measured span that ended just now.
+
+    Used for intervals that are not a single code block, such as the time a
+    message waited in a queue.
+    """
+    _emit(
+        name,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=_current_span_id.get(),
+        started_at=datetime.now(UTC) - timedelta(seconds=duration),
+        duration=duration,
+        status=status,
+        attributes=attributes,
+    )
+
+
+def mark_once(name: str, **attributes: Any) -> None:
+    """Record a span from the trace start to now, at most once per trace.
+
+    E.g. mark_once("agent.time_to_first_llm_call") on every model start.
+    """
+    state = _trace_state.get()
+    if state is None:
+        return
+    trace_start, marked = state
+    if name in marked:
+        return
+    marked.add(name)
+    record_span(name, time.perf_counter() - trace_start, **attributes)
+
+
+def _emit(
+    name: str,
+    *,
+    span_id: str,
+    parent_id: str | None,
+    started_at: datetime,
+    duration: float,
+    status: str,
+    attributes: dict[str, Any],
+) -> None:
+    if not _enabled:
+        return
+    logger.info(
+        "span",
+        event_type=LogEventType.SPAN,
+        span_name=name,
+        trace_id=correlation_id_ctx.get(),
+        span_id=span_id,
+        parent_span_id=parent_id,
+        start_time=started_at.isoformat(),
+        duration_ms=round(duration * 1000, 2),
+        status=status,
+        **attributes,
+    )
@@ -360,3 +360,59 @@ class TestEnums:
 
         assert ReminderType.ONE_TIME == "one_time"
         assert ReminderType.RECURRING == "recurring"
+
+
+class TestMemorySchemas:
+    """Tests for Memory schemas and vector transport."""
+
+    def test_vector_codec_round_trip(self):
+        """Test base64 float32 encoding survives a round trip."""
+        from shared_models.api_schemas.memory import decode_vector, encode_vector
+
+        vector = [0.5, -1.25, 3.0, 0.0]
+
+        assert decode_vector(encode_vector(vector)) == vector
+
+    def test_search_request_accepts_list_or_base64(self):
+        """Test query embedding may be a JSON array or an encoded string."""
+        from shared_models.api_schemas.memory import (
+            MemorySearchRequest,
+            encode_vector,
+        )
+
+        as_list = MemorySearchRequest(embedding=[0.5, 0.25], user_id=1)
+        as_b64 = MemorySearchRequest(embedding=encode_vector([0.5, 0.25]), user_id=1)
+
+        assert as_list.embedding == as_b64.embedding == [0.5, 0.25]
+
+    def test_invalid_encoded_vector_rejected(self):
+        """Test malformed base64 vectors fail validation."""
+        from pydantic import ValidationError
+
+        from shared_models.api_schemas.memory import MemoryCreate
+
+        with pytest.raises(ValidationError):
+            MemoryCreate(
+                user_id=1, text="t", memory_type="fact", embedding="not base64!"
+            )
+
+    def test_memory_read_omits_embedding(self):
+        """Test read projections only carry vectors when asked."""
+        from shared_models.api_schemas.memory import (
+            MemoryRead,
+            MemoryReadWithEmbedding,
+        )
+
+        data = {
+            "id": uuid4(),
+            "user_id": 1,
+            "text": "likes tea",
+            "memory_type": "preference",
+            "last_accessed_at": datetime.now(UTC),
+            "created_at": datetime.now(UTC),
+            "updated_at": datetime.now(UTC),
+            "embedding": [0.1, 0.2],
+        }
+
+        assert "embedding" not in MemoryRead(**data).model_dump()
+        assert MemoryReadWithEmbedding(**data).embedding == [0.1, 0.2]
@@ -1,12 +1,13 @@
 """Tests for RedisCache."""
 
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from pydantic import BaseModel
 
-from shared_models.cache import CachedServiceClient, RedisCache
+from shared_models.cache import CachedServiceClient, RedisCache, SingleFlight
 
 
 class TestModel(BaseModel):
@@ -226,6 +227,102 @@ class TestRedisCache:
             assert result is None
 
 
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self):
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        waiters = [asyncio.create_task(flight.do("k", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["value"] * 5
+        assert calls == 1
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_not_kept(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert calls == 1
+
+        # The failure is not cached: the next call loads again
+        with pytest.raises(ValueError):
+            await flight.do("k", failing)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return 42
+
+        first = asyncio.create_task(flight.do("k", loader))
+        second = asyncio.create_task(flight.do("k", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestGetOrLoad:
+    @pytest.mark.asyncio
+    async def test_loads_once_and_caches(self, cache):
+        loader = AsyncMock(return_value=TestModel(id=1, name="a"))
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("m:1", TestModel, loader) for _ in range(3))
+        )
+
+        assert all(r == TestModel(id=1, name="a") for r in results)
+        loader.assert_awaited_once()
+        assert await cache.get("m:1", TestModel) == TestModel(id=1, name="a")
+
+    @pytest.mark.asyncio
+    async def test_returns_cached_without_loading(self, cache):
+        await cache.set("m:2", TestModel(id=2, name="b"))
+        loader = AsyncMock()
+
+        assert await cache.get_or_load("m:2", TestModel, loader) == TestModel(
+            id=2, name="b"
+        )
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self, cache):
+        loader = AsyncMock(return_value=None)
+
+        assert await cache.get_or_load("m:3", TestModel, loader) is None
+        assert await cache.get_or_load("m:3", TestModel, loader) is None
+        assert loader.await_count == 2
+
+
 class TestCachedServiceClient:
     """Tests for CachedServiceClient mixin."""
 
@@ -0,0 +1,102 @@
+"""Tests for config change events."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from shared_models.config_events import (
+    CONFIG_EVENTS_CHANNEL,
+    ConfigChangeEvent,
+    ConfigEventType,
+    publish_config_event,
+    subscribe_config_events,
+)
+
+
+class MockPubSub:
+    def __init__(self, messages):
+        self._messages = messages
+        self.subscribed: list[str] = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.subscribed.remove(channel)
+
+    async def aclose(self):
+        self.closed = True
+
+    async def listen(self):
+        for message in self._messages:
+            yield message
+
+
+class MockRedisClient:
+    def __init__(self, messages=None):
+        self.published: list[tuple[str, str]] = []
+        self._pubsub = MockPubSub(messages or [])
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+    def pubsub(self):
+        return self._pubsub
+
+
+@pytest.mark.asyncio
+async def test_publish_serializes_event():
+    redis = MockRedisClient()
+    event = ConfigChangeEvent(
+        event_type=ConfigEventType.ASSIGNMENT_CHANGED,
+        user_id=7,
+        assistant_id=uuid4(),
+    )
+
+    assert await publish_config_event(redis, event) is True
+
+    channel, payload = redis.published[0]
+    assert channel == CONFIG_EVENTS_CHANNEL
+    assert ConfigChangeEvent.model_validate_json(payload) == event
+
+
+@pytest.mark.asyncio
+async def test_publish_swallows_errors():
+    class FailingRedis:
+        async def publish(self, channel, message):
+            raise ConnectionError("down")
+
+    event = ConfigChangeEvent(event_type=ConfigEventType.TOOL_CHANGED, tool_id=uuid4())
+
+    assert await publish_config_event(FailingRedis(), event) is False
+
+
+@pytest.mark.asyncio
+async def test_subscribe_dispatches_valid_events_and_skips_malformed():
+    event = ConfigChangeEvent(
+        event_type=ConfigEventType.ASSISTANT_CHANGED, assistant_id=uuid4()
+    )
+    redis = MockRedisClient(
+        messages=[
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": b"not json"},
+            {"type": "message", "data": event.model_dump_json().encode()},
+        ]
+    )
+    received: list[ConfigChangeEvent] = []
+    subscribed = asyncio.Event()
+
+    async def callback(evt):
+        received.append(evt)
+
+    async def on_subscribed():
+        subscribed.set()
+
+    await subscribe_config_events(redis, callback, on_subscribed=on_subscribed)
+
+    assert subscribed.is_set()
+    assert received == [event]
+    assert redis._pubsub.closed is True
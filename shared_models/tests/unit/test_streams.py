@@ -0,0 +1,213 @@
+"""Tests for Redis stream retention helpers."""
+
+import io
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ResponseError
+
+from shared_models.streams import (
+    StreamGroupMonitor,
+    collect_group_stats,
+    get_queue_stats,
+    maxlen_kwargs,
+    record_stream_usage,
+    register_queue_monitor,
+    safe_trim_id,
+    stream_group_lag,
+    stream_memory_bytes,
+    trigger_lane,
+    trim_acknowledged,
+    write_queue_stats,
+)
+
+
+def make_client(groups, pending):
+    client = AsyncMock()
+    client.xinfo_groups.return_value = groups
+    client.xpending.side_effect = lambda stream, group: pending[group]
+    client.xtrim.return_value = 7
+    return client
+
+
+class TestMaxlenKwargs:
+    def test_approximate_cap(self):
+        assert maxlen_kwargs(1000) == {"maxlen": 1000, "approximate": True}
+
+    @pytest.mark.parametrize("maxlen", [None, 0])
+    def test_disabled(self, maxlen):
+        assert maxlen_kwargs(maxlen) == {}
+
+
+def test_trigger_lane():
+    assert trigger_lane("queue:to_secretary") == "queue:to_secretary:triggers"
+
+
+class TestSafeTrimId:
+    @pytest.mark.asyncio
+    async def test_uses_oldest_pending_across_groups(self):
+        client = make_client(
+            [
+                {"name": b"a", "last-delivered-id": b"30-0"},
+                {"name": b"b", "last-delivered-id": b"40-0"},
+            ],
+            {
+                "a": {"pending": 2, "min": b"20-1", "max": b"30-0"},
+                "b": {"pending": 1, "min": b"9-5", "max": b"40-0"},
+            },
+        )
+
+        assert await safe_trim_id(client, "s") == "9-5"
+
+    @pytest.mark.asyncio
+    async def test_without_pending_keeps_undelivered_entries(self):
+        client = make_client(
+            [{"name": "a", "last-delivered-id": "100-3"}],
+            {"a": {"pending": 0, "min": None, "max": None}},
+        )
+
+        assert await safe_trim_id(client, "s") == "100-4"
+
+    @pytest.mark.asyncio
+    async def test_compares_ids_numerically(self):
+        client = make_client(
+            [
+                {"name": "a", "last-delivered-id": "9-0"},
+                {"name": "b", "last-delivered-id": "10-0"},
+            ],
+            {"a": {"pending": 0}, "b": {"pending": 0}},
+        )
+
+        assert await safe_trim_id(client, "s") == "9-1"
+
+    @pytest.mark.asyncio
+    async def test_no_groups(self):
+        client = make_client([], {})
+
+        assert await safe_trim_id(client, "s") is None
+
+    @pytest.mark.asyncio
+    async def test_missing_stream(self):
+        client = AsyncMock()
+        client.xinfo_groups.side_effect = ResponseError("no such key")
+
+        assert await safe_trim_id(client, "s") is None
+
+
+class TestTrimAcknowledged:
+    @pytest.mark.asyncio
+    async def test_trims_by_minid(self):
+        client = make_client(
+            [{"name": "a", "last-delivered-id": "5-0"}],
+            {"a": {"pending": 1, "min": "3-0"}},
+        )
+
+        assert await trim_acknowledged(client, "s") == 7
+        client.xtrim.assert_awaited_once_with("s", minid="3-0", approximate=True)
+
+    @pytest.mark.asyncio
+    async def test_skips_streams_without_groups(self):
+        client = make_client([], {})
+
+        assert await trim_acknowledged(client, "s") == 0
+        client.xtrim.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_record_stream_usage():
+    client = AsyncMock()
+    client.xlen.return_value = 3
+    client.memory_usage.return_value = 2048
+
+    await record_stream_usage(client, "usage_test")
+
+    assert stream_memory_bytes.labels(stream="usage_test")._value.get() == 2048
+
+
+class TestCollectGroupStats:
+    @pytest.mark.asyncio
+    async def test_reports_lag_pending_and_age(self):
+        client = make_client(
+            [{"name": b"workers", "pending": 2, "lag": 5, "last-delivered-id": "9-0"}],
+            {"workers": {"pending": 2, "min": b"1000000-0", "max": b"1001000-0"}},
+        )
+
+        with patch("shared_models.streams.time.time", return_value=1030.0):
+            stats = await collect_group_stats(client, "lag_test")
+
+        assert stats == [
+            {
+                "stream": "lag_test",
+                "group": "workers",
+                "lag": 5,
+                "pending": 2,
+                "oldest_pending_age_seconds": 30.0,
+            }
+        ]
+        gauge = stream_group_lag.labels(stream="lag_test", group="workers")
+        assert gauge._value.get() == 5
+
+    @pytest.mark.asyncio
+    async def test_skips_xpending_when_nothing_pending(self):
+        client = make_client(
+            [{"name": "idle", "pending": 0, "lag": None, "last-delivered-id": "0-0"}],
+            {},
+        )
+
+        stats = await collect_group_stats(client, "s")
+
+        assert stats[0]["pending"] == 0
+        assert stats[0]["lag"] is None
+        client.xpending.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_stream(self):
+        client = AsyncMock()
+        client.xinfo_groups.side_effect = ResponseError("no such key")
+
+        assert await collect_group_stats(client, "s") == []
+
+
+@pytest.mark.asyncio
+async def test_monitor_snapshot_covers_all_streams():
+    client = AsyncMock()
+    client.xinfo_groups.side_effect = lambda stream: [
+        {"name": "g", "pending": 0, "lag": 0, "last-delivered-id": "0-0"}
+    ]
+    monitor = StreamGroupMonitor(client, ["a", "b"])
+    assert monitor.snapshot()["groups"] == []
+
+    await monitor.collect()
+
+    snapshot = monitor.snapshot()
+    assert [g["stream"] for g in snapshot["groups"]] == ["a", "b"]
+    assert snapshot["updated_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_monitor_reports_only_its_groups():
+    client = AsyncMock()
+    client.xinfo_groups.return_value = [
+        {"name": "mine", "pending": 0, "lag": 0, "last-delivered-id": "0-0"},
+        {"name": "theirs", "pending": 0, "lag": 5, "last-delivered-id": "0-0"},
+    ]
+    monitor = StreamGroupMonitor(client, ["a"], groups=["mine"])
+
+    snapshot = await monitor.collect()
+
+    assert [g["group"] for g in snapshot["groups"]] == ["mine"]
+
+
+def test_queue_stats_serve_registered_monitor():
+    monitor = StreamGroupMonitor(AsyncMock(), ["a"])
+    monitor._snapshot = {"updated_at": 1.0, "groups": [{"stream": "a"}]}
+    handler = MagicMock()
+    handler.wfile = io.BytesIO()
+
+    register_queue_monitor(monitor)
+    write_queue_stats(handler)
+
+    handler.send_response.assert_called_once_with(200)
+    assert json.loads(handler.wfile.getvalue()) == get_queue_stats()
+    assert get_queue_stats()["groups"] == [{"stream": "a"}]
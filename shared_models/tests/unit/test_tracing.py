@@ -0,0 +1,131 @@
+"""Tests for span tracing and correlation id propagation."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared_models import (
+    AssistantResponseMessage,
+    QueueMessage,
+    QueueMessageSource,
+    QueueTrigger,
+    TriggerType,
+    get_correlation_id,
+)
+from shared_models.tracing import (
+    configure_tracing,
+    mark_once,
+    queue_wait_seconds,
+    record_span,
+    span,
+    start_trace,
+    stream_entry_time,
+)
+
+
+@pytest.fixture
+def span_logger():
+    """Capture emitted spans."""
+    configure_tracing(enabled=True)
+    with patch("shared_models.tracing.logger", MagicMock()) as mock_logger:
+        yield mock_logger
+
+
+def emitted(span_logger) -> list[dict]:
+    return [call.kwargs for call in span_logger.info.call_args_list]
+
+
+class TestStartTrace:
+    def test_uses_given_correlation_id_and_restores(self):
+        assert get_correlation_id() is None
+        with start_trace("abc") as cid:
+            assert cid == "abc"
+            assert get_correlation_id() == "abc"
+        assert get_correlation_id() is None
+
+    def test_generates_correlation_id(self):
+        with start_trace() as cid:
+            assert cid
+            assert get_correlation_id() == cid
+
+
+class TestSpans:
+    def test_nested_spans_share_trace_and_link_parent(self, span_logger):
+        with start_trace("trace-1"):
+            with span("outer"):
+                with span("inner", user_id=1):
+                    pass
+
+        inner, outer = emitted(span_logger)
+        assert inner["span_name"] == "inner"
+        assert inner["trace_id"] == outer["trace_id"] == "trace-1"
+        assert inner["parent_span_id"] == outer["span_id"]
+        assert outer["parent_span_id"] is None
+        assert inner["user_id"] == 1
+
+    def test_span_marks_error_and_reraises(self, span_logger):
+        with pytest.raises(ValueError), start_trace(), span("failing"):
+            raise ValueError("boom")
+
+        assert emitted(span_logger)[0]["status"] == "error"
+
+    def test_record_span_uses_given_duration(self, span_logger):
+        with start_trace():
+            record_span("queue.wait", 1.5, stream="s")
+
+        record = emitted(span_logger)[0]
+        assert record["duration_ms"] == 1500
+        assert record["stream"] == "s"
+
+    def test_mark_once_records_only_first_call(self, span_logger):
+        with start_trace():
+            mark_once("first_llm_call")
+            mark_once("first_llm_call")
+
+        assert len(emitted(span_logger)) == 1
+
+    def test_disabled_tracing_emits_nothing(self, span_logger):
+        configure_tracing(enabled=False)
+        try:
+            with start_trace(), span("ignored"):
+                pass
+        finally:
+            configure_tracing(enabled=True)
+
+        assert emitted(span_logger) == []
+
+
+class TestQueueWait:
+    def test_stream_entry_time_parses_redis_id(self):
+        added_at = stream_entry_time(b"1700000000123-0")
+        assert added_at is not None
+        assert added_at.timestamp() == pytest.approx(1700000000.123)
+
+    def test_queue_wait_seconds(self):
+        entry_id = f"{int((time.time() - 2) * 1000)}-0"
+        assert queue_wait_seconds(entry_id) == pytest.approx(2, abs=0.5)
+
+    def test_invalid_entry_id(self):
+        assert queue_wait_seconds("not-an-id") is None
+        assert queue_wait_seconds(None) is None
+
+
+class TestQueueModelsCarryCorrelationId:
+    def test_queue_message_round_trip(self):
+        message = QueueMessage(user_id=1, content="hi", correlation_id="c-1")
+        restored = QueueMessage.model_validate_json(message.model_dump_json())
+        assert restored.correlation_id == "c-1"
+
+    def test_queue_trigger_round_trip(self):
+        trigger = QueueTrigger(
+            trigger_type=TriggerType.REMINDER,
+            user_id=1,
+            source=QueueMessageSource.CRON,
+            correlation_id="c-2",
+        )
+        assert QueueTrigger.from_json(trigger.to_json()).correlation_id == "c-2"
+
+    def test_response_defaults_to_none(self):
+        response = AssistantResponseMessage(user_id=1, status="success", response="ok")
+        assert response.correlation_id is None
@@ -1,6 +1,7 @@
+from collections.abc import Awaitable, Callable, Hashable
 from typing import Any
 
-from shared_models import get_logger
+from shared_models import get_logger, span, start_trace
 
 from clients.rest import TelegramRestClient
 from clients.telegram import TelegramClient
@@ -10,12 +11,93 @@ from handlers import (
     command_start,
     message_text,
 )
+from metrics import telegram_updates_total
+from utils.keyed_executor import KeyedExecutor
 
 logger = get_logger(__name__)
 
 
+def update_chat_key(update: dict[str, Any]) -> Hashable:
+    """Key that orders updates: the chat, else the sender, else the update."""
+    if "message" in update:
+        message = update["message"]
+        chat_id = message.get("chat", {}).get("id")
+        sender_id = message.get("from", {}).get("id")
+    elif "callback_query" in update:
+        callback = update["callback_query"]
+        chat_id = callback.get("message", {}).get("chat", {}).get("id")
+        sender_id = callback.get("from", {}).get("id")
+    else:
+        chat_id = sender_id = None
+    return chat_id or sender_id or ("update", update.get("update_id"))
+
+
+class UpdateDispatcher:
+    """Hands updates to dispatch_update with bounded, per-chat-ordered tasks.
+
+    Shared by polling and webhook ingestion: updates from one chat are
+    handled strictly in arrival order, different chats concurrently, and
+    ``submit`` blocks once too many updates are outstanding (see
+    KeyedExecutor).
+    """
+
+    def __init__(
+        self,
+        telegram: TelegramClient,
+        rest: TelegramRestClient,
+        max_concurrency: int,
+        handler: Callable[..., Awaitable[None]] | None = None,
+    ):
+        self.telegram = telegram
+        self.rest = rest
+        self._handler = handler or dispatch_update
+        self._executor = KeyedExecutor(max_concurrency)
+
+    async def submit(self, update: dict[str, Any]) -> None:
+        self._count(update)
+        await self._executor.submit(
+            update_chat_key(update),
+            self._handler(update=update, telegram=self.telegram, rest=self.rest),
+        )
+
+    async def try_submit(self, update: dict[str, Any]) -> bool:
+        """Queue ``update`` without waiting; False if the dispatcher is full."""
+        accepted = await self._executor.try_submit(
+            update_chat_key(update),
+            self._handler(update=update, telegram=self.telegram, rest=self.rest),
+        )
+        # A refused update is redelivered, so it is counted once accepted
+        if accepted:
+            self._count(update)
+        return accepted
+
+    @staticmethod
+    def _count(update: dict[str, Any]) -> None:
+        update_type = next(
+            (key for key in ("message", "callback_query") if key in update),
+            "other",
+        )
+        telegram_updates_total.labels(update_type=update_type).inc()
+
+    async def close(self) -> None:
+        """Cancel updates still being handled."""
+        await self._executor.cancel()
+
+
 async def dispatch_update(
     update: dict[str, Any], telegram: TelegramClient, rest: TelegramRestClient
+) -> None:
+    """Handle an update as the start of a new trace.
+
+    The correlation id set here is sent with REST calls and carried by the
+    queue message to assistant_service.
+    """
+    with start_trace(), span("bot.handle_update", update_id=update.get("update_id")):
+        await _dispatch_update(update, telegram, rest)
+
+
+async def _dispatch_update(
+    update: dict[str, Any], telegram: TelegramClient, rest: TelegramRestClient
 ) -> None:
     """Determines the type of update and calls the appropriate handler."""
     try:
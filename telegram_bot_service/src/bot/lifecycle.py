@@ -4,7 +4,12 @@ from http.server import HTTPServer
 
 import aiohttp
 from redis import asyncio as aioredis
-from shared_models import LogEventType, get_logger
+from shared_models import (
+    LogEventType,
+    StreamGroupMonitor,
+    get_logger,
+    register_queue_monitor,
+)
 
 from clients.rest import RestClient
 from clients.telegram import TelegramClient
@@ -12,8 +17,9 @@ from config.settings import settings
 from metrics import start_metrics_server
 from services.response_processor import handle_assistant_responses
 
-from .dispatcher import dispatch_update
+from .dispatcher import UpdateDispatcher
 from .polling import run_polling
+from .webhook import run_webhook
 
 logger = get_logger(__name__)
 
@@ -26,6 +32,7 @@ class BotLifecycle:
         self._rest_client: RestClient | None = None
         self._redis_client: aioredis.Redis | None = None
         self._metrics_server: HTTPServer | None = None
+        self._dispatcher: UpdateDispatcher | None = None
         self._tasks: list[asyncio.Task] = []
         self._should_stop = asyncio.Event()
 
@@ -82,17 +89,22 @@ class BotLifecycle:
 
         logger.info("Starting background tasks...")
 
-        # Task for polling Telegram updates and dispatching them
-        polling_task = asyncio.create_task(
-            run_polling(
-                self._telegram_client,
-                self._rest_client,
-                self._should_stop,
-                dispatch_update,
-            )
+        self._dispatcher = UpdateDispatcher(
+            self._telegram_client,
+            self._rest_client,
+            max_concurrency=settings.update_max_concurrency,
+        )
+
+        # Task for receiving Telegram updates and dispatching them
+        if settings.update_mode == "webhook":
+            ingest = run_webhook
+        else:
+            ingest = run_polling
+        ingest_task = asyncio.create_task(
+            ingest(self._telegram_client, self._dispatcher, self._should_stop)
         )
-        self._tasks.append(polling_task)
-        logger.info("Polling task created.")
+        self._tasks.append(ingest_task)
+        logger.info("Update ingestion task created.", mode=settings.update_mode)
 
         # Task for handling responses from the assistant queue
         response_handler_task = asyncio.create_task(
@@ -101,6 +113,19 @@ class BotLifecycle:
         self._tasks.append(response_handler_task)
         logger.info("Response handler task created.")
 
+        # Lag/pending gauges of the group this service consumes
+        # (assistant_service reports the input streams), also served as JSON
+        # on /queues
+        queue_monitor = StreamGroupMonitor(
+            self._redis_client,
+            [settings.assistant_output_queue],
+            groups=[settings.output_stream_group],
+        )
+        register_queue_monitor(queue_monitor)
+        self._tasks.append(
+            asyncio.create_task(queue_monitor.run(settings.queue_stats_interval))
+        )
+
         logger.info(f"{len(self._tasks)} tasks started.")
 
     async def _shutdown(self, signal_name: str = "") -> None:
@@ -119,6 +144,8 @@ class BotLifecycle:
                 task.cancel()
         # Wait for tasks to finish cancelling
         await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._dispatcher:
+            await self._dispatcher.close()
         logger.info("All tasks cancelled or finished.")
 
         # Close client connections
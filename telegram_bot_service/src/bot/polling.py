@@ -1,28 +1,34 @@
 import asyncio
-from collections.abc import Callable
-from typing import Any
 
 from shared_models import get_logger
 
-from clients.rest import TelegramRestClient
 from clients.telegram import TelegramClient
 from config.settings import settings
 
+from .dispatcher import UpdateDispatcher
+
 logger = get_logger(__name__)
 
 
 async def run_polling(
     telegram: TelegramClient,
-    rest: TelegramRestClient,
+    dispatcher: UpdateDispatcher,
     stop_event: asyncio.Event,
-    dispatcher_callback: Callable[..., Any],
 ) -> None:
     """Runs the main polling loop to get updates from Telegram."""
     logger.info("Starting polling loop...")
     last_update_id = 0
 
+    # getUpdates is rejected while a webhook is registered
+    try:
+        await telegram.delete_webhook()
+    except Exception as e:
+        logger.warning("Failed to delete webhook before polling", error=str(e))
+
     while not stop_event.is_set():
         try:
+            # Long poll: returns as soon as updates arrive, so no extra
+            # delay is needed between batches
             updates = await telegram.get_updates(offset=last_update_id + 1)
 
             if updates:
@@ -32,15 +38,9 @@ async def run_polling(
                     if update_id:
                         last_update_id = max(last_update_id, update_id)
 
-                    # Запускаем обработку обновления в отдельной задаче,
-                    # чтобы не блокировать получение следующих обновлений
-                    # Передаем нужные клиенты диспетчеру
-                    asyncio.create_task(
-                        dispatcher_callback(update=update, telegram=telegram, rest=rest)
-                    )
-            # Небольшая пауза перед следующим запросом, если не было обновлений
-            # или после обработки пачки обновлений
-            await asyncio.sleep(settings.update_interval)
+                    # Обработка идет в фоне с сохранением порядка внутри чата;
+                    # submit ждет, если обрабатывается слишком много обновлений
+                    await dispatcher.submit(update)
 
         except asyncio.CancelledError:
             logger.info("Polling loop cancelled.")
@@ -0,0 +1,82 @@
+import asyncio
+import hmac
+
+from aiohttp import web
+from shared_models import get_logger
+
+from clients.telegram import TelegramClient
+from config.settings import settings
+from metrics import telegram_updates_rejected_total
+
+from .dispatcher import UpdateDispatcher
+
+logger = get_logger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def create_webhook_app(
+    dispatcher: UpdateDispatcher, secret_token: str, path: str
+) -> web.Application:
+    """aiohttp app accepting Telegram updates posted to ``path``."""
+
+    async def handle_update(request: web.Request) -> web.Response:
+        received = request.headers.get(SECRET_TOKEN_HEADER, "")
+        if not hmac.compare_digest(received, secret_token):
+            logger.warning("Rejected webhook request with invalid secret token")
+            return web.Response(status=401)
+        try:
+            update = await request.json()
+        except ValueError:
+            return web.Response(status=400)
+
+        # Never wait for room: a slow answer makes Telegram time out and
+        # resend, and it holds back the next updates. When the dispatcher is
+        # full, answer 503 at once so Telegram redelivers the update later
+        if not await dispatcher.try_submit(update):
+            telegram_updates_rejected_total.inc()
+            logger.warning(
+                "Dispatcher full, rejecting webhook update for redelivery",
+                update_id=update.get("update_id"),
+            )
+            return web.Response(status=503)
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_post(path, handle_update)
+    return app
+
+
+async def run_webhook(
+    telegram: TelegramClient,
+    dispatcher: UpdateDispatcher,
+    stop_event: asyncio.Event,
+) -> None:
+    """Serve the webhook endpoint and register it with Telegram."""
+    if not settings.webhook_url or not settings.webhook_secret_token:
+        raise ValueError(
+            "webhook_url and webhook_secret_token are required in webhook mode"
+        )
+
+    app = create_webhook_app(
+        dispatcher, settings.webhook_secret_token, settings.webhook_path
+    )
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, settings.webhook_host, settings.webhook_port)
+    await site.start()
+    logger.info(
+        "Webhook server started",
+        host=settings.webhook_host,
+        port=settings.webhook_port,
+        path=settings.webhook_path,
+    )
+
+    try:
+        await telegram.set_webhook(
+            settings.webhook_url, secret_token=settings.webhook_secret_token
+        )
+        await stop_event.wait()
+    finally:
+        await runner.cleanup()
+        logger.warning("Webhook server stopped.")
@@ -14,6 +14,7 @@ from shared_models.api_schemas import (
     AssistantRead,
     MessageCreate,
     MessageRead,
+    TelegramUserContext,
     TelegramUserCreate,
     TelegramUserRead,
     UserSecretaryLinkRead,
@@ -94,6 +95,24 @@ class TelegramRestClient(BaseServiceClient):
                 return None
             raise
 
+    async def get_user_context(self, telegram_id: int) -> TelegramUserContext | None:
+        """Get user and active secretary by telegram_id in one request."""
+        try:
+            response_data = await self.request(
+                "GET", f"/api/users/by-telegram-id/{telegram_id}/context"
+            )
+            if response_data is None:
+                return None
+            return self._parse_response(
+                response_data,
+                TelegramUserContext,
+                context={"telegram_id": telegram_id, "method": "get_user_context"},
+            )
+        except ServiceResponseError as e:
+            if e.status_code == 404:
+                return None
+            raise
+
     async def _create_user(
         self, telegram_id: int, username: str | None = None
     ) -> TelegramUserRead:
@@ -9,6 +9,15 @@ from config.settings import settings
 logger = structlog.get_logger()
 
 
+class TelegramRetryAfter(Exception):
+    """Telegram rejected a request with 429; retry after ``retry_after`` s."""
+
+    def __init__(self, method: str, retry_after: float):
+        super().__init__(f"Telegram flood control on {method}: retry in {retry_after}s")
+        self.method = method
+        self.retry_after = retry_after
+
+
 class TelegramClient:
     """Async client for Telegram Bot API."""
 
@@ -36,6 +45,10 @@ class TelegramClient:
 
         try:
             async with self.session.post(url, **kwargs) as response:
+                if response.status == 429:
+                    result = await response.json(content_type=None)
+                    retry_after = (result.get("parameters") or {}).get("retry_after", 1)
+                    raise TelegramRetryAfter(method, float(retry_after))
                 response.raise_for_status()
                 result = await response.json()
 
@@ -46,6 +59,11 @@ class TelegramClient:
 
                 return result.get("result", {})
 
+        except TelegramRetryAfter as e:
+            logger.warning(
+                "Telegram rate limit hit", method=method, retry_after=e.retry_after
+            )
+            raise
         except Exception as e:
             logger.error(
                 "Telegram request error", method=method, error=str(e), exc_info=True
@@ -64,6 +82,21 @@ class TelegramClient:
             payload["parse_mode"] = parse_mode
         return await self._make_request("sendMessage", json=payload)
 
+    async def edit_message_text(
+        self, chat_id: int, message_id: int, text: str
+    ) -> dict[str, Any]:
+        """Replace the text of a message sent by the bot."""
+        return await self._make_request(
+            "editMessageText",
+            json={"chat_id": chat_id, "message_id": message_id, "text": text},
+        )
+
+    async def delete_message(self, chat_id: int, message_id: int) -> dict[str, Any]:
+        """Delete a message sent by the bot."""
+        return await self._make_request(
+            "deleteMessage", json={"chat_id": chat_id, "message_id": message_id}
+        )
+
     async def send_message_with_inline_keyboard(
         self,
         chat_id: int,
@@ -137,6 +170,27 @@ class TelegramClient:
         )
         return result if isinstance(result, list) else []
 
+    async def set_webhook(
+        self,
+        url: str,
+        secret_token: str,
+        allowed_updates: list[str] | None = None,
+    ) -> None:
+        """Register the webhook Telegram will POST updates to."""
+        await self._make_request(
+            "setWebhook",
+            json={
+                "url": url,
+                "secret_token": secret_token,
+                "allowed_updates": allowed_updates or ["message", "callback_query"],
+            },
+        )
+        logger.info("Webhook registered", url=url)
+
+    async def delete_webhook(self) -> None:
+        """Remove the webhook so getUpdates can be used."""
+        await self._make_request("deleteWebhook", json={})
+
     async def send_chat_action(self, chat_id: int, action: str = "typing") -> bool:
         """Send chat action to indicate bot activity (e.g., 'typing').
 
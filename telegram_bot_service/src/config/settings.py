@@ -9,10 +9,12 @@ class Settings(BaseSettings):
     # Telegram settings
     telegram_token: str
     telegram_rate_limit: int = 30  # requests per second
+    telegram_chat_rate_limit: float = 1.0  # messages per second to one chat
 
     # Logging
     log_level: str = "INFO"
     log_json_format: bool = True
+    tracing_enabled: bool = True  # Emit per-stage spans as JSON log records
 
     # Metrics
     metrics_port: int = 8080
@@ -32,14 +34,35 @@ class Settings(BaseSettings):
     stream_consumer: str = os.getenv(
         "REDIS_STREAM_CONSUMER", os.getenv("HOSTNAME", "telegram_consumer")
     )
+    stream_maxlen: int = 100_000  # approximate MAXLEN on XADD; 0 disables
+    queue_stats_interval: int = 15  # seconds between consumer-group lag checks
     user_messages_prefix: str = "user_messages:"
 
     # REST service settings
     rest_service_url: str = "http://rest_service:8000"
 
+    # Update ingestion: "polling" (getUpdates) or "webhook"
+    update_mode: str = "polling"
+    webhook_url: str | None = None  # Public HTTPS URL registered with Telegram
+    webhook_secret_token: str | None = None  # Required in webhook mode
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8443
+    webhook_path: str = "/telegram/webhook"
+    update_max_concurrency: int = 100  # updates being handled at once
+
     # Application settings
-    update_interval: float = 1.0  # seconds
+    update_interval: float = 1.0  # seconds; polling retry delay base on errors
     batch_size: int = 100  # number of updates to process at once
+    response_batch_size: int = 50  # assistant responses read per XREADGROUP
+    response_max_concurrency: int = 50  # responses being delivered at once
+    # Streamed replies: min seconds between edits of the in-progress message
+    stream_edit_interval: float = 1.5
+    # user_id -> chat_id for responses that arrive without routing info
+    chat_id_cache_size: int = 10_000
+    chat_id_cache_ttl: float = 3600.0  # seconds
+    # telegram_id -> user + active secretary, checked on every text message
+    user_context_cache_size: int = 10_000
+    user_context_cache_ttl: float = 30.0  # seconds
 
     # Redis connection settings
     redis_settings: dict = {
@@ -83,6 +83,7 @@ async def handle_select_secretary(**context: Any) -> None:
         # 3. Assign secretary via REST
         try:
             await user_service.set_user_secretary(rest, user_id, secretary_id)
+            user_service.invalidate_user_context(telegram_id)
 
             # 4. Get assistant details to check for startup_message
             assistant_details = await rest.get_assistant_by_id(secretary_id)
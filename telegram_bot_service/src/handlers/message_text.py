@@ -1,7 +1,8 @@
+import asyncio
 from typing import Any
 
 from shared_models import ServiceClientError, get_logger
-from shared_models.api_schemas import AssistantRead, TelegramUserRead
+from shared_models.api_schemas import TelegramUserContext
 
 from clients.rest import TelegramRestClient
 from clients.telegram import TelegramClient
@@ -13,8 +14,7 @@ logger = get_logger(__name__)
 async def handle_text_message(**context: Any) -> None:
     """Handles regular text messages from users.
 
-    - Checks if the user exists.
-    - Checks if a secretary is assigned.
+    - Checks if the user exists and a secretary is assigned (one request).
     - Prompts for secretary selection if needed.
     - Sends the message to the assistant queue if user and secretary are set.
     """
@@ -38,14 +38,14 @@ async def handle_text_message(**context: Any) -> None:
             text_preview=text[:50],
         )
 
-        # 1. Check if user exists
-        user: TelegramUserRead | None = None
+        # 1. Resolve user and assigned secretary in one (cached) request
+        user_context: TelegramUserContext | None = None
         try:
-            user = await user_service.get_user_by_telegram_id(rest, telegram_id)
+            user_context = await user_service.get_user_context(rest, telegram_id)
         except ServiceClientError as e:
             # Handle non-404 errors specifically if needed, otherwise generic message
             logger.error(
-                "REST Client Error getting user by telegram_id",
+                "REST Client Error getting user context by telegram_id",
                 telegram_id=telegram_id,
                 error=str(e),
             )
@@ -53,14 +53,8 @@ async def handle_text_message(**context: Any) -> None:
                 chat_id, "Не удалось проверить пользователя. Попробуйте позже."
             )
             return
-        except ValueError:
-            logger.error("Invalid telegram_id format", user_id_str=user_id_str)
-            await telegram.send_message(
-                chat_id, "Произошла ошибка: неверный формат ID."
-            )
-            return
 
-        if not user:
+        if not user_context:
             # User does not exist (404 from REST client), prompt to /start
             logger.info(
                 "User does not exist, prompting /start", telegram_id=telegram_id
@@ -71,26 +65,10 @@ async def handle_text_message(**context: Any) -> None:
             return
 
         # User exists, get internal ID
-        user_id = user.id
+        user_id = user_context.user.id
 
         # 2. Check if secretary is assigned
-        assigned_secretary: AssistantRead | None = None
-        try:
-            assigned_secretary = await user_service.get_assigned_secretary(
-                rest, user_id
-            )
-        except ServiceClientError as e:
-            # Handle non-404 errors specifically if needed
-            logger.error(
-                "REST Client Error getting user secretary",
-                user_id=user_id,
-                error=str(e),
-            )
-            await telegram.send_message(
-                chat_id, "Не удалось проверить вашего секретаря. Попробуйте позже."
-            )
-            return
-
+        assigned_secretary = user_context.secretary
         if not assigned_secretary:
             # Secretary not assigned, prompt choice using the new service function
             logger.info(
@@ -118,9 +96,6 @@ async def handle_text_message(**context: Any) -> None:
             secretary_id=assigned_secretary.id,
         )
 
-        # Show typing indicator to user
-        await telegram.send_chat_action(chat_id, "typing")
-
         # Prepare metadata for the queue message
         metadata = {
             "username": username,
@@ -131,8 +106,13 @@ async def handle_text_message(**context: Any) -> None:
 
         # --- Use message_queue service ---
         try:
-            await message_queue.send_message_to_assistant(
-                user_id=user_id, content=text, metadata=metadata
+            # Show typing indicator while enqueueing instead of before it;
+            # send_chat_action never raises
+            await asyncio.gather(
+                telegram.send_chat_action(chat_id, "typing"),
+                message_queue.send_message_to_assistant(
+                    user_id=user_id, content=text, metadata=metadata
+                ),
             )
         except (
             Exception
@@ -1,6 +1,11 @@
 import asyncio
 
-from shared_models import LogEventType, configure_logging, get_logger
+from shared_models import (
+    LogEventType,
+    configure_logging,
+    configure_tracing,
+    get_logger,
+)
 
 from bot.lifecycle import run_bot
 from config.settings import settings
@@ -11,6 +16,7 @@ configure_logging(
     log_level=settings.log_level,
     json_format=settings.log_json_format,
 )
+configure_tracing(enabled=settings.tracing_enabled)
 logger = get_logger(__name__)
 
 
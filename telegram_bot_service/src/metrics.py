@@ -9,6 +9,7 @@ from prometheus_client import (
     Histogram,
     generate_latest,
 )
+from shared_models import write_queue_stats
 
 # Telegram metrics
 telegram_updates_total = Counter(
@@ -17,6 +18,11 @@ telegram_updates_total = Counter(
     ["update_type"],
 )
 
+telegram_updates_rejected_total = Counter(
+    "telegram_updates_rejected_total",
+    "Webhook updates refused for redelivery while the dispatcher was full",
+)
+
 telegram_messages_sent_total = Counter(
     "telegram_messages_sent_total",
     "Total messages sent to Telegram",
@@ -41,7 +47,7 @@ def get_content_type() -> str:
 
 
 class MetricsHandler(BaseHTTPRequestHandler):
-    """HTTP handler for /metrics and /health endpoints."""
+    """HTTP handler for /metrics, /health and /queues endpoints."""
 
     def do_GET(self):
         if self.path == "/metrics":
@@ -54,6 +60,8 @@ class MetricsHandler(BaseHTTPRequestHandler):
             self.send_header("Content-Type", "text/plain")
             self.end_headers()
             self.wfile.write(b"OK")
+        elif self.path == "/queues":
+            write_queue_stats(self)
         else:
             self.send_response(404)
             self.end_headers()
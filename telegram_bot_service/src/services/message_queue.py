@@ -3,7 +3,14 @@ from uuid import UUID
 
 import redis.asyncio as aioredis
 import structlog
-from shared_models import QueueDirection, QueueLogger
+from shared_models import (
+    QueueDirection,
+    QueueLogger,
+    get_correlation_id,
+    maxlen_kwargs,
+    new_correlation_id,
+    span,
+)
 from shared_models.queue import QueueMessage
 
 from config.settings import settings
@@ -36,6 +43,7 @@ async def send_message_to_assistant(
             user_id=user_id,
             content=content,
             metadata=metadata,
+            correlation_id=get_correlation_id() or new_correlation_id(),
         )
 
         message_json = queue_message.model_dump_json()
@@ -55,15 +63,18 @@ async def send_message_to_assistant(
         # Consider using a shared Redis client instance if performance becomes an issue
         # For now, create/close connection per message for simplicity
         redis_client = aioredis.from_url(settings.redis_url, **settings.redis_settings)
-        await redis_client.xadd(
-            settings.input_queue,
-            {"payload": message_json.encode("utf-8")},
-        )
+        with span("queue.publish", stream=settings.input_queue):
+            await redis_client.xadd(
+                settings.input_queue,
+                {"payload": message_json.encode("utf-8")},
+                **maxlen_kwargs(settings.stream_maxlen),
+            )
         logger.info(
             "Message successfully sent to assistant queue",
             user_id=user_id,
             queue=settings.input_queue,
             message_preview=content[:50],
+            correlation_id=queue_message.correlation_id,
         )
 
         # Log to REST API for observability
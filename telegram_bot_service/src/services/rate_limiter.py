@@ -0,0 +1,86 @@
+"""Token-bucket rate limiting for outgoing Telegram messages.
+
+Telegram allows roughly 30 messages per second overall and about one message
+per second to a single chat; going over either limit yields a 429 response
+with a ``retry_after`` hint. Buckets hand out reservations (tokens may go
+negative), so waiters are served in arrival order without locks.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    @property
+    def is_full(self) -> bool:
+        self._refill()
+        return self._tokens >= self.capacity
+
+
+class TelegramRateLimiter:
+    """Global plus per-chat limits, with a global pause after a 429."""
+
+    def __init__(
+        self,
+        global_rate: float,
+        per_chat_rate: float,
+        max_tracked_chats: int = 10_000,
+    ):
+        self._global = TokenBucket(global_rate)
+        self._per_chat_rate = per_chat_rate
+        self._chats: dict[int, TokenBucket] = {}
+        self._max_tracked_chats = max_tracked_chats
+        self._paused_until = 0.0
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self._max_tracked_chats:
+                # A full bucket carries no state worth keeping
+                self._chats = {
+                    key: value
+                    for key, value in self._chats.items()
+                    if not value.is_full
+                }
+            bucket = self._chats[chat_id] = TokenBucket(self._per_chat_rate)
+        return bucket
+
+    async def acquire(self, chat_id: int) -> None:
+        """Wait until a message may be sent to ``chat_id``."""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        # Per-chat first, so a busy chat does not hold global tokens idle
+        delay = self._chat_bucket(chat_id).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        delay = self._global.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all sends for ``seconds`` (Telegram's retry_after)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
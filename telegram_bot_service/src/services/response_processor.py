@@ -1,19 +1,61 @@
 import asyncio
-import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from pydantic import ValidationError
 from redis import asyncio as aioredis
 from redis.exceptions import ResponseError
-from shared_models import QueueDirection, QueueLogger, get_logger
+from shared_models import (
+    QueueDirection,
+    QueueLogger,
+    get_logger,
+    queue_wait_seconds,
+    record_span,
+    span,
+    start_trace,
+)
 from shared_models.queue import AssistantResponseMessage
 
 from clients.rest import TelegramRestClient
-from clients.telegram import TelegramClient
+from clients.telegram import TelegramClient, TelegramRetryAfter
 from config.settings import settings
+from metrics import telegram_messages_sent_total
+from services.rate_limiter import TelegramRateLimiter
+from utils.keyed_executor import KeyedExecutor
+from utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 queue_logger = QueueLogger(settings.rest_service_url)
 
+# Responses to user messages carry chat_id; triggers (reminders, calendar)
+# usually do not, so remember the chat per user to avoid a REST lookup each
+chat_id_cache = TTLCache(
+    maxsize=settings.chat_id_cache_size, ttl=settings.chat_id_cache_ttl
+)
+
+# Streamed replies in progress: stream_id -> StreamedReply. Entries whose
+# final event never arrives expire.
+streamed_replies = TTLCache(maxsize=1_000, ttl=600)
+
+# Attempts per message when Telegram answers 429
+MAX_SEND_ATTEMPTS = 3
+
+# Telegram's maximum message length
+MAX_MESSAGE_LENGTH = 4096
+
+# Appended to a streamed reply that ends with an error instead of a final text
+INTERRUPTED_SUFFIX = "\n\n[ответ прерван]"
+
+
+class StreamedReply:
+    """Telegram message being edited as a streamed reply grows."""
+
+    def __init__(self, message_id: int, text: str):
+        self.message_id = message_id
+        self.text = text
+        self.edited_at = time.monotonic()
+
 
 async def handle_assistant_responses(
     telegram: TelegramClient, redis: aioredis.Redis
@@ -21,6 +63,9 @@ async def handle_assistant_responses(
     """
     Handle responses from assistant.
 
+    Responses are read from the stream in batches and delivered concurrently,
+    in order per user, under Telegram's global and per-chat rate limits.
+
     Args:
         telegram: Telegram client instance
         redis: Redis client instance
@@ -29,116 +74,381 @@ async def handle_assistant_responses(
 
     await _ensure_output_group(redis)
 
-    async with TelegramRestClient() as rest:
-        while True:
-            try:
-                message_id, data = await _read_next_response(redis)
-                if not message_id:
-                    await asyncio.sleep(0.1)
-                    continue
+    limiter = TelegramRateLimiter(
+        global_rate=settings.telegram_rate_limit,
+        per_chat_rate=settings.telegram_chat_rate_limit,
+    )
+    executor = KeyedExecutor(settings.response_max_concurrency)
+    # Entries being delivered, so a slow delivery is not reclaimed twice
+    in_flight: set = set()
 
+    async with TelegramRestClient() as rest:
+        try:
+            while True:
                 try:
-                    response_message = AssistantResponseMessage.model_validate_json(
-                        data
-                    )
-                    logger.debug(
-                        "Successfully validated AssistantResponseMessage",
-                        user_id=response_message.user_id,
-                    )
-
-                    # Log to REST API for observability
-                    try:
-                        await queue_logger.log_message(
-                            queue_name="to_telegram",
-                            direction=QueueDirection.OUTBOUND,
-                            message_type="response",
-                            payload=response_message.model_dump(),
-                            user_id=int(str(response_message.user_id).split("-")[0])
-                            if response_message.user_id
-                            else None,
-                            source="assistant",
-                        )
-                    except Exception as log_err:
-                        logger.warning(
-                            "Failed to log queue message to REST API",
-                            error=str(log_err),
+                    batch = await _read_responses(redis)
+                    for message_id, data in batch:
+                        if message_id in in_flight:
+                            continue
+                        response_message = _parse_response(data)
+                        if response_message is None:
+                            await _ack_response(redis, message_id)
+                            continue
+                        in_flight.add(message_id)
+                        await executor.submit(
+                            response_message.user_id,
+                            _process_response(
+                                telegram,
+                                rest,
+                                redis,
+                                limiter,
+                                message_id,
+                                response_message,
+                                in_flight,
+                            ),
                         )
+                except Exception as e:
+                    logger.error("Error handling assistant response", error=str(e))
+                    # Back off on errors only (e.g. Redis unavailable)
+                    await asyncio.sleep(1)
+        finally:
+            await executor.cancel()
 
-                except ValidationError as e:
-                    logger.error(
-                        "Failed to validate assistant response from stream",
-                        raw_data=data.decode("utf-8", errors="ignore"),
-                        errors=e.errors(),
-                        exc_info=True,
-                    )
-                    await _ack_response(redis, message_id)
-                    continue
-
-                # Get user data from REST service using validated user_id
-                user_id = response_message.user_id
-                user = await rest.get_user_by_id(user_id)
-                if not user:
-                    logger.error("User not found", user_id=user_id)
-                    await _ack_response(redis, message_id)
-                    continue
-
-                chat_id = user.telegram_id
-                if not chat_id:
-                    logger.error("No telegram_id in user data object", user_id=user_id)
-                    await _ack_response(redis, message_id)
-                    continue
-
-                if response_message.status == "error":
-                    error_message = (
-                        response_message.error or "Произошла неизвестная ошибка"
-                    )
-                    logger.error(
-                        "Error received in assistant response",
-                        error=error_message,
-                        user_id=user_id,
-                        source=response_message.source,
-                    )
-                    await telegram.send_message(
-                        chat_id=chat_id,
-                        text=f"Извините, произошла ошибка: {error_message}",
+
+def _parse_response(data: bytes) -> AssistantResponseMessage | None:
+    """Validate a stream payload; None means it can never be delivered."""
+    try:
+        response_message = AssistantResponseMessage.model_validate_json(data)
+    except ValidationError as e:
+        logger.error(
+            "Failed to validate assistant response from stream",
+            raw_data=data.decode("utf-8", errors="ignore"),
+            errors=e.errors(),
+            exc_info=True,
+        )
+        return None
+    logger.debug(
+        "Successfully validated AssistantResponseMessage",
+        user_id=response_message.user_id,
+    )
+    return response_message
+
+
+async def _process_response(
+    telegram: TelegramClient,
+    rest: TelegramRestClient,
+    redis: aioredis.Redis,
+    limiter: TelegramRateLimiter,
+    message_id,
+    response_message: AssistantResponseMessage,
+    in_flight: set,
+) -> None:
+    """Deliver one response and ACK it; failures leave it pending for reclaim."""
+    try:
+        with start_trace(response_message.correlation_id):
+            wait_seconds = queue_wait_seconds(message_id)
+            if wait_seconds is not None:
+                record_span(
+                    "queue.wait",
+                    wait_seconds,
+                    stream=settings.assistant_output_queue,
+                )
+
+            if response_message.partial:
+                # Best effort: a dropped partial is superseded by the next one
+                try:
+                    await _deliver_partial(telegram, rest, response_message, limiter)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to render partial response",
+                        user_id=response_message.user_id,
+                        error=str(e),
                     )
-                else:
-                    response_text = response_message.response
-                    if response_text:
-                        await telegram.send_message(
-                            chat_id=chat_id,
-                            text=response_text,
-                        )
-                        logger.info(
-                            "Sent successful response to user",
-                            user_id=user_id,
-                            message_preview=response_text[:100],
-                            source=response_message.source,
-                        )
-                    else:
-                        logger.warning(
-                            "Empty successful response from assistant",
-                            user_id=user_id,
-                            source=response_message.source,
-                        )
                 await _ack_response(redis, message_id)
+                return
 
-            except json.JSONDecodeError as e:  # Should be caught by ValidationError now
-                logger.error(
-                    "Invalid JSON in response (should be caught by validation)",
-                    error=str(e),
+            # Log to REST API for observability
+            try:
+                await queue_logger.log_message(
+                    queue_name="to_telegram",
+                    direction=QueueDirection.OUTBOUND,
+                    message_type="response",
+                    payload=response_message.model_dump(),
+                    user_id=int(str(response_message.user_id).split("-")[0])
+                    if response_message.user_id
+                    else None,
+                    source="assistant",
+                )
+            except Exception as log_err:
+                logger.warning(
+                    "Failed to log queue message to REST API",
+                    error=str(log_err),
                 )
-            except KeyError as e:  # Should be caught by ValidationError now
-                logger.error(
-                    "Missing required field in response "
-                    "(should be caught by validation)",
-                    error=str(e),
+
+            await _deliver_response(telegram, rest, response_message, limiter)
+        await _ack_response(redis, message_id)
+    finally:
+        in_flight.discard(message_id)
+
+
+async def _deliver_response(
+    telegram: TelegramClient,
+    rest: TelegramRestClient,
+    response_message: AssistantResponseMessage,
+    limiter: TelegramRateLimiter,
+) -> None:
+    """Send an assistant response (or error) to the user's Telegram chat."""
+    user_id = response_message.user_id
+    chat_id = await _resolve_chat_id(rest, response_message)
+    if not chat_id:
+        return
+
+    if response_message.status == "error":
+        error_message = response_message.error or "Произошла неизвестная ошибка"
+        logger.error(
+            "Error received in assistant response",
+            error=error_message,
+            user_id=user_id,
+            source=response_message.source,
+        )
+        streamed = (
+            streamed_replies.pop(response_message.stream_id)
+            if response_message.stream_id
+            else None
+        )
+        with span("telegram.send", response_status="error"):
+            if streamed is not None:
+                await _mark_interrupted(telegram, limiter, chat_id, streamed)
+            await _send_message(
+                telegram,
+                limiter,
+                chat_id,
+                f"Извините, произошла ошибка: {error_message}",
+            )
+        return
+
+    response_text = response_message.response
+    streamed = (
+        streamed_replies.pop(response_message.stream_id)
+        if response_message.stream_id
+        else None
+    )
+    if response_text:
+        with span("telegram.send", response_status="success"):
+            if streamed is None:
+                await _send_message(telegram, limiter, chat_id, response_text)
+            else:
+                await _commit_streamed_reply(
+                    telegram, limiter, chat_id, streamed, response_text
                 )
-            except Exception as e:
-                logger.error("Error handling assistant response", error=str(e))
+        logger.info(
+            "Sent successful response to user",
+            user_id=user_id,
+            message_preview=response_text[:100],
+            source=response_message.source,
+        )
+    else:
+        logger.warning(
+            "Empty successful response from assistant",
+            user_id=user_id,
+            source=response_message.source,
+        )
+
+
+async def _resolve_chat_id(
+    rest: TelegramRestClient, response_message: AssistantResponseMessage
+) -> int | None:
+    """Chat to deliver to: from the message, the cache, or the REST service."""
+    user_id = response_message.user_id
+    if response_message.chat_id:
+        chat_id_cache.set(user_id, response_message.chat_id)
+        return response_message.chat_id
+
+    chat_id = chat_id_cache.get(user_id)
+    if chat_id:
+        return chat_id
 
-            # Small delay to prevent tight loop
-            await asyncio.sleep(0.1)
+    # Get user data from REST service using validated user_id
+    user = await rest.get_user_by_id(user_id)
+    if not user:
+        logger.error("User not found", user_id=user_id)
+        return None
+
+    chat_id = user.telegram_id
+    if not chat_id:
+        logger.error("No telegram_id in user data object", user_id=user_id)
+        return None
+    chat_id_cache.set(user_id, chat_id)
+    return chat_id
+
+
+async def _deliver_partial(
+    telegram: TelegramClient,
+    rest: TelegramRestClient,
+    response_message: AssistantResponseMessage,
+    limiter: TelegramRateLimiter,
+) -> None:
+    """Show a streamed reply so far: send it once, then edit it (throttled)."""
+    text = (response_message.response or "")[:MAX_MESSAGE_LENGTH]
+    if not text or not response_message.stream_id:
+        return
+    chat_id = await _resolve_chat_id(rest, response_message)
+    if not chat_id:
+        return
+
+    streamed = streamed_replies.get(response_message.stream_id)
+    if streamed is None:
+        sent = await _send_message(telegram, limiter, chat_id, text)
+        streamed_replies.set(
+            response_message.stream_id, StreamedReply(sent["message_id"], text)
+        )
+        return
+
+    # Partials carry the whole text so far, so skipping one loses nothing
+    if (
+        text == streamed.text
+        or time.monotonic() - streamed.edited_at < settings.stream_edit_interval
+    ):
+        return
+    await _edit_message(telegram, limiter, chat_id, streamed.message_id, text)
+    streamed.text = text
+    streamed.edited_at = time.monotonic()
+
+
+async def _commit_streamed_reply(
+    telegram: TelegramClient,
+    limiter: TelegramRateLimiter,
+    chat_id: int,
+    streamed: StreamedReply,
+    text: str,
+) -> None:
+    """Replace the in-progress message with the final text.
+
+    The first MAX_MESSAGE_LENGTH characters go into the in-progress message
+    and the rest follows in new messages. If the edit fails, the final text is
+    sent anew and then the in-progress message is deleted, so the reply is
+    not shown twice.
+    """
+    chunks = [
+        text[i : i + MAX_MESSAGE_LENGTH]
+        for i in range(0, len(text), MAX_MESSAGE_LENGTH)
+    ]
+    to_send = chunks[1:]
+    replaced = False
+    try:
+        if chunks[0] != streamed.text:
+            await _edit_message(
+                telegram, limiter, chat_id, streamed.message_id, chunks[0]
+            )
+    except TelegramRetryAfter:
+        raise
+    except Exception as e:
+        logger.warning(
+            "Failed to edit streamed reply, sending it instead",
+            chat_id=chat_id,
+            error=str(e),
+        )
+        to_send = chunks
+        replaced = True
+    for chunk in to_send:
+        await _send_message(telegram, limiter, chat_id, chunk)
+    if replaced:
+        await _delete_message(telegram, limiter, chat_id, streamed.message_id)
+
+
+async def _mark_interrupted(
+    telegram: TelegramClient,
+    limiter: TelegramRateLimiter,
+    chat_id: int,
+    streamed: StreamedReply,
+) -> None:
+    """Mark a streamed reply that ended with an error as incomplete."""
+    text = streamed.text[: MAX_MESSAGE_LENGTH - len(INTERRUPTED_SUFFIX)]
+    try:
+        await _edit_message(
+            telegram, limiter, chat_id, streamed.message_id, text + INTERRUPTED_SUFFIX
+        )
+    except TelegramRetryAfter:
+        raise
+    except Exception as e:
+        logger.warning(
+            "Failed to mark streamed reply as interrupted",
+            chat_id=chat_id,
+            error=str(e),
+        )
+
+
+async def _delete_message(
+    telegram: TelegramClient,
+    limiter: TelegramRateLimiter,
+    chat_id: int,
+    message_id: int,
+) -> None:
+    """Delete a sent message; failures are logged, not raised."""
+    try:
+        await _with_rate_limit(
+            limiter,
+            chat_id,
+            lambda: telegram.delete_message(chat_id, message_id),
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to delete streamed reply",
+            chat_id=chat_id,
+            message_id=message_id,
+            error=str(e),
+        )
+
+
+async def _send_message(
+    telegram: TelegramClient,
+    limiter: TelegramRateLimiter,
+    chat_id: int,
+    text: str,
+) -> dict[str, Any]:
+    """Send a message within rate limits, honoring 429 retry_after."""
+    return await _with_rate_limit(
+        limiter,
+        chat_id,
+        lambda: telegram.send_message(chat_id=chat_id, text=text),
+    )
+
+
+async def _edit_message(
+    telegram: TelegramClient,
+    limiter: TelegramRateLimiter,
+    chat_id: int,
+    message_id: int,
+    text: str,
+) -> dict[str, Any]:
+    """Edit a sent message within rate limits, honoring 429 retry_after."""
+    return await _with_rate_limit(
+        limiter,
+        chat_id,
+        lambda: telegram.edit_message_text(chat_id, message_id, text),
+    )
+
+
+async def _with_rate_limit(
+    limiter: TelegramRateLimiter,
+    chat_id: int,
+    call: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+        await limiter.acquire(chat_id)
+        try:
+            result = await call()
+        except TelegramRetryAfter as e:
+            telegram_messages_sent_total.labels(status="rate_limited").inc()
+            limiter.pause(e.retry_after)
+            if attempt == MAX_SEND_ATTEMPTS:
+                raise
+            continue
+        except Exception:
+            telegram_messages_sent_total.labels(status="error").inc()
+            raise
+        telegram_messages_sent_total.labels(status="success").inc()
+        return result
 
 
 async def _ensure_output_group(redis: aioredis.Redis) -> None:
@@ -159,25 +469,33 @@ async def _ensure_output_group(redis: aioredis.Redis) -> None:
             raise
 
 
-async def _read_next_response(
-    redis: aioredis.Redis,
-) -> tuple[str | None, bytes | None]:
+def _entries_with_payload(messages) -> list[tuple[str, bytes]]:
+    batch = []
+    for message_id, fields in messages:
+        payload = fields.get("payload") or fields.get(b"payload")
+        if payload:
+            batch.append(
+                (
+                    message_id,
+                    payload if isinstance(payload, bytes) else str(payload).encode(),
+                )
+            )
+    return batch
+
+
+async def _read_responses(redis: aioredis.Redis) -> list[tuple[str, bytes]]:
     entries = await redis.xreadgroup(
         groupname=settings.output_stream_group,
         consumername=settings.stream_consumer,
         streams={settings.assistant_output_queue: ">"},
-        count=1,
+        count=settings.response_batch_size,
         block=1000,
     )
     if entries:
         _, messages = entries[0]
-        if messages:
-            message_id, fields = messages[0]
-            payload = fields.get("payload") or fields.get(b"payload")
-            if payload:
-                return message_id, payload if isinstance(payload, bytes) else str(
-                    payload
-                ).encode()
+        batch = _entries_with_payload(messages)
+        if batch:
+            return batch
 
     # Reclaim stale pending
     _start, claimed, _ = await redis.xautoclaim(
@@ -186,16 +504,9 @@ async def _read_next_response(
         consumername=settings.stream_consumer,
         min_idle_time=60_000,
         start_id="0-0",
-        count=1,
+        count=settings.response_batch_size,
     )
-    if claimed:
-        message_id, fields = claimed[0]
-        payload = fields.get("payload")
-        if payload:
-            return message_id, payload if isinstance(payload, bytes) else str(
-                payload
-            ).encode()
-    return None, None
+    return _entries_with_payload(claimed)
 
 
 async def _ack_response(redis: aioredis.Redis, message_id: str) -> None:
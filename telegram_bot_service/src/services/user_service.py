@@ -2,14 +2,26 @@ import re  # For Markdown escaping
 from uuid import UUID
 
 from shared_models import ServiceClientError, get_logger
-from shared_models.api_schemas import AssistantRead, TelegramUserRead
+from shared_models.api_schemas import (
+    AssistantRead,
+    TelegramUserContext,
+    TelegramUserRead,
+)
 
 from clients.rest import TelegramRestClient
 from clients.telegram import TelegramClient
+from config.settings import settings
 from keyboards.secretary_selection import create_secretary_selection_keyboard
+from utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Short-lived: a stale entry only delays seeing a secretary change made
+# outside the bot; selections made in the bot invalidate it immediately
+user_context_cache = TTLCache(
+    maxsize=settings.user_context_cache_size, ttl=settings.user_context_cache_ttl
+)
+
 # Alias for backward compatibility
 RestClientError = ServiceClientError
 
@@ -49,6 +61,31 @@ async def get_user_by_telegram_id(
     return await rest._get_user(telegram_id)
 
 
+async def get_user_context(
+    rest: TelegramRestClient, telegram_id: int
+) -> TelegramUserContext | None:
+    """Get a user and their active secretary, cached briefly per telegram_id.
+
+    Returns None if the user does not exist (not cached, so /start takes
+    effect at once).
+    Raises:
+        RestClientError: For non-404 errors.
+    """
+    user_context = user_context_cache.get(telegram_id)
+    if user_context is not None:
+        return user_context
+    logger.debug("Calling rest.get_user_context", telegram_id=telegram_id)
+    user_context = await rest.get_user_context(telegram_id)
+    if user_context is not None:
+        user_context_cache.set(telegram_id, user_context)
+    return user_context
+
+
+def invalidate_user_context(telegram_id: int) -> None:
+    """Drop the cached context after the user's secretary changes."""
+    user_context_cache.pop(telegram_id)
+
+
 async def get_assigned_secretary(
     rest: TelegramRestClient, user_id: UUID
 ) -> AssistantRead | None:
@@ -0,0 +1,93 @@
+"""Bounded concurrent execution with strict ordering per key."""
+
+import asyncio
+from collections.abc import Coroutine, Hashable
+from typing import Any
+
+from shared_models import get_logger
+
+logger = get_logger(__name__)
+
+
+class KeyedExecutor:
+    """Run coroutines concurrently across keys but one at a time per key.
+
+    Work submitted for the same key (e.g. a chat) runs in submission order;
+    different keys proceed in parallel. At most ``max_concurrency`` items run
+    at once; an item takes its run slot only after its key's predecessor is
+    done, so a busy key never holds slots other keys could use. At most
+    ``max_pending`` items (running or queued behind their key, by default
+    four times ``max_concurrency``) are outstanding, so ``submit`` applies
+    backpressure to the caller.
+    """
+
+    def __init__(self, max_concurrency: int, max_pending: int | None = None):
+        self._running = asyncio.Semaphore(max_concurrency)
+        self._pending = asyncio.Semaphore(max_pending or 4 * max_concurrency)
+        self._tails: dict[Hashable, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def submit(self, key: Hashable, coro: Coroutine[Any, Any, Any]) -> None:
+        """Schedule ``coro`` after earlier work for ``key``; waits for room."""
+        try:
+            await self._pending.acquire()
+        except BaseException:
+            coro.close()
+            raise
+        self._schedule(key, coro)
+
+    async def try_submit(self, key: Hashable, coro: Coroutine[Any, Any, Any]) -> bool:
+        """Schedule ``coro`` like ``submit`` if there is room, without waiting.
+
+        Returns False (and closes ``coro``) when ``max_pending`` items are
+        already outstanding.
+        """
+        if self._pending.locked():
+            coro.close()
+            return False
+        # Returns at once: the semaphore is not locked
+        await self._pending.acquire()
+        self._schedule(key, coro)
+        return True
+
+    def _schedule(self, key: Hashable, coro: Coroutine[Any, Any, Any]) -> None:
+        previous = self._tails.get(key)
+        task = asyncio.create_task(self._run(key, previous, coro))
+        self._tails[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        key: Hashable,
+        previous: asyncio.Task | None,
+        coro: Coroutine[Any, Any, Any],
+    ) -> None:
+        try:
+            if previous is not None:
+                # Only ordering matters; the predecessor's outcome does not
+                await asyncio.wait([previous])
+            async with self._running:
+                await coro
+        except Exception as e:
+            logger.error("Keyed task failed", key=str(key), error=str(e), exc_info=True)
+        finally:
+            coro.close()  # No-op once awaited; avoids warnings when cancelled
+            self._pending.release()
+            if self._tails.get(key) is asyncio.current_task():
+                del self._tails[key]
+
+    async def join(self) -> None:
+        """Wait for all submitted work to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def cancel(self) -> None:
+        """Cancel outstanding work and wait for it to unwind."""
+        for task in self._tasks:
+            task.cancel()
+        await self.join()
@@ -46,20 +46,15 @@ class TestHandleTextMessageTypingAction:
     """Tests for typing action in handle_text_message."""
 
     @pytest.mark.asyncio
-    async def test_sends_typing_action_before_queue(
+    async def test_sends_typing_action_with_queue(
         self, mock_telegram_client, mock_rest_client, mock_user, mock_secretary
     ):
-        """Test that typing action is sent before sending message to queue."""
+        """Test that typing action is sent along with queueing the message."""
         with (
             patch(
-                "handlers.message_text.user_service.get_user_by_telegram_id",
+                "handlers.message_text.user_service.get_user_context",
                 new_callable=AsyncMock,
-                return_value=mock_user,
-            ),
-            patch(
-                "handlers.message_text.user_service.get_assigned_secretary",
-                new_callable=AsyncMock,
-                return_value=mock_secretary,
+                return_value=MagicMock(user=mock_user, secretary=mock_secretary),
             ),
             patch(
                 "handlers.message_text.message_queue.send_message_to_assistant",
@@ -90,7 +85,7 @@ class TestHandleTextMessageTypingAction:
     async def test_typing_action_called_before_queue_message(
         self, mock_telegram_client, mock_rest_client, mock_user, mock_secretary
     ):
-        """Test that typing action is called before queue message (order check)."""
+        """Test typing action is started first, without waiting on it to enqueue."""
         call_order = []
 
         async def track_typing(*args, **kwargs):
@@ -104,14 +99,9 @@ class TestHandleTextMessageTypingAction:
 
         with (
             patch(
-                "handlers.message_text.user_service.get_user_by_telegram_id",
+                "handlers.message_text.user_service.get_user_context",
                 new_callable=AsyncMock,
-                return_value=mock_user,
-            ),
-            patch(
-                "handlers.message_text.user_service.get_assigned_secretary",
-                new_callable=AsyncMock,
-                return_value=mock_secretary,
+                return_value=MagicMock(user=mock_user, secretary=mock_secretary),
             ),
             patch(
                 "handlers.message_text.message_queue.send_message_to_assistant",
@@ -139,7 +129,7 @@ class TestHandleTextMessageTypingAction:
     ):
         """Test that typing action is NOT sent when user doesn't exist."""
         with patch(
-            "handlers.message_text.user_service.get_user_by_telegram_id",
+            "handlers.message_text.user_service.get_user_context",
             new_callable=AsyncMock,
             return_value=None,
         ):
@@ -168,14 +158,9 @@ class TestHandleTextMessageTypingAction:
         """Test that typing action is NOT sent when no secretary is assigned."""
         with (
             patch(
-                "handlers.message_text.user_service.get_user_by_telegram_id",
-                new_callable=AsyncMock,
-                return_value=mock_user,
-            ),
-            patch(
-                "handlers.message_text.user_service.get_assigned_secretary",
+                "handlers.message_text.user_service.get_user_context",
                 new_callable=AsyncMock,
-                return_value=None,
+                return_value=MagicMock(user=mock_user, secretary=None),
             ),
             patch(
                 "handlers.message_text.user_service.prompt_secretary_selection",
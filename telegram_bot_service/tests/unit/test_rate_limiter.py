@@ -0,0 +1,94 @@
+# telegram_bot_service/tests/unit/test_rate_limiter.py
+"""Unit tests for Telegram rate limiting."""
+
+from unittest.mock import patch
+
+import pytest
+
+from services.rate_limiter import TelegramRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with (
+        patch("services.rate_limiter.time.monotonic", fake.monotonic),
+        patch("services.rate_limiter.asyncio.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_wait(self, clock):
+        """Test the bucket allows a burst up to capacity, then spaces calls."""
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock):
+        """Test tokens come back at the configured rate."""
+        bucket = TokenBucket(rate=1)
+        bucket.reserve()
+        assert not bucket.is_full
+
+        clock.now += 1
+
+        assert bucket.is_full
+        assert bucket.reserve() == 0
+
+
+class TestTelegramRateLimiter:
+    """Tests for TelegramRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_per_chat_limit_does_not_block_other_chats(self, clock):
+        """Test a second message to one chat waits while other chats do not."""
+        limiter = TelegramRateLimiter(global_rate=30, per_chat_rate=1)
+
+        await limiter.acquire(1)
+        await limiter.acquire(2)
+        assert clock.sleeps == []
+
+        await limiter.acquire(1)
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    @pytest.mark.asyncio
+    async def test_pause_delays_all_chats(self, clock):
+        """Test retry_after from a 429 holds back every chat."""
+        limiter = TelegramRateLimiter(global_rate=30, per_chat_rate=1)
+
+        limiter.pause(5)
+        await limiter.acquire(42)
+
+        assert clock.sleeps == [pytest.approx(5.0)]
+
+    def test_idle_chat_buckets_are_pruned(self, clock):
+        """Test per-chat state stays bounded."""
+        limiter = TelegramRateLimiter(
+            global_rate=30, per_chat_rate=1, max_tracked_chats=2
+        )
+        limiter._chat_bucket(1).reserve()
+        limiter._chat_bucket(2).reserve()
+        clock.now += 10
+
+        limiter._chat_bucket(3)
+
+        assert set(limiter._chats) == {3}
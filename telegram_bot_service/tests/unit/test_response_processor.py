@@ -0,0 +1,325 @@
+# telegram_bot_service/tests/unit/test_response_processor.py
+"""Unit tests for assistant response delivery."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from shared_models.queue import AssistantResponseMessage
+
+from clients.telegram import TelegramRetryAfter
+from services import response_processor
+from utils.keyed_executor import KeyedExecutor
+from utils.ttl_cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_chat_id_cache(monkeypatch):
+    monkeypatch.setattr(
+        response_processor, "chat_id_cache", TTLCache(maxsize=10, ttl=60)
+    )
+
+
+class TestResolveChatId:
+    """Tests for routing responses without a REST lookup."""
+
+    @pytest.mark.asyncio
+    async def test_chat_id_from_message_skips_rest(self):
+        """Test responses carrying chat_id are routed directly."""
+        rest = MagicMock()
+        rest.get_user_by_id = AsyncMock()
+        message = AssistantResponseMessage(
+            user_id=5, status="success", response="hi", chat_id=555
+        )
+
+        assert await response_processor._resolve_chat_id(rest, message) == 555
+        rest.get_user_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_trigger_response_looks_up_once_then_uses_cache(self):
+        """Test responses without chat_id hit REST only on a cache miss."""
+        rest = MagicMock()
+        rest.get_user_by_id = AsyncMock(return_value=MagicMock(telegram_id=777))
+        message = AssistantResponseMessage(
+            user_id=5, status="success", response="reminder"
+        )
+
+        assert await response_processor._resolve_chat_id(rest, message) == 777
+        assert await response_processor._resolve_chat_id(rest, message) == 777
+        rest.get_user_by_id.assert_awaited_once_with(5)
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_returns_none(self):
+        """Test a missing user is not delivered."""
+        rest = MagicMock()
+        rest.get_user_by_id = AsyncMock(return_value=None)
+        message = AssistantResponseMessage(user_id=5, status="success")
+
+        assert await response_processor._resolve_chat_id(rest, message) is None
+
+
+class TestSendMessage:
+    """Tests for rate-limited sending."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self):
+        """Test a 429 pauses the limiter and the message is re-sent."""
+        telegram = MagicMock()
+        telegram.send_message = AsyncMock(
+            side_effect=[TelegramRetryAfter("sendMessage", 3), {}]
+        )
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+
+        await response_processor._send_message(telegram, limiter, 7, "hi")
+
+        limiter.pause.assert_called_once_with(3)
+        assert telegram.send_message.await_count == 2
+        assert limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Test repeated 429s eventually surface so the entry stays pending."""
+        telegram = MagicMock()
+        telegram.send_message = AsyncMock(
+            side_effect=TelegramRetryAfter("sendMessage", 1)
+        )
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+
+        with pytest.raises(TelegramRetryAfter):
+            await response_processor._send_message(telegram, limiter, 7, "hi")
+
+        assert telegram.send_message.await_count == response_processor.MAX_SEND_ATTEMPTS
+
+
+class TestKeyedExecutor:
+    """Tests for per-key ordered execution."""
+
+    @pytest.mark.asyncio
+    async def test_same_key_runs_in_order_other_keys_in_parallel(self):
+        """Test ordering within a key and concurrency across keys."""
+        executor = KeyedExecutor(max_concurrency=10)
+        events: list[str] = []
+        release = asyncio.Event()
+
+        async def job(name, wait=False):
+            events.append(f"start {name}")
+            if wait:
+                await release.wait()
+            events.append(f"end {name}")
+
+        await executor.submit("a", job("a1", wait=True))
+        await executor.submit("a", job("a2"))
+        await executor.submit("b", job("b1"))
+        await asyncio.sleep(0.01)
+
+        # b1 finished while a1 blocks; a2 has not started
+        assert events == ["start a1", "start b1", "end b1"]
+
+        release.set()
+        await executor.join()
+
+        assert events[3:] == ["end a1", "start a2", "end a2"]
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_block_next_item(self):
+        """Test a failing item is logged and the key keeps going."""
+        executor = KeyedExecutor(max_concurrency=2)
+        done = []
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def ok():
+            done.append(True)
+
+        await executor.submit(1, fail())
+        await executor.submit(1, ok())
+        await executor.join()
+
+        assert done == [True]
+        assert executor.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_blocks_at_capacity(self):
+        """Test backpressure once max_pending items are outstanding."""
+        executor = KeyedExecutor(max_concurrency=1, max_pending=1)
+        release = asyncio.Event()
+
+        await executor.submit(1, release.wait())
+        second = asyncio.create_task(executor.submit(2, asyncio.sleep(0)))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+
+        release.set()
+        await second
+        await executor.join()
+
+    @pytest.mark.asyncio
+    async def test_queued_item_does_not_hold_a_run_slot(self):
+        """Test a key waiting on its predecessor leaves the slot to others."""
+        executor = KeyedExecutor(max_concurrency=2)
+        release = asyncio.Event()
+        done = []
+
+        async def ok(name):
+            done.append(name)
+
+        await executor.submit("a", release.wait())
+        await executor.submit("a", ok("a2"))
+        await executor.submit("b", ok("b1"))
+        await asyncio.sleep(0.01)
+
+        # a2 waits behind a1 without taking the second slot
+        assert done == ["b1"]
+
+        release.set()
+        await executor.join()
+        assert done == ["b1", "a2"]
+
+
+class TestStreamedReplies:
+    """Tests for rendering partial responses with message edits."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_stream_state(self, monkeypatch):
+        monkeypatch.setattr(
+            response_processor, "streamed_replies", TTLCache(maxsize=10, ttl=60)
+        )
+        monkeypatch.setattr(response_processor.settings, "stream_edit_interval", 0)
+
+    @pytest.fixture
+    def telegram(self):
+        telegram = MagicMock()
+        telegram.send_message = AsyncMock(return_value={"message_id": 99})
+        telegram.edit_message_text = AsyncMock(return_value={})
+        return telegram
+
+    @pytest.fixture
+    def limiter(self):
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock()
+        return limiter
+
+    def _event(self, text, partial=True):
+        return AssistantResponseMessage(
+            user_id=5,
+            status="success",
+            response=text,
+            chat_id=555,
+            partial=partial,
+            stream_id="s1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_partials_send_once_then_edit_and_final_commits(
+        self, telegram, limiter
+    ):
+        """Test the first partial sends, later ones and the final edit it."""
+        rest = MagicMock()
+
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("Hel"), limiter
+        )
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("Hello"), limiter
+        )
+        await response_processor._deliver_response(
+            telegram, rest, self._event("Hello there", partial=False), limiter
+        )
+
+        telegram.send_message.assert_awaited_once_with(chat_id=555, text="Hel")
+        assert [c.args for c in telegram.edit_message_text.await_args_list] == [
+            (555, 99, "Hello"),
+            (555, 99, "Hello there"),
+        ]
+        assert response_processor.streamed_replies.get("s1") is None
+
+    @pytest.mark.asyncio
+    async def test_edits_are_throttled(self, telegram, limiter, monkeypatch):
+        """Test partials arriving faster than the edit interval are skipped."""
+        monkeypatch.setattr(response_processor.settings, "stream_edit_interval", 60)
+        rest = MagicMock()
+
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("a"), limiter
+        )
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("ab"), limiter
+        )
+
+        telegram.edit_message_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_final_without_partials_is_sent_normally(self, telegram, limiter):
+        """Test a streamed turn that produced no partials still delivers."""
+        await response_processor._deliver_response(
+            telegram, MagicMock(), self._event("Done", partial=False), limiter
+        )
+
+        telegram.send_message.assert_awaited_once_with(chat_id=555, text="Done")
+        telegram.edit_message_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_final_edits_partial_and_sends_the_rest(self, telegram, limiter):
+        """Test a final over the limit continues in new messages."""
+        rest = MagicMock()
+        limit = response_processor.MAX_MESSAGE_LENGTH
+        final = "a" * limit + "b" * 10
+
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("a"), limiter
+        )
+        await response_processor._deliver_response(
+            telegram, rest, self._event(final, partial=False), limiter
+        )
+
+        telegram.edit_message_text.assert_awaited_once_with(555, 99, "a" * limit)
+        assert telegram.send_message.await_args_list[-1].kwargs == {
+            "chat_id": 555,
+            "text": "b" * 10,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_edit_replaces_the_partial(self, telegram, limiter):
+        """Test the partial is deleted once the final is sent instead."""
+        telegram.edit_message_text.side_effect = RuntimeError("message not found")
+        telegram.delete_message = AsyncMock(return_value={})
+        rest = MagicMock()
+
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("Hel"), limiter
+        )
+        await response_processor._deliver_response(
+            telegram, rest, self._event("Hello", partial=False), limiter
+        )
+
+        assert telegram.send_message.await_args_list[-1].kwargs == {
+            "chat_id": 555,
+            "text": "Hello",
+        }
+        telegram.delete_message.assert_awaited_once_with(555, 99)
+
+    @pytest.mark.asyncio
+    async def test_error_final_marks_partial_interrupted(self, telegram, limiter):
+        """Test the partial of a failed turn is annotated, not left as is."""
+        rest = MagicMock()
+
+        await response_processor._deliver_partial(
+            telegram, rest, self._event("Hel"), limiter
+        )
+        await response_processor._deliver_response(
+            telegram,
+            rest,
+            AssistantResponseMessage(
+                user_id=5, status="error", error="boom", chat_id=555, stream_id="s1"
+            ),
+            limiter,
+        )
+
+        telegram.edit_message_text.assert_awaited_once_with(
+            555, 99, "Hel" + response_processor.INTERRUPTED_SUFFIX
+        )
+        assert "boom" in telegram.send_message.await_args_list[-1].kwargs["text"]
+        assert response_processor.streamed_replies.get("s1") is None
@@ -143,3 +143,29 @@ class TestTelegramClientMakeRequest:
 
         with pytest.raises(ValueError, match="Telegram API error: Bad Request"):
             await telegram_client._make_request("sendMessage", json={})
+
+    @pytest.mark.asyncio
+    async def test_make_request_rate_limited(self, telegram_client):
+        """Test a 429 raises TelegramRetryAfter carrying retry_after."""
+        from clients.telegram import TelegramRetryAfter
+
+        mock_response = AsyncMock()
+        mock_response.status = 429
+        mock_response.json = AsyncMock(
+            return_value={
+                "ok": False,
+                "error_code": 429,
+                "parameters": {"retry_after": 7},
+            }
+        )
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=mock_response)
+        telegram_client.session = mock_session
+
+        with pytest.raises(TelegramRetryAfter) as exc_info:
+            await telegram_client._make_request("sendMessage", json={})
+
+        assert exc_info.value.retry_after == 7
@@ -0,0 +1,41 @@
+# telegram_bot_service/tests/unit/test_ttl_cache.py
+"""Unit tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from utils.ttl_cache import TTLCache
+
+
+def test_entries_expire_after_ttl():
+    """Test values are dropped once their TTL has passed."""
+    with patch("utils.ttl_cache.time.monotonic", return_value=100.0) as clock:
+        cache = TTLCache(maxsize=10, ttl=5)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        clock.return_value = 105.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test the size bound evicts the least recently used key."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_removes_entry():
+    """Test explicit invalidation."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
@@ -288,3 +288,43 @@ class TestPromptSecretarySelection:
 
         assert result is False
         mock_telegram_client.send_message.assert_called_once()
+
+
+class TestGetUserContext:
+    """Tests for the cached user + secretary lookup."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        from services import user_service
+        from utils.ttl_cache import TTLCache
+
+        monkeypatch.setattr(
+            user_service, "user_context_cache", TTLCache(maxsize=10, ttl=60)
+        )
+
+    @pytest.mark.asyncio
+    async def test_context_is_cached_until_invalidated(self, mock_rest_client):
+        """Test repeated messages reuse the context until a secretary change."""
+        from services.user_service import get_user_context, invalidate_user_context
+
+        user_context = MagicMock()
+        mock_rest_client.get_user_context = AsyncMock(return_value=user_context)
+
+        assert await get_user_context(mock_rest_client, 12345) is user_context
+        assert await get_user_context(mock_rest_client, 12345) is user_context
+        mock_rest_client.get_user_context.assert_awaited_once_with(12345)
+
+        invalidate_user_context(12345)
+        await get_user_context(mock_rest_client, 12345)
+        assert mock_rest_client.get_user_context.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self, mock_rest_client):
+        """Test a user who has not run /start yet is looked up again."""
+        from services.user_service import get_user_context
+
+        mock_rest_client.get_user_context = AsyncMock(return_value=None)
+
+        assert await get_user_context(mock_rest_client, 12345) is None
+        await get_user_context(mock_rest_client, 12345)
+        assert mock_rest_client.get_user_context.await_count == 2
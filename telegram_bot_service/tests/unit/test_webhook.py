@@ -0,0 +1,133 @@
+# telegram_bot_service/tests/unit/test_webhook.py
+"""Unit tests for webhook ingestion and the update dispatcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from bot.dispatcher import UpdateDispatcher, update_chat_key
+from bot.webhook import SECRET_TOKEN_HEADER, create_webhook_app
+from utils.keyed_executor import KeyedExecutor
+
+
+def _message_update(update_id: int, chat_id: int, text: str = "hi") -> dict:
+    return {
+        "update_id": update_id,
+        "message": {"chat": {"id": chat_id}, "from": {"id": chat_id}, "text": text},
+    }
+
+
+class TestUpdateChatKey:
+    """Tests for update ordering keys."""
+
+    def test_message_and_callback_use_chat_id(self):
+        """Test messages and button presses of one chat share a key."""
+        callback = {
+            "update_id": 2,
+            "callback_query": {
+                "id": "q",
+                "from": {"id": 9},
+                "message": {"chat": {"id": 42}},
+            },
+        }
+
+        assert update_chat_key(_message_update(1, 42)) == 42
+        assert update_chat_key(callback) == 42
+
+    def test_unknown_update_is_keyed_by_update_id(self):
+        """Test updates without a chat do not serialize with each other."""
+        assert update_chat_key({"update_id": 5}) == ("update", 5)
+
+
+class TestUpdateDispatcher:
+    """Tests for UpdateDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_updates_of_one_chat_are_handled_in_order(self):
+        """Test per-chat ordering even when earlier updates are slower."""
+        handled: list[int] = []
+
+        async def handler(update, telegram, rest):
+            # Earlier updates take longer; ordering must still hold
+            await asyncio.sleep(0.01 * (3 - update["update_id"]))
+            handled.append(update["update_id"])
+
+        dispatcher = UpdateDispatcher(
+            MagicMock(), MagicMock(), max_concurrency=10, handler=handler
+        )
+        for update_id in (1, 2, 3):
+            await dispatcher.submit(_message_update(update_id, chat_id=7))
+        await dispatcher._executor.join()
+
+        assert handled == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_try_submit_refuses_when_full(self):
+        """Test try_submit returns at once instead of waiting for room."""
+        release = asyncio.Event()
+
+        async def handler(update, telegram, rest):
+            await release.wait()
+
+        dispatcher = UpdateDispatcher(
+            MagicMock(), MagicMock(), max_concurrency=1, handler=handler
+        )
+        dispatcher._executor = KeyedExecutor(max_concurrency=1, max_pending=1)
+
+        assert await dispatcher.try_submit(_message_update(1, chat_id=7))
+        assert not await dispatcher.try_submit(_message_update(2, chat_id=8))
+
+        release.set()
+        await dispatcher._executor.join()
+
+
+class TestWebhookApp:
+    """Tests for the webhook endpoint."""
+
+    @pytest.fixture
+    async def client(self):
+        dispatcher = MagicMock()
+        dispatcher.try_submit = AsyncMock(return_value=True)
+        app = create_webhook_app(dispatcher, "s3cret", "/telegram/webhook")
+        async with TestClient(TestServer(app)) as client:
+            client.dispatcher = dispatcher
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_valid_secret_dispatches_update(self, client):
+        """Test an authenticated update is handed to the dispatcher."""
+        update = _message_update(1, 42)
+
+        response = await client.post(
+            "/telegram/webhook", json=update, headers={SECRET_TOKEN_HEADER: "s3cret"}
+        )
+
+        assert response.status == 200
+        client.dispatcher.try_submit.assert_awaited_once_with(update)
+
+    @pytest.mark.asyncio
+    async def test_full_dispatcher_rejects_for_redelivery(self, client):
+        """Test a full dispatcher answers non-2xx so Telegram redelivers."""
+        client.dispatcher.try_submit.return_value = False
+
+        response = await client.post(
+            "/telegram/webhook",
+            json=_message_update(1, 42),
+            headers={SECRET_TOKEN_HEADER: "s3cret"},
+        )
+
+        assert response.status == 503
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret_is_rejected(self, client):
+        """Test requests without the configured secret token are refused."""
+        response = await client.post(
+            "/telegram/webhook",
+            json=_message_update(1, 42),
+            headers={SECRET_TOKEN_HEADER: "nope"},
+        )
+
+        assert response.status == 401
+        client.dispatcher.try_submit.assert_not_called()